@@ -0,0 +1,120 @@
+"""Re-parse archived search result pages and merge the output into the data stores.
+
+    python backfill.py --archive ./data/archive --workers 8
+"""
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from config import ARCHIVE_FOLDER
+from html_parser import LinkedInHTMLParser
+from models import EntityType
+from page_archive import PageArchive
+from search_index import index_entities
+from storage import get_entity_store
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = [entity_type.value for entity_type in EntityType]
+
+_worker_archive: PageArchive | None = None
+_worker_parser: LinkedInHTMLParser | None = None
+
+
+def _init_worker(archive_folder: str) -> None:
+    """Create per-process archive and parser instances"""
+    global _worker_archive, _worker_parser
+    _worker_archive = PageArchive(archive_folder)
+    _worker_parser = LinkedInHTMLParser()
+
+
+def _parse_entry(entry: dict[str, Any]) -> list[dict[str, Any]]:
+    """Parse one archived page into plain record dicts"""
+    parse_methods = {
+        EntityType.PEOPLE.value: _worker_parser.parse_profiles,
+        EntityType.COMPANIES.value: _worker_parser.parse_companies,
+        EntityType.JOBS.value: _worker_parser.parse_jobs,
+    }
+    try:
+        html = _worker_archive.load(entry['hash'])
+        items = parse_methods[entry['entity_type']](html, entry['keywords'], entry.get('location'))
+    except Exception as e:
+        logger.warning(f"Error parsing archived page {entry['hash'][:12]}: {e}")
+        return []
+
+    records = []
+    for item in items:
+        # Keep searched_at tied to the capture time so repeated backfills produce the same output
+        item.searched_at = entry['archived_at']
+        records.append(item.dict(exclude_unset=True))
+    return records
+
+
+def merge_into_store(filepath: str, records: list[dict[str, Any]], entity_type: str) -> tuple[int, int]:
+    """Upsert records into the configured entity store by key, keeping fields the parser does not produce"""
+    model = EntityType(entity_type).model
+    entities = [model(**record) for record in records]
+    added = get_entity_store(filepath).upsert(entities, partial=True)
+    index_entities(entities)
+    return added, len(entities) - added
+
+
+def run_backfill(archive_folder: str = ARCHIVE_FOLDER, workers: int | None = None,
+                 entity_types: list[str] | None = None, chunksize: int = 16) -> dict[str, int]:
+    """Re-parse every archived page across a process pool and merge results per entity type"""
+    archive = PageArchive(archive_folder)
+    entries = [
+        entry for entry in archive.entries()
+        if entry.get('entity_type') in ENTITY_TYPES and (not entity_types or entry['entity_type'] in entity_types)
+    ]
+    if not entries:
+        logger.warning(f"No archived pages found in {archive_folder}")
+        return {}
+
+    logger.info(f"Re-parsing {len(entries)} archived pages with {workers or os.cpu_count()} workers")
+
+    # First occurrence of a key wins; pages are consumed in manifest order so reruns are identical
+    collected: dict[str, dict[str, dict[str, Any]]] = {entity_type: {} for entity_type in ENTITY_TYPES}
+    started = time.perf_counter()
+    progress_step = max(len(entries) // 20, 1)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(archive_folder,)) as pool:
+        for done, (entry, records) in enumerate(zip(entries, pool.map(_parse_entry, entries, chunksize=chunksize)), 1):
+            key_field = EntityType(entry['entity_type']).key_field
+            bucket = collected[entry['entity_type']]
+            for record in records:
+                bucket.setdefault(record[key_field], record)
+
+            if done % progress_step == 0 or done == len(entries):
+                elapsed = time.perf_counter() - started
+                logger.info(f"Parsed {done}/{len(entries)} pages ({done / elapsed:.1f} pages/s)")
+
+    summary = {}
+    for entity_type, bucket in collected.items():
+        if not bucket:
+            continue
+        data_file = EntityType(entity_type).data_file
+        added, updated = merge_into_store(data_file.full_path, list(bucket.values()), entity_type)
+        logger.info(f"{data_file.full_path}: {added} added, {updated} updated")
+        summary[entity_type] = len(bucket)
+    return summary
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Re-parse archived LinkedIn result pages into the data stores")
+    arg_parser.add_argument('--archive', default=ARCHIVE_FOLDER, help="Page archive folder")
+    arg_parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    arg_parser.add_argument('--entity-type', action='append', choices=ENTITY_TYPES,
+                            help="Only re-parse these entity types")
+    arg_parser.add_argument('--chunksize', type=int, default=16, help="Pages sent to a worker at a time")
+    args = arg_parser.parse_args()
+
+    run_backfill(args.archive, args.workers, args.entity_type, args.chunksize)
+
+
+if __name__ == '__main__':
+    main()
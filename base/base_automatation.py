@@ -1,14 +1,14 @@
 from abc import ABC, abstractmethod
-import json
 import logging
-import os
 from typing import Any
 from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from pydantic import BaseModel
-import aiofiles
+
+from config import LOOP_LAG_MONITOR
+from data_writer import DataWriter, WriteError
+from driver_facade import AsyncDriver
+from loop_monitor import LoopLagMonitor
+from selector_engine import selector_engine
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,10 @@ class BaseAutomation(ABC):
 
     def __init__(self):
         self.driver: WebDriver | None = None
+        self.browser = AsyncDriver()
         self.logged_in: bool = False
+        self.writer = DataWriter()
+        self.lag_monitor = LoopLagMonitor() if LOOP_LAG_MONITOR else None
 
     @abstractmethod
     async def setup_driver(self) -> None:
@@ -51,67 +54,35 @@ class BaseAutomation(ABC):
         pass
 
     async def save_entities(self, entities: list[BaseModel], filepath: str) -> bool:
-        """Generic method to save any pydantic model entities to JSON file"""
+        """Generic method to save any pydantic model entities. With WRITE_BEHIND the entities are only
+        queued here (True means queued); await flush_data() to learn whether they were written"""
         try:
-            existing_data: list[dict[str, Any]] = []
-
-            if os.path.exists(filepath):
-                async with aiofiles.open(filepath, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    existing_data = json.loads(content)
-
-            new_data = [entity.dict(exclude_none=True) for entity in entities]
-
-            if isinstance(existing_data, list) and new_data:
-                key_field = entities[0].get_key_field()
-                existing_keys = {item.get(key_field) for item in existing_data if item.get(key_field)}
-
-                unique_new_data = [
-                    item for item in new_data
-                    if item.get(key_field) not in existing_keys
-                ]
-
-                all_data = existing_data + unique_new_data
-                logger.info(f"Added {len(unique_new_data)} new items to {filepath}")
-            else:
-                all_data = new_data
-
-            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(all_data, indent=2, ensure_ascii=False))
-
-            logger.info(f"Saved {len(new_data)} items to {filepath}")
+            await self.writer.save(entities, filepath)
             return True
 
         except Exception as e:
             logger.error(f"Error saving data to {filepath}: {e}")
             return False
 
-    def wait_for_element(self, selector: str, timeout: int = 10) -> Any | None:
-        """Wait for element to be present"""
+    async def flush_data(self) -> bool:
+        """Wait for queued saves and updates; False if some files could not be written after retries"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            return element
-        except Exception as e:
-            logger.debug(f"Element not found: {selector}")
-            return None
+            await self.writer.flush()
+            return True
+
+        except WriteError as e:
+            logger.error(f"Error flushing data: {e}")
+            return False
+
+    async def wait_for_element(self, selector: str, timeout: int = 10) -> Any | None:
+        """Wait for element to be present"""
+        return await self.browser.wait_for_element(selector, timeout)
 
     def find_element_by_selectors(self, parent, selectors: str | list[str]) -> Any | None:
         """Try multiple selectors to find an element"""
-        if isinstance(selectors, str):
-            selectors = [selectors]
-
-        for selector in selectors:
-            try:
-                element = parent.find_element(By.CSS_SELECTOR, selector)
-                if element and (not hasattr(element, 'text') or element.text.strip()):
-                    return element
-            except:
-                continue
-        return None
+        return selector_engine.find(parent, selectors, require_text=True)
 
     async def extract_text(self, parent, selectors: str | list[str], default: str = "") -> str:
         """Extract text from element using multiple selectors"""
-        element = self.find_element_by_selectors(parent, selectors)
-        return element.text.strip() if element else default
+        element = await self.browser.run(self.find_element_by_selectors, parent, selectors)
+        return (await self.browser.text(element)).strip() if element else default
@@ -0,0 +1,48 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class BaseCodec(ABC):
+    """Abstract base class for serialization formats used by the persistence paths"""
+    name: str = ''
+    extension: str = ''
+    # Whether encoded values are single-line JSON text (usable in JSONL files and SQLite json columns)
+    json_lines: bool = False
+
+    def __init__(self, pretty: bool = False):
+        self.pretty = pretty
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Encode plain data (dicts, lists, scalars) to bytes"""
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes produced by encode"""
+        pass
+
+    def encode_model(self, entity: BaseModel) -> bytes:
+        """Encode a model's non-None fields; codecs with a direct model path override this"""
+        return self.encode(entity.dict(exclude_none=True))
+
+    def path_for(self, filepath: str) -> str:
+        """Path of a data file with this codec's extension"""
+        return os.path.splitext(filepath)[0] + self.extension
+
+    def dump(self, obj: Any, filepath: str) -> None:
+        """Atomically write encoded data to a file: temp file, fsync, rename"""
+        data = self.encode(obj)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+
+    def load(self, filepath: str) -> Any:
+        with open(filepath, 'rb') as f:
+            return self.decode(f.read())
@@ -1,27 +1,69 @@
+import logging
 from abc import ABC
-from typing import Union, Optional
+from typing import Any, Callable, Optional, Union
 
-from selenium.webdriver.common.by import By
 from undetected_chromedriver import WebElement
 
+from config import SELECTORS
+from models import ProfileData, CompanyData, JobData
+from selector_engine import selector_engine
+
+logger = logging.getLogger(__name__)
+
+
+def _as_list(selectors: Union[str, list[str]]) -> list[str]:
+    return [selectors] if isinstance(selectors, str) else list(selectors)
+
 
 class BaseParser(ABC):
     """Abstract base class for LinkedIn data parsing"""
 
+    # Field plans shared by the batch extraction backends. Each field lists selectors tried in order
+    # (None means the card itself), an optional attribute to read instead of the text, and flags
+    # for taking the last match or only checking that a match exists.
+    PROFILE_FIELDS: dict[str, dict[str, Any]] = {
+        'profile_url': {'selectors': ['a[href*="/in/"]', 'a[href*="/search/results/people/headless"]'],
+                        'attr': 'href'},
+        'name': {'selectors': [SELECTORS['profile_name']]},
+        'name_fallback': {'selectors': [
+            'div.t-sans a[href*="/in/"], div.t-sans a[href*="/search/results/people/headless"]'
+        ]},
+        'headline': {'selectors': [SELECTORS['profile_headline']]},
+        'location': {'selectors': [SELECTORS['profile_location']], 'last': True},
+    }
+
+    COMPANY_FIELDS: dict[str, dict[str, Any]] = {
+        'company_url': {'selectors': _as_list(SELECTORS['company_link']), 'attr': 'href'},
+        'company_link_text': {'selectors': _as_list(SELECTORS['company_link'])},
+        'company_urn': {'selectors': [None, '[data-chameleon-result-urn]'], 'attr': 'data-chameleon-result-urn'},
+        'name': {'selectors': _as_list(SELECTORS['company_name'])},
+        'industry': {'selectors': _as_list(SELECTORS['company_industry'])},
+        'company_size': {'selectors': _as_list(SELECTORS['company_size'])},
+        'summary': {'selectors': _as_list(SELECTORS.get('company_summary', []))},
+    }
+
+    JOB_FIELDS: dict[str, dict[str, Any]] = {
+        'job_id': {'selectors': [None], 'attr': 'data-occludable-job-id'},
+        'job_url': {'selectors': [SELECTORS['job_link']], 'attr': 'href'},
+        'title': {'selectors': [f"{SELECTORS['job_link']} {SELECTORS['job_title']}"]},
+        'title_label': {'selectors': [SELECTORS['job_link']], 'attr': 'aria-label'},
+        'company': {'selectors': _as_list(SELECTORS['job_company'])},
+        'location': {'selectors': _as_list(SELECTORS['job_location'])},
+        'posted_time': {'selectors': [SELECTORS['job_time']]},
+        'posted_datetime': {'selectors': [SELECTORS['job_time']], 'attr': 'datetime'},
+        'promoted': {'selectors': [SELECTORS['job_promoted']]},
+        'easy_apply': {'selectors': [SELECTORS['job_easy_apply']], 'exists': True},
+    }
+
+    # Key-only plans: just the identifier of each card, to skip already stored entities before full parsing
+    PROFILE_KEY_FIELDS = {'profile_url': PROFILE_FIELDS['profile_url']}
+    COMPANY_KEY_FIELDS = {'company_url': COMPANY_FIELDS['company_url']}
+    JOB_KEY_FIELDS = {'job_id': JOB_FIELDS['job_id'], 'job_url': JOB_FIELDS['job_url']}
+
     @staticmethod
     def _find_element_by_selectors(parent: WebElement, selectors: Union[str, list[str]]) -> Optional[WebElement]:
         """Helper method to find element using multiple selectors"""
-        if isinstance(selectors, str):
-            selectors = [selectors]
-
-        for selector in selectors:
-            try:
-                element = parent.find_element(By.CSS_SELECTOR, selector)
-                if element:
-                    return element
-            except:
-                continue
-        return None
+        return selector_engine.find(parent, selectors)
 
     @staticmethod
     def _extract_text(parent: WebElement, selectors: Union[str, list[str]], default: str = "") -> str:
@@ -35,3 +77,120 @@ class BaseParser(ABC):
         if not url or url == "#":
             return None
         return url.split('?')[0]
+
+    @staticmethod
+    def _job_id_from_url(job_url: str) -> str:
+        """Derive job ID from job URL"""
+        if '/view/' in job_url:
+            return job_url.split('/view/')[1].split('/')[0].split('?')[0]
+        return job_url.split('/')[-1].split('?')[0]
+
+    @staticmethod
+    def _split_industry_location(text: str) -> tuple[str, str]:
+        """Split combined 'industry • location' text"""
+        if "•" in text:
+            parts = text.split("•")
+            return parts[0].strip(), parts[1].strip() if len(parts) > 1 else ""
+        return text, ""
+
+    @staticmethod
+    def _profile_key(raw: dict[str, Any]) -> Optional[str]:
+        return BaseParser._clean_url(raw.get('profile_url'))
+
+    @staticmethod
+    def _company_key(raw: dict[str, Any]) -> Optional[str]:
+        return BaseParser._clean_url(raw.get('company_url'))
+
+    @staticmethod
+    def _job_key(raw: dict[str, Any]) -> Optional[str]:
+        if raw.get('job_id'):
+            return raw['job_id']
+        return BaseParser._job_id_from_url(raw['job_url']) if raw.get('job_url') else None
+
+    @staticmethod
+    def _build_profile(raw: dict[str, Any], keywords: str, location: Optional[str] = None) -> Optional[ProfileData]:
+        """Build profile model from extracted field values"""
+        profile_url = BaseParser._clean_url(raw.get('profile_url'))
+        if not profile_url:
+            return None
+
+        name = raw.get('name')
+        if name is None:
+            name = raw.get('name_fallback') or "LinkedIn Member"
+
+        return ProfileData(
+            profile_url=profile_url,
+            name=name,
+            headline=raw.get('headline') or "",
+            location=raw.get('location') or "",
+            search_keywords=keywords,
+            search_location=location
+        )
+
+    @staticmethod
+    def _build_company(raw: dict[str, Any], keywords: str, location: Optional[str] = None) -> Optional[CompanyData]:
+        """Build company model from extracted field values"""
+        company_url = BaseParser._clean_url(raw.get('company_url'))
+        if not company_url:
+            return None
+
+        name = raw.get('name')
+        if name is None:
+            name = "Unknown Company"
+        if not name and raw.get('company_link_text'):
+            name = raw['company_link_text']
+
+        urn = raw.get('company_urn') or ""
+        industry, location_text = BaseParser._split_industry_location(raw.get('industry') or "")
+
+        return CompanyData(
+            company_url=company_url,
+            company_id=urn.split(':')[-1] if urn else "",
+            name=name,
+            industry=industry,
+            location=location_text,
+            company_size=raw.get('company_size') or "",
+            summary=raw.get('summary') or "",
+            search_keywords=keywords,
+            search_location=location
+        )
+
+    @staticmethod
+    def _build_job(raw: dict[str, Any], keywords: str, location: Optional[str] = None) -> Optional[JobData]:
+        """Build job model from extracted field values"""
+        job_url = raw.get('job_url')
+        if not job_url:
+            return None
+
+        title = raw.get('title')
+        if title is None:
+            title = (raw.get('title_label') or "").replace(' with verification', '').strip()
+
+        return JobData(
+            job_id=raw.get('job_id') or BaseParser._job_id_from_url(job_url),
+            job_url=job_url,
+            title=title,
+            company=raw.get('company') or "",
+            location=raw.get('location') or "",
+            posted_time=raw.get('posted_time') or "",
+            posted_datetime=raw.get('posted_datetime') or "",
+            is_promoted="Promoted" in (raw.get('promoted') or ""),
+            easy_apply=bool(raw.get('easy_apply')),
+            search_keywords=keywords,
+            search_location=location
+        )
+
+    @staticmethod
+    def _build_models(raw_cards: list[dict[str, Any]], builder: Callable, keywords: str,
+                      location: Optional[str] = None) -> list[Any]:
+        """Build models from a page of extracted cards, skipping unparseable ones"""
+        results = []
+        for raw in raw_cards:
+            try:
+                item = builder(raw, keywords, location)
+            except Exception as e:
+                logger.debug(f"Error building {builder.__name__.removeprefix('_build_')} from extracted card: {e}")
+                continue
+            if item:
+                results.append(item)
+        return results
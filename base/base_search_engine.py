@@ -1,24 +1,52 @@
+import asyncio
 import logging
+from datetime import datetime
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
 
 from undetected_chromedriver import WebElement
 
+from config import (ARCHIVE_PAGES, SKIP_KNOWN_ENTITIES, SEARCH_CACHE, RESUME_SEARCHES, INCREMENTAL_CRAWL,
+                    QUERY_WATERMARK_MAX_KEYS, RESULTS_READY_TIMEOUT, RESULTS_SETTLE_TIME, RESULTS_POLL_INTERVAL,
+                    SELECTORS)
 from linkedin_automation import LinkedInAutomation
+from models import QueryWatermark, SearchCursor, EntityType, DataFile
+from page_archive import PageArchive
 from parser import LinkedInParser
-from search_engine import EntityType, DataFile
-
+from search_cache import SearchResultCache
+from search_cursors import QueryWatermarkStore, SearchCursorStore
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Counts the results of the first selector that matches anything; -1 while the document is loading,
+# 0 once an empty-state banner is shown
+RESULTS_STATE_SCRIPT = """
+const [selectors, emptySelectors] = arguments;
+if (document.readyState === 'loading') return -1;
+for (const selector of selectors) {
+    try {
+        const count = document.querySelectorAll(selector).length;
+        if (count) return count;
+    } catch (e) {}
+}
+return emptySelectors.some(selector => document.querySelector(selector)) ? 0 : null;
+"""
+
 class BaseSearchEngine(ABC):
     """Abstract base class for search engines"""
 
-    def __init__(self, automation: LinkedInAutomation):
+    def __init__(self, automation: LinkedInAutomation, archive: PageArchive | None = None,
+                 cache: SearchResultCache | None = None, cursors: SearchCursorStore | None = None,
+                 watermarks: QueryWatermarkStore | None = None):
         self.automation = automation
         self.driver = automation.driver
+        self.browser = automation.browser
         self.parser = LinkedInParser()
+        self.archive = archive or (PageArchive() if ARCHIVE_PAGES else None)
+        self.cache = cache or (SearchResultCache() if SEARCH_CACHE else None)
+        self.cursors = cursors or SearchCursorStore()
+        self.watermarks = watermarks or QueryWatermarkStore()
 
     @abstractmethod
     async def search_entities(self, entity_type: EntityType, keywords: str,
@@ -27,11 +55,141 @@ class BaseSearchEngine(ABC):
         pass
 
     @abstractmethod
-    async def get_search_results(self, selector_key: str) -> list[WebElement]:
+    def iter_entities(self, entity_type: EntityType, keywords: str, location: str | None = None,
+                      max_results: int = 50, data_file: 'DataFile | None' = None,
+                      skip_known: bool = SKIP_KNOWN_ENTITIES, resume: bool = RESUME_SEARCHES,
+                      incremental: bool = INCREMENTAL_CRAWL) -> AsyncIterator[Any]:
+        """Abstract async generator streaming search results page by page"""
+        pass
+
+    @abstractmethod
+    async def get_search_results(self, selector_key: str, timeout: float = RESULTS_READY_TIMEOUT) -> list[WebElement]:
         """Abstract method for getting search results"""
         pass
 
+    async def archive_page(self, entity_type: EntityType, keywords: str, location: str | None, page: int) -> None:
+        """Save the current page source to the page archive, if enabled"""
+        if not self.archive:
+            return
+        try:
+            html = await self.browser.page_source()
+            url = await self.browser.current_url()
+            content_hash = await asyncio.to_thread(self.archive.store, html, entity_type.value, keywords,
+                                                   location, page, url)
+            logger.debug(f"Archived {entity_type.value} page {page} as {content_hash[:12]}")
+        except Exception as e:
+            logger.warning(f"Error archiving {entity_type.value} page {page}: {e}")
+
+    async def wait_for_results(self, selectors: list[str], timeout: float = RESULTS_READY_TIMEOUT,
+                               settle: float = RESULTS_SETTLE_TIME) -> int:
+        """Wait until the result list has rendered: the result count stays unchanged for settle seconds,
+        or the page shows its empty state. Returns the last count seen (0 on timeout)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        last_count, stable_since = None, started
+        while True:
+            try:
+                count = await self.browser.execute_script(RESULTS_STATE_SCRIPT, selectors, SELECTORS['no_results'])
+            except Exception as e:
+                logger.debug(f"Error checking search results state: {e}")
+                count = None
+
+            now = loop.time()
+            if count == 0:
+                logger.debug("Search page shows no results")
+                return 0
+            if count != last_count:
+                last_count, stable_since = count, now
+            elif (count or 0) > 0 and now - stable_since >= settle:
+                logger.debug(f"{count} search results ready after {now - started:.2f}s")
+                return count
+            if now - started >= timeout:
+                logger.debug(f"Search results not settled after {timeout}s (last count: {last_count})")
+                return max(last_count or 0, 0)
+            await asyncio.sleep(RESULTS_POLL_INTERVAL)
+
+    async def load_cursor(self, entity_type: EntityType, keywords: str, location: str | None,
+                          resume: bool) -> SearchCursor:
+        """Get the cursor of an interrupted search to resume, or a fresh one"""
+        if resume:
+            try:
+                cursor = await asyncio.to_thread(self.cursors.get, entity_type.value, keywords, location)
+                if cursor:
+                    logger.info(f"Resuming {entity_type.value} search after page {cursor.page} "
+                                f"({cursor.found} results found before)")
+                    return cursor
+            except Exception as e:
+                logger.warning(f"Error loading {entity_type.value} search cursor: {e}")
+        return SearchCursor(entity_type=entity_type.value, keywords=keywords, location=location)
+
+    async def save_cursor(self, cursor: SearchCursor, page: int, found: int, seen_ids: set[str]) -> None:
+        """Record a completed page so the search can resume after it"""
+        cursor.page = page
+        cursor.found = found
+        cursor.seen_ids = list(seen_ids)
+        cursor.updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            await asyncio.to_thread(self.cursors.save, cursor)
+        except Exception as e:
+            logger.warning(f"Error saving {cursor.entity_type} search cursor: {e}")
+
+    async def clear_cursor(self, cursor: SearchCursor) -> None:
+        """Forget the cursor of a finished search"""
+        try:
+            await asyncio.to_thread(self.cursors.delete, cursor.entity_type, cursor.keywords, cursor.location)
+        except Exception as e:
+            logger.warning(f"Error clearing {cursor.entity_type} search cursor: {e}")
+
+    async def load_watermark(self, entity_type: EntityType, keywords: str, location: str | None) -> QueryWatermark:
+        """Get the keys a query returned in earlier runs"""
+        try:
+            watermark = await asyncio.to_thread(self.watermarks.get, entity_type.value, keywords, location)
+            if watermark:
+                logger.info(f"Incremental {entity_type.value} crawl: {len(watermark.keys)} keys seen in earlier runs")
+                return watermark
+        except Exception as e:
+            logger.warning(f"Error loading {entity_type.value} query watermark: {e}")
+        return QueryWatermark(entity_type=entity_type.value, keywords=keywords, location=location)
+
+    async def save_watermark(self, watermark: QueryWatermark, keys: list[str]) -> None:
+        """Add the keys returned by this run in yield order, keeping the most recent QUERY_WATERMARK_MAX_KEYS"""
+        previous = set(watermark.keys)
+        new_keys = [key for key in keys if key not in previous]
+        if not new_keys:
+            return
+        watermark.keys = (watermark.keys + new_keys)[-QUERY_WATERMARK_MAX_KEYS:]
+        watermark.updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            await asyncio.to_thread(self.watermarks.save, watermark)
+        except Exception as e:
+            logger.warning(f"Error saving {watermark.entity_type} query watermark: {e}")
+
+    async def get_cached_page(self, entity_type: EntityType, keywords: str, location: str | None, page: int,
+                              complete: bool) -> list[Any] | None:
+        """Get a results page from the search cache as models, or None on a miss"""
+        if not self.cache:
+            return None
+        try:
+            records = await asyncio.to_thread(self.cache.get, entity_type.value, keywords, location, page, complete)
+        except Exception as e:
+            logger.warning(f"Error reading {entity_type.value} page {page} from the search cache: {e}")
+            return None
+        if records is None:
+            return None
+        return [entity_type.model(**record) for record in records]
+
+    async def cache_page(self, entity_type: EntityType, keywords: str, location: str | None, page: int,
+                         items: list[Any], complete: bool) -> None:
+        """Store the parsed results of a page in the search cache, if enabled"""
+        if not self.cache:
+            return
+        try:
+            records = [item.dict(exclude_none=True) for item in items if item]
+            await asyncio.to_thread(self.cache.put, entity_type.value, keywords, location, page, records, complete)
+        except Exception as e:
+            logger.warning(f"Error caching {entity_type.value} page {page}: {e}")
+
     async def save_results(self, results: list[Any], data_file: DataFile) -> None:
-        """Save search results to file"""
+        """Queue search results for saving"""
         await self.automation.save_entities(results, data_file.full_path)
-        logger.info(f"Saved {len(results)} results to {data_file.full_path}")
\ No newline at end of file
+        logger.debug(f"Queued {len(results)} results for {data_file.full_path}")
\ No newline at end of file
@@ -0,0 +1,63 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+
+
+class BaseEntityStore(ABC):
+    """Abstract base class for entity storage backends"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._lock = threading.RLock()
+
+    def save(self, entities: list[BaseModel]) -> int:
+        """Save entities, skipping keys that are already stored. Returns the number of new items"""
+        return len(self.save_new(entities))
+
+    @abstractmethod
+    def save_new(self, entities: list[BaseModel]) -> list[BaseModel]:
+        """Save entities, skipping keys that are already stored. Returns the entities that were added"""
+        pass
+
+    @abstractmethod
+    def upsert(self, entities: list[BaseModel], partial: bool = False) -> int:
+        """Insert new entities and merge fields into already stored ones; with partial, only the fields
+        explicitly set on an entity are merged. Returns the number of new items"""
+        pass
+
+    @abstractmethod
+    def update(self, key_field: str, key: str, fields: dict[str, Any]) -> None:
+        """Patch fields of a single record, creating it if missing"""
+        pass
+
+    @abstractmethod
+    def load(self) -> list[dict[str, Any]]:
+        """Load all stored records"""
+        pass
+
+    def iter_records(self, batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """Iterate stored records; backends that can read incrementally override this"""
+        yield from self.load()
+
+    @abstractmethod
+    def keys(self, key_field: str) -> set[str]:
+        """Get the set of stored primary keys"""
+        pass
+
+    def signature(self) -> tuple:
+        """Cheap fingerprint that changes whenever stored data changes"""
+        return tuple(
+            (os.stat(path).st_mtime_ns, os.stat(path).st_size) if os.path.exists(path) else None
+            for path in self.data_paths()
+        )
+
+    def data_paths(self) -> list[str]:
+        """Files holding this store's data"""
+        return [self.filepath]
+
+    def compact(self) -> None:
+        """Reclaim space used by superseded records"""
+        pass
@@ -0,0 +1,226 @@
+"""Offline micro-benchmarks for LinkedInParser over recorded results pages.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parser --repeat 50 --output bench.json
+    python -m benchmarks.bench_parser --baseline bench.json --threshold 20
+
+Live parsing is replayed against the fixtures through an in-process driver that
+answers WebDriver commands from the saved HTML and counts every round trip.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urljoin
+
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException
+from selectolax.lexbor import LexborNode
+
+from config import SELECTORS, LINKEDIN_URL
+from html_parser import LinkedInHTMLParser, inner_text
+from parser import LinkedInParser
+from selector_engine import selector_engine
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+# fixture name prefix -> (card selectors, per-card method, page method, offline method)
+ENTITY_METHODS = {
+    'people': ('search_results', 'parse_profile_from_search', 'parse_profiles_from_page', 'parse_profiles'),
+    'companies': ('search_results', 'parse_company_from_search', 'parse_companies_from_page', 'parse_companies'),
+    'jobs': ('job_cards', 'parse_job_from_search', 'parse_jobs_from_page', 'parse_jobs'),
+}
+
+MODES = ('per_card', 'batch', 'offline')
+
+
+class RoundTripCounter:
+    """Counts simulated chromedriver HTTP calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+
+class FixtureElement:
+    """WebElement stand-in backed by a parsed fixture node"""
+
+    def __init__(self, node: LexborNode, counter: RoundTripCounter):
+        self.node = node
+        self.counter = counter
+
+    @property
+    def id(self) -> str:
+        return str(self.node.mem_id)
+
+    @property
+    def text(self) -> str:
+        self.counter.calls += 1
+        return inner_text(self.node)
+
+    def get_attribute(self, name: str) -> str | None:
+        self.counter.calls += 1
+        value = self.node.attributes.get(name)
+        if name == 'href' and value is not None:
+            return urljoin(LINKEDIN_URL, value)
+        return value
+
+    def find_elements(self, by: str, selector: str) -> list['FixtureElement']:
+        self.counter.calls += 1
+        return [FixtureElement(node, self.counter) for node in self._select(selector)]
+
+    def find_element(self, by: str, selector: str) -> 'FixtureElement':
+        self.counter.calls += 1
+        nodes = self._select(selector)
+        if not nodes:
+            raise NoSuchElementException(f"no such element: {selector}")
+        return FixtureElement(nodes[0], self.counter)
+
+    def _select(self, selector: str) -> list[LexborNode]:
+        try:
+            return [node for node in self.node.css(selector) if node.mem_id != self.node.mem_id]
+        except Exception as e:
+            raise InvalidSelectorException(str(e))
+
+
+class FixtureDriver:
+    """WebDriver stand-in answering the batch extraction script from the fixture"""
+
+    def __init__(self, counter: RoundTripCounter):
+        self.counter = counter
+        self.html_parser = LinkedInHTMLParser()
+
+    def execute_script(self, script: str, elements: list[FixtureElement], plan: dict[str, Any]) -> list[dict]:
+        self.counter.calls += 1
+        return [self.html_parser.extract_fields(element.node, plan) for element in elements]
+
+
+def run_case(fixture: Path, mode: str, repeat: int) -> dict[str, Any]:
+    """Benchmark one parsing mode over one fixture page"""
+    entity = fixture.stem.split('_')[0]
+    cards_key, card_method, page_method, offline_method = ENTITY_METHODS[entity]
+    html = fixture.read_text(encoding='utf-8')
+
+    parser = LinkedInParser()
+    html_parser = LinkedInHTMLParser()
+    counter = RoundTripCounter()
+    driver = FixtureDriver(counter)
+    cards = [FixtureElement(node, counter) for node in html_parser.get_cards(html, SELECTORS[cards_key])]
+
+    def parse_once() -> list[Any]:
+        selector_engine.clear_cache()
+        if mode == 'per_card':
+            parse = getattr(parser, card_method)
+            return [item for item in (parse(card, 'benchmark') for card in cards) if item]
+        if mode == 'batch':
+            return getattr(parser, page_method)(driver, cards, 'benchmark')
+        return getattr(html_parser, offline_method)(html, 'benchmark')
+
+    selector_engine.reset()
+    parse_once()  # warm-up, also lets the selector engine learn hit rates
+
+    counter.calls = 0
+    timings = []
+    parsed: list[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parsed = parse_once()
+        timings.append((time.perf_counter() - started) * 1000)
+    round_trips = counter.calls / repeat
+
+    tracemalloc.start()
+    parse_once()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    page_ms = statistics.median(timings)
+    card_count = max(len(cards), 1)
+    return {
+        'fixture': fixture.stem,
+        'mode': mode,
+        'cards': len(cards),
+        'parsed': len(parsed),
+        'page_ms_median': round(page_ms, 4),
+        'page_ms_min': round(min(timings), 4),
+        'page_ms_mean': round(statistics.fmean(timings), 4),
+        'card_ms_median': round(page_ms / card_count, 4),
+        'round_trips_per_page': round(round_trips, 2),
+        'round_trips_per_card': round(round_trips / card_count, 2),
+        'alloc_peak_kib': round(peak / 1024, 2),
+        'alloc_retained_kib': round(current / 1024, 2),
+    }
+
+
+def compare(results: list[dict], baseline_path: Path, threshold: float) -> list[str]:
+    """Compare results against a previous run, returning regression messages"""
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    previous = {(r['fixture'], r['mode']): r for r in baseline.get('results', [])}
+
+    regressions = []
+    for result in results:
+        before = previous.get((result['fixture'], result['mode']))
+        if not before:
+            continue
+        if result['parsed'] < before['parsed']:
+            regressions.append(f"{result['fixture']}/{result['mode']}: parsed {before['parsed']} -> {result['parsed']}")
+        if result['round_trips_per_page'] > before['round_trips_per_page']:
+            regressions.append(f"{result['fixture']}/{result['mode']}: round trips "
+                               f"{before['round_trips_per_page']} -> {result['round_trips_per_page']}")
+        limit = before['page_ms_median'] * (1 + threshold / 100)
+        if result['page_ms_median'] > limit:
+            regressions.append(f"{result['fixture']}/{result['mode']}: page latency "
+                               f"{before['page_ms_median']}ms -> {result['page_ms_median']}ms")
+    return regressions
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark LinkedInParser over recorded results pages")
+    arg_parser.add_argument('--fixtures', type=Path, default=FIXTURES_DIR, help="Directory of saved results pages")
+    arg_parser.add_argument('--mode', choices=MODES, action='append', help="Parsing mode(s) to run (default: all)")
+    arg_parser.add_argument('--repeat', type=positive_int, default=20, help="Timed iterations per case")
+    arg_parser.add_argument('--output', type=Path, help="Write JSON results to this file instead of stdout")
+    arg_parser.add_argument('--baseline', type=Path, help="Previous JSON results to compare against")
+    arg_parser.add_argument('--threshold', type=float, default=25.0, help="Allowed latency regression in percent")
+    args = arg_parser.parse_args(argv)
+
+    fixtures = sorted(p for p in args.fixtures.glob('*.html') if p.stem.split('_')[0] in ENTITY_METHODS)
+    results = [run_case(fixture, mode, args.repeat) for fixture in fixtures for mode in args.mode or MODES]
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
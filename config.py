@@ -10,6 +10,8 @@ SESSION_FOLDER = os.getenv('SESSION_FOLDER', './sessions')
 COOKIES_FILE = os.getenv('COOKIES_FILE', 'linkedin_cookies.json')
 USER_AGENT_FILE = os.getenv('USER_AGENT_FILE', 'user_agent.txt')
 REUSE_SESSION = os.getenv('REUSE_SESSION', 'true').lower() == 'true'
+BATCH_EXTRACTION = os.getenv('BATCH_EXTRACTION', 'true').lower() == 'true'
+SKIP_KNOWN_ENTITIES = os.getenv('SKIP_KNOWN_ENTITIES', 'false').lower() == 'true'
 
 os.makedirs(SESSION_FOLDER, exist_ok=True)
 
@@ -27,6 +29,41 @@ SEARCH_RESULTS_FILE = os.getenv('SEARCH_RESULTS_FILE', 'search_results.json')
 COMPANIES_FILE = os.getenv('COMPANIES_FILE', 'companies.json')
 JOBS_FILE = os.getenv('JOBS_FILE', 'jobs.json')
 
+DATA_CODEC = os.getenv('DATA_CODEC', 'json').lower()
+PRETTY_DATA = os.getenv('PRETTY_DATA', 'true').lower() == 'true'
+WRITE_BEHIND = os.getenv('WRITE_BEHIND', 'true').lower() == 'true'
+WRITER_FLUSH_INTERVAL = float(os.getenv('WRITER_FLUSH_INTERVAL', 2.0))
+WRITER_MAX_BATCH = int(os.getenv('WRITER_MAX_BATCH', 1000))
+WRITER_MAX_RETRIES = int(os.getenv('WRITER_MAX_RETRIES', 3))
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'json').lower()
+PATCH_JOURNAL_MAX = int(os.getenv('PATCH_JOURNAL_MAX', 500))
+JSONL_COMPACT_RATIO = float(os.getenv('JSONL_COMPACT_RATIO', 0.5))
+SHARD_MAX_RECORDS = int(os.getenv('SHARD_MAX_RECORDS', 5000))
+SQLITE_PATH = os.getenv('SQLITE_PATH', os.path.join(DATA_FOLDER, 'linkedin.db'))
+QUERY_INDEX_PATH = os.getenv('QUERY_INDEX_PATH', os.path.join(DATA_FOLDER, 'query_index.db'))
+FULL_TEXT_INDEX = os.getenv('FULL_TEXT_INDEX', 'false').lower() == 'true'
+FULL_TEXT_INDEX_PATH = os.getenv('FULL_TEXT_INDEX_PATH', os.path.join(DATA_FOLDER, 'search_index.db'))
+RESUME_SEARCHES = os.getenv('RESUME_SEARCHES', 'false').lower() == 'true'
+SEARCH_CURSORS_PATH = os.getenv('SEARCH_CURSORS_PATH', os.path.join(DATA_FOLDER, 'search_cursors.json'))
+INCREMENTAL_CRAWL = os.getenv('INCREMENTAL_CRAWL', 'false').lower() == 'true'
+INCREMENTAL_STOP_PAGES = int(os.getenv('INCREMENTAL_STOP_PAGES', 2))
+QUERY_WATERMARK_MAX_KEYS = int(os.getenv('QUERY_WATERMARK_MAX_KEYS', 10000))
+QUERY_WATERMARKS_PATH = os.getenv('QUERY_WATERMARKS_PATH', os.path.join(DATA_FOLDER, 'query_watermarks.json'))
+SEARCH_CACHE = os.getenv('SEARCH_CACHE', 'false').lower() == 'true'
+SEARCH_CACHE_PATH = os.getenv('SEARCH_CACHE_PATH', os.path.join(DATA_FOLDER, 'search_cache.db'))
+SEARCH_CACHE_TTL = float(os.getenv('SEARCH_CACHE_TTL', 6 * 3600))
+SEARCH_CACHE_MAX_MB = int(os.getenv('SEARCH_CACHE_MAX_MB', 64))
+RESULTS_READY_TIMEOUT = float(os.getenv('RESULTS_READY_TIMEOUT', 10.0))
+RESULTS_RETRY_TIMEOUT = float(os.getenv('RESULTS_RETRY_TIMEOUT', 3.0))
+RESULTS_SETTLE_TIME = float(os.getenv('RESULTS_SETTLE_TIME', 0.5))
+RESULTS_POLL_INTERVAL = float(os.getenv('RESULTS_POLL_INTERVAL', 0.25))
+LOOP_LAG_MONITOR = os.getenv('LOOP_LAG_MONITOR', 'true').lower() == 'true'
+LOOP_LAG_INTERVAL = float(os.getenv('LOOP_LAG_INTERVAL', 0.5))
+LOOP_LAG_WARN = float(os.getenv('LOOP_LAG_WARN', 0.2))
+
+ARCHIVE_PAGES = os.getenv('ARCHIVE_PAGES', 'false').lower() == 'true'
+ARCHIVE_FOLDER = os.getenv('ARCHIVE_FOLDER', os.path.join(DATA_FOLDER, 'archive'))
+
 os.makedirs(DATA_FOLDER, exist_ok=True)
 if DOWNLOAD_PATH:
     os.makedirs(DOWNLOAD_PATH, exist_ok=True)
@@ -114,6 +151,16 @@ SELECTORS = {
         'li[class*="ember-view"] div[data-view-name="search-entity-result-universal-template"]',
         'ul[role="list"] > li'
     ],
+    # Result cards only: the catch-all list item selector also matches navigation and skeleton lists
+    'results_ready': [
+        'div[data-chameleon-result-urn]',
+        'li[class*="ember-view"] div[data-view-name="search-entity-result-universal-template"]'
+    ],
+
+    'no_results': [
+        '.search-reusable-search-no-results',
+        '.jobs-search-no-results-banner'
+    ],
 
     'see_more_button': "//button[contains(text(), 'See more') or contains(text(), 'Show more')]",
     'profile_link': 'a[href*="/in/"], a[href*="/search/results/people/headless"]',
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+from typing import Any
+
+from pydantic import BaseModel
+
+from config import WRITE_BEHIND, WRITER_FLUSH_INTERVAL, WRITER_MAX_BATCH, WRITER_MAX_RETRIES
+from query_engine import index_changes
+from search_index import index_entities
+from storage import get_entity_store
+
+logger = logging.getLogger(__name__)
+
+
+class WriteError(Exception):
+    """Queued writes that still failed after all retries, keyed by file"""
+
+    def __init__(self, failures: dict[str, Exception]):
+        self.failures = failures
+        details = '; '.join(f"{filepath}: {e}" for filepath, e in failures.items())
+        super().__init__(f"Failed to write {len(failures)} file(s): {details}")
+
+
+class DataWriter:
+    """Single background task that owns the data files.
+    Entity saves and profile patches are queued, coalesced per file and flushed in batches
+    from a worker thread, so concurrent saves never race and each flush rewrites a file once.
+    A file that fails to write is re-queued up to max_retries times; after that the failure is
+    kept and raised by the next flush()"""
+
+    def __init__(self, flush_interval: float = WRITER_FLUSH_INTERVAL, max_batch: int = WRITER_MAX_BATCH,
+                 enabled: bool = WRITE_BEHIND, max_retries: int = WRITER_MAX_RETRIES):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.enabled = enabled
+        self.max_retries = max_retries
+        self.failures: dict[str, Exception] = {}
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    async def save(self, entities: list[BaseModel], filepath: str) -> None:
+        """Queue entities to be saved (existing keys are kept)"""
+        if entities:
+            await self._submit(('save', filepath, entities, 0))
+
+    async def update(self, filepath: str, key_field: str, key: str, fields: dict[str, Any]) -> None:
+        """Queue a field patch for a single record"""
+        await self._submit(('update', filepath, (key_field, key, fields), 0))
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been written (or given up on);
+        raises WriteError for the files that could not be written since the last flush"""
+        if self._queue is not None:
+            await self._queue.join()
+        if self.failures:
+            failures, self.failures = self.failures, {}
+            raise WriteError(failures)
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the writer task"""
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._queue = None
+        if self.failures:
+            logger.error(f"Data writer stopped, {WriteError(self.failures)}")
+        else:
+            logger.info("Data writer stopped")
+
+    async def _submit(self, item: tuple) -> None:
+        if not self.enabled:
+            failures = await asyncio.to_thread(self._write_batch, [item])
+            if failures:
+                raise WriteError(failures)
+            return
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        await self._queue.put(item)
+
+    async def _run(self) -> None:
+        """Collect items for up to flush_interval (or max_batch items), then write them in one go"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            batch = []
+            if item is None:
+                stopping = True
+            else:
+                batch.append(item)
+
+            deadline = loop.time() + self.flush_interval
+            while not stopping and len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            requeued = 0
+            try:
+                if batch:
+                    failures = await asyncio.to_thread(self._write_batch, batch)
+                    requeued = self._requeue_failed(batch, failures)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} queued items: {e}")
+            finally:
+                # Retries are queued before task_done so flush() keeps waiting for them
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+            if stopping and requeued:
+                stopping = False
+                self._queue.put_nowait(None)
+
+    def _requeue_failed(self, batch: list[tuple], failures: dict[str, Exception]) -> int:
+        """Queue the items of failed files again, or record the failure once retries run out"""
+        requeued = 0
+        for kind, filepath, payload, attempt in batch:
+            if filepath not in failures:
+                continue
+            if attempt < self.max_retries:
+                self._queue.put_nowait((kind, filepath, payload, attempt + 1))
+                requeued += 1
+            else:
+                self.failures[filepath] = failures[filepath]
+        return requeued
+
+    @staticmethod
+    def _write_batch(batch: list[tuple]) -> dict[str, Exception]:
+        """Coalesce a batch per file and write it: one save per file, one patch per record.
+        Files are written independently; returns the error of each file that failed"""
+        saves: dict[str, list[BaseModel]] = {}
+        updates: dict[str, dict[tuple[str, str], dict[str, Any]]] = {}
+        for kind, filepath, payload, _ in batch:
+            if kind == 'save':
+                saves.setdefault(filepath, []).extend(payload)
+            else:
+                key_field, key, fields = payload
+                updates.setdefault(filepath, {}).setdefault((key_field, key), {}).update(fields)
+
+        failures: dict[str, Exception] = {}
+        for filepath in dict.fromkeys([*saves, *updates]):
+            try:
+                DataWriter._write_file(filepath, saves.get(filepath, []), updates.get(filepath, {}))
+            except Exception as e:
+                logger.error(f"Error writing {filepath}: {e}")
+                failures[filepath] = e
+        return failures
+
+    @staticmethod
+    def _write_file(filepath: str, entities: list[BaseModel], patches: dict[tuple[str, str], dict[str, Any]]) -> None:
+        """Save entities and apply patches for one file; saves and patches are idempotent, so a retry is safe"""
+        store = get_entity_store(filepath)
+        before = store.signature()
+        added = []
+        if entities:
+            added = store.save_new(entities)
+            index_entities(added)
+            logger.info(f"Saved {len(entities)} items to {store.filepath} ({len(added)} new)")
+
+        for (key_field, key), fields in patches.items():
+            store.update(key_field, key, fields)
+        if patches:
+            logger.debug(f"Applied {len(patches)} patches to {store.filepath}")
+        index_changes(filepath, store, before, added, patches)
@@ -0,0 +1,94 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDriver:
+    """Awaitable facade over a WebDriver. Every command runs on one dedicated worker thread,
+    so page loads and element lookups never block the event loop and commands keep their order"""
+
+    def __init__(self, driver: WebDriver | None = None):
+        self.driver = driver
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='webdriver')
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run any blocking WebDriver code (a command, a parser pass over elements) on the driver thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def start(self, factory: Callable[..., WebDriver], *args, **kwargs) -> WebDriver:
+        """Create the driver on the driver thread and attach it"""
+        self.driver = await self.run(factory, *args, **kwargs)
+        return self.driver
+
+    async def get(self, url: str) -> None:
+        await self.run(self.driver.get, url)
+
+    async def refresh(self) -> None:
+        await self.run(self.driver.refresh)
+
+    async def current_url(self) -> str:
+        return await self.run(lambda: self.driver.current_url)
+
+    async def page_source(self) -> str:
+        return await self.run(lambda: self.driver.page_source)
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.run(self.driver.execute_script, script, *args)
+
+    async def find_element(self, by: str, selector: str) -> Any:
+        return await self.run(self.driver.find_element, by, selector)
+
+    async def find_elements(self, by: str, selector: str) -> list[Any]:
+        return await self.run(self.driver.find_elements, by, selector)
+
+    async def wait_for_element(self, selector: str, timeout: float = 10) -> Any | None:
+        """Wait for an element to be present; the polling happens on the driver thread"""
+        try:
+            return await self.run(
+                WebDriverWait(self.driver, timeout).until, EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except Exception:
+            logger.debug(f"Element not found: {selector}")
+            return None
+
+    async def get_cookies(self) -> list[dict[str, Any]]:
+        return await self.run(self.driver.get_cookies)
+
+    async def add_cookie(self, cookie: dict[str, Any]) -> None:
+        await self.run(self.driver.add_cookie, cookie)
+
+    async def text(self, element) -> str:
+        return await self.run(lambda: element.text)
+
+    async def get_attribute(self, element, name: str) -> str | None:
+        return await self.run(element.get_attribute, name)
+
+    async def is_enabled(self, element) -> bool:
+        return await self.run(element.is_enabled)
+
+    async def click(self, element) -> None:
+        await self.run(element.click)
+
+    async def clear(self, element) -> None:
+        await self.run(element.clear)
+
+    async def send_keys(self, element, keys: str) -> None:
+        await self.run(element.send_keys, keys)
+
+    async def quit(self) -> None:
+        """Quit the browser and stop the driver thread"""
+        try:
+            if self.driver:
+                await self.run(self.driver.quit)
+        finally:
+            self._executor.shutdown(wait=False)
@@ -0,0 +1,163 @@
+"""Export stored profiles, companies and jobs to columnar files.
+
+    python export.py --format parquet --output ./exports
+    python export.py --format arrow --entity-type jobs
+
+Records are streamed in batches from the jsonl, sqlite and sharded backends; the json backend
+keeps one array per file, which has to be loaded whole.
+"""
+import argparse
+import logging
+import os
+from datetime import datetime
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+from models import EntityType
+from storage import ShardedEntityStore, get_entity_store
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Low-cardinality strings repeated across many records are stored dictionary-encoded
+DICTIONARY_FIELDS = {
+    'search_keywords', 'search_location', 'location', 'industry', 'company_size', 'company', 'current_company',
+}
+TIMESTAMP_FIELDS = {'searched_at', 'connection_sent_at'}
+DATE_FIELDS = {'posted_datetime'}
+
+FORMATS = {'parquet': '.parquet', 'arrow': '.arrows'}
+BOOLEAN_STRINGS = {'true': True, '1': True, 'yes': True, 'false': False, '0': False, 'no': False}
+
+
+def build_schema(model: type[BaseModel]) -> pa.Schema:
+    """Build a typed Arrow schema from the model's declared fields"""
+    fields = []
+    for name, field in model.__fields__.items():
+        annotation = getattr(field, 'annotation', None) or getattr(field, 'outer_type_', str)
+        if name in TIMESTAMP_FIELDS:
+            arrow_type = pa.timestamp('s')
+        elif name in DATE_FIELDS:
+            arrow_type = pa.date32()
+        elif annotation is bool:
+            arrow_type = pa.bool_()
+        elif annotation is int:
+            arrow_type = pa.int64()
+        elif annotation is float:
+            arrow_type = pa.float64()
+        elif name in DICTIONARY_FIELDS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def to_record_batch(records: list[dict[str, Any]], schema: pa.Schema) -> pa.RecordBatch:
+    """Convert a batch of stored records into columns matching the schema"""
+    columns = []
+    for field in schema:
+        values = [_convert(record.get(field.name), field.type) for record in records]
+        if pa.types.is_dictionary(field.type):
+            columns.append(pa.array(values, type=field.type.value_type).dictionary_encode())
+        else:
+            columns.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def export_records(records: Iterable[dict[str, Any]], model: type[BaseModel], output_path: str,
+                   fmt: str = 'parquet', batch_size: int = 10000) -> int:
+    """Stream records into a columnar file batch by batch. Returns the number of rows written"""
+    schema = build_schema(model)
+    rows = 0
+
+    if fmt == 'parquet':
+        writer = pq.ParquetWriter(output_path, schema, compression='zstd')
+    else:
+        # The IPC stream format allows each batch to carry its own dictionaries
+        writer = pa.ipc.new_stream(output_path, schema)
+
+    try:
+        for batch in _batched(records, batch_size):
+            writer.write_batch(to_record_batch(batch, schema))
+            rows += len(batch)
+    finally:
+        writer.close()
+    return rows
+
+
+def run_export(output_folder: str, fmt: str = 'parquet', entity_types: list[str] | None = None,
+               batch_size: int = 10000, workers: int | None = None) -> dict[str, int]:
+    """Export every (or the selected) entity store into the output folder.
+    Sharded stores are read across worker processes when workers is set"""
+    os.makedirs(output_folder, exist_ok=True)
+    summary = {}
+    for entity_type in EntityType:
+        if entity_types and entity_type.value not in entity_types:
+            continue
+
+        data_file, model = entity_type.data_file, entity_type.model
+        store = get_entity_store(data_file.full_path)
+        output_path = os.path.join(output_folder, os.path.splitext(data_file.value)[0] + FORMATS[fmt])
+        if workers and isinstance(store, ShardedEntityStore):
+            records = store.iter_records_parallel(workers)
+        else:
+            records = store.iter_records(batch_size)
+        rows = export_records(records, model, output_path, fmt, batch_size)
+        logger.info(f"Exported {rows} {entity_type.value} records to {output_path}")
+        summary[entity_type.value] = rows
+    return summary
+
+
+def _convert(value: Any, arrow_type: pa.DataType) -> Any:
+    """Normalize a stored value for its column type; unparseable values become null"""
+    if value is None:
+        return None
+    if pa.types.is_string(arrow_type) or pa.types.is_dictionary(arrow_type):
+        return str(value)
+    if value == "":
+        return None
+    try:
+        if pa.types.is_timestamp(arrow_type):
+            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+        if pa.types.is_date(arrow_type):
+            return datetime.strptime(value[:10], '%Y-%m-%d').date()
+        if pa.types.is_boolean(arrow_type):
+            return _parse_bool(value)
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+def _parse_bool(value: Any) -> bool | None:
+    """Booleans stored as text ('false', '0') must not turn into True"""
+    if isinstance(value, str):
+        return BOOLEAN_STRINGS.get(value.strip().lower())
+    return bool(value)
+
+
+def _batched(records: Iterable[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Export stored LinkedIn data to columnar files")
+    arg_parser.add_argument('--format', choices=list(FORMATS), default='parquet', help="Output format")
+    arg_parser.add_argument('--output', default='./exports', help="Output folder")
+    arg_parser.add_argument('--entity-type', action='append', choices=[entity_type.value for entity_type in EntityType],
+                            help="Only export these types")
+    arg_parser.add_argument('--batch-size', type=int, default=10000, help="Rows per record batch")
+    arg_parser.add_argument('--workers', type=int, default=None, help="Processes reading shards (sharded backend)")
+    args = arg_parser.parse_args()
+
+    run_export(args.output, args.format, args.entity_type, args.batch_size, args.workers)
+
+
+if __name__ == '__main__':
+    main()
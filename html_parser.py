@@ -0,0 +1,131 @@
+import logging
+import re
+from typing import Any, Callable, Optional
+from urllib.parse import urljoin
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from base.base_parser import BaseParser
+from models import ProfileData, CompanyData, JobData
+from config import SELECTORS, LINKEDIN_URL
+
+logger = logging.getLogger(__name__)
+
+# Elements the browser lays out as blocks; innerText separates them from their neighbours with a line break
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'figcaption', 'figure', 'footer', 'form',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'section', 'table', 'tr', 'ul',
+})
+# Elements whose content innerText never renders
+SKIPPED_TAGS = frozenset({'head', 'noscript', 'script', 'style', 'template'})
+
+_LINE_BREAK, _PARAGRAPH_BREAK = '\x00', '\x01'
+_WHITESPACE = re.compile(r'[ \t\r\n\f]+')
+_SPACES_AROUND_BREAK = re.compile(r' *([\n\x00\x01]) *')
+_BREAK_RUN = re.compile(r'[\x00\x01]+')
+
+
+def inner_text(node: LexborNode) -> str:
+    """Render an element's text like the browser's innerText with default styles, trimmed like the batch script:
+    whitespace runs collapse to one space, <br> and block boundaries become line breaks and paragraphs
+    are separated by a blank line"""
+    parts: list[str] = []
+    _collect_text(node, parts)
+    text = _SPACES_AROUND_BREAK.sub(r'\1', re.sub(' {2,}', ' ', ''.join(parts)))
+    text = text.strip(_LINE_BREAK + _PARAGRAPH_BREAK)
+    text = _BREAK_RUN.sub(lambda match: '\n\n' if _PARAGRAPH_BREAK in match.group() else '\n', text)
+    return text.strip()
+
+
+def _collect_text(node: LexborNode, parts: list[str]) -> None:
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            parts.append(_WHITESPACE.sub(' ', child.text(deep=False) or ''))
+        elif child.tag == 'br':
+            parts.append('\n')
+        elif not child.tag.startswith('-') and child.tag not in SKIPPED_TAGS:
+            boundary = _PARAGRAPH_BREAK if child.tag == 'p' else _LINE_BREAK if child.tag in BLOCK_TAGS else ''
+            parts.append(boundary)
+            _collect_text(child, parts)
+            parts.append(boundary)
+
+
+class LinkedInHTMLParser(BaseParser):
+    """Offline parser for saved LinkedIn results pages (page_source snapshots)"""
+
+    def __init__(self, base_url: str = LINKEDIN_URL):
+        self.base_url = base_url
+
+    def parse_profiles(self, html: str, keywords: str, location: Optional[str] = None) -> list[ProfileData]:
+        """Parse all profile cards from a people results page"""
+        cards = self.get_cards(html, SELECTORS['search_results'])
+        return self._parse_cards(cards, self.PROFILE_FIELDS, self._build_profile, keywords, location)
+
+    def parse_companies(self, html: str, keywords: str, location: Optional[str] = None) -> list[CompanyData]:
+        """Parse all company cards from a companies results page"""
+        cards = self.get_cards(html, SELECTORS['search_results'])
+        return self._parse_cards(cards, self.COMPANY_FIELDS, self._build_company, keywords, location)
+
+    def parse_jobs(self, html: str, keywords: str, location: Optional[str] = None) -> list[JobData]:
+        """Parse all job cards from a jobs results page"""
+        cards = self.get_cards(html, SELECTORS['job_cards'])
+        return self._parse_cards(cards, self.JOB_FIELDS, self._build_job, keywords, location)
+
+    @staticmethod
+    def get_cards(html: str, selectors: str | list[str]) -> list[LexborNode]:
+        """Find result cards using the first selector that matches anything"""
+        if isinstance(selectors, str):
+            selectors = [selectors]
+
+        tree = LexborHTMLParser(html)
+        for selector in selectors:
+            try:
+                cards = tree.css(selector)
+            except Exception as e:
+                logger.debug(f"Card selector failed: {selector}, {e}")
+                continue
+            if cards:
+                return cards
+        return []
+
+    def extract_fields(self, card: LexborNode, plan: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """Evaluate a field plan against a card, mirroring the in-browser batch extraction"""
+        out: dict[str, Any] = {}
+        for field, spec in plan.items():
+            out[field] = None
+            attr = spec.get('attr')
+            for selector in spec['selectors']:
+                matches = self._match_all(card, selector)
+                if attr:
+                    matches = [node for node in matches if attr in node.attributes]
+                if not matches:
+                    continue
+                node = matches[-1] if spec.get('last') else matches[0]
+                out[field] = True if spec.get('exists') else self._read(node, attr)
+                break
+        return out
+
+    def _parse_cards(self, cards: list[LexborNode], plan: dict[str, dict[str, Any]], builder: Callable,
+                     keywords: str, location: Optional[str] = None) -> list[Any]:
+        """Extract and build models for every card"""
+        raw_cards = [self.extract_fields(card, plan) for card in cards]
+        return self._build_models(raw_cards, builder, keywords, location)
+
+    @staticmethod
+    def _match_all(card: LexborNode, selector: Optional[str]) -> list[LexborNode]:
+        """Match descendants only, like querySelectorAll; None selects the card itself"""
+        if selector is None:
+            return [card]
+        try:
+            return [node for node in card.css(selector) if node.mem_id != card.mem_id]
+        except Exception:
+            return []
+
+    def _read(self, node: LexborNode, attr: Optional[str]) -> Optional[str]:
+        """Read element text or attribute, resolving links like the browser does"""
+        if not attr:
+            return inner_text(node)
+        value = node.attributes.get(attr)
+        if attr == 'href' and value is not None:
+            return urljoin(self.base_url, value)
+        return value
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from enum import Enum
 from typing import Any
 from selenium.webdriver.common.keys import Keys
@@ -8,6 +7,7 @@ import aiofiles
 
 from base.base_automatation import BaseAutomation
 from models import ConversationData
+from serialization import get_codec
 from config import *
 from utils import *
 
@@ -44,6 +44,22 @@ class VerificationKeys(Enum):
     CHALLENGE = "challenge"
 
 
+# Reads the participant name and unread state of every conversation card in one call. Only unread tracked
+# conversations are then opened: the list preview is truncated and localized, so it cannot be compared with
+# the sent message, and voice replies can only be downloaded from the open thread
+CONVERSATIONS_SCRIPT = """
+const [cards, selectors] = arguments;
+const text = (card, selector) => {
+    const el = card.querySelector(selector);
+    return el ? (el.innerText || '').trim() : '';
+};
+return cards.map(card => ({
+    name: text(card, selectors.name),
+    unread: !!card.querySelector(selectors.unread),
+}));
+"""
+
+
 class LinkedInAutomation(BaseAutomation):
     """LinkedIn automation with async support"""
 
@@ -52,6 +68,8 @@ class LinkedInAutomation(BaseAutomation):
         self.use_proxy = use_proxy
         self.max_conversations_check = max_conversations_check
         self.conversations: dict[str, ConversationData] = {}
+        # Session files stay indented JSON at their configured path whatever DATA_CODEC is
+        self.codec = get_codec('json', pretty=True)
         self.cookies_path = os.path.join(SESSION_FOLDER, COOKIES_FILE)
         self.user_agent_path = os.path.join(SESSION_FOLDER, USER_AGENT_FILE)
 
@@ -68,19 +86,21 @@ class LinkedInAutomation(BaseAutomation):
 
         if self.use_proxy and PROXY_LIST:
             proxy = random.choice(PROXY_LIST)
-            if self._check_proxy(proxy):
+            if await asyncio.to_thread(self._check_proxy, proxy):
                 options.add_argument(f'--proxy-server={proxy}')
                 logger.info(f"Using proxy: {proxy}")
 
-        self.driver = uc.Chrome(options=options)
-        self.driver.maximize_window()
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        self.driver = await self.browser.start(uc.Chrome, options=options)
+        await self.browser.run(self.driver.maximize_window)
+        await self.browser.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.lag_monitor:
+            self.lag_monitor.start()
 
     async def login(self) -> bool:
         """Login to LinkedIn with session management"""
         try:
             if REUSE_SESSION and await self._load_cookies():
-                self.driver.get(f"{LINKEDIN_URL}/feed/")
+                await self.browser.get(f"{LINKEDIN_URL}/feed/")
                 await asyncio.sleep(random.uniform(*Delays.LONG.value))
 
                 if await self._is_logged_in():
@@ -105,11 +125,11 @@ class LinkedInAutomation(BaseAutomation):
         try:
             logger.info(f"Sending connection request to: {profile_url}")
 
-            if self.driver.current_url != profile_url:
-                self.driver.get(profile_url)
+            if await self.browser.current_url() != profile_url:
+                await self.browser.get(profile_url)
                 await asyncio.sleep(random.uniform(*Delays.LONG.value))
 
-            more_button = self.wait_for_element(SELECTORS['more_button'])
+            more_button = await self.wait_for_element(SELECTORS['more_button'])
             if not more_button:
                 logger.error("More button not found")
                 return False
@@ -117,7 +137,7 @@ class LinkedInAutomation(BaseAutomation):
             await self._safe_click(more_button)
             await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
-            connect_button = self.wait_for_element(SELECTORS['connect_button_dropdown'])
+            connect_button = await self.wait_for_element(SELECTORS['connect_button_dropdown'])
             if not connect_button:
                 logger.error("Connect button not found in dropdown menu")
                 return False
@@ -126,17 +146,17 @@ class LinkedInAutomation(BaseAutomation):
             await asyncio.sleep(random.uniform(*delay_range))
 
             if note_required:
-                add_note_button = self.wait_for_element(SELECTORS['add_note_button'], timeout=5)
+                add_note_button = await self.wait_for_element(SELECTORS['add_note_button'], timeout=5)
                 if add_note_button:
                     await self._safe_click(add_note_button)
                     await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
-                    message_textarea = self.wait_for_element(SELECTORS['custom_message_textarea'], timeout=5)
+                    message_textarea = await self.wait_for_element(SELECTORS['custom_message_textarea'], timeout=5)
                     if message_textarea:
                         await self._human_typing(message_textarea, message)
                         await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
-            send_button = self.wait_for_element(SELECTORS['send_invitation_button'], timeout=5)
+            send_button = await self.wait_for_element(SELECTORS['send_invitation_button'], timeout=5)
             if not send_button:
                 logger.error("Send invitation button not found")
                 return False
@@ -162,12 +182,12 @@ class LinkedInAutomation(BaseAutomation):
         try:
             logger.info(f"Sending message to: {profile_url}")
 
-            self.driver.get(profile_url)
+            await self.browser.get(profile_url)
             await asyncio.sleep(random.uniform(*DELAY_RANGE))
 
             await self._random_scroll()
 
-            message_button = self.wait_for_element(SELECTORS['message_button'], timeout=15)
+            message_button = await self.wait_for_element(SELECTORS['message_button'], timeout=15)
             if not message_button:
                 logger.error("Message button not found")
                 return False
@@ -175,7 +195,7 @@ class LinkedInAutomation(BaseAutomation):
             await self._safe_click(message_button)
             await asyncio.sleep(random.uniform(*Delays.LONG.value))
 
-            message_input = self.wait_for_element(SELECTORS['message_input'], timeout=15)
+            message_input = await self.wait_for_element(SELECTORS['message_input'], timeout=15)
             if not message_input:
                 logger.error("Message input not found")
                 return False
@@ -186,7 +206,7 @@ class LinkedInAutomation(BaseAutomation):
             await self._human_typing(message_input, message)
             await asyncio.sleep(random.uniform(*Delays.MEDIUM.value))
 
-            send_button = self.wait_for_element(SELECTORS['send_button'])
+            send_button = await self.wait_for_element(SELECTORS['send_button'])
             if not send_button:
                 logger.error("Send button not found")
                 return False
@@ -214,64 +234,60 @@ class LinkedInAutomation(BaseAutomation):
         if profile_url not in self.conversations:
             logger.warning(f"No conversation found for {profile_url}")
             return None
+        if self.conversations[profile_url].has_response:
+            return True
 
+        responses = await self.check_responses([profile_url], max_conversations)
+        return None if responses is None else responses.get(profile_url, False)
+
+    async def check_responses(self, profile_urls: list[str] | None = None,
+                              max_conversations: int | None = None) -> dict[str, bool] | None:
+        """Check every tracked conversation still waiting for a response with a single load of the
+        messaging list. Returns {profile_url: has_response}, or None if the list could not be read"""
         if max_conversations is None:
             max_conversations = self.max_conversations_check
 
+        # Participants are matched by name; tracked people sharing a name take matching cards in list order
+        pending: dict[str, list[str]] = {}
+        for profile_url, conversation in self.conversations.items():
+            if (profile_urls is None or profile_url in profile_urls) and not conversation.has_response:
+                pending.setdefault(conversation.user_name.strip().lower(), []).append(profile_url)
+        if not pending:
+            return {}
+
         try:
-            logger.info(f"Checking response for: {profile_url}")
-            self.driver.get(f"{LINKEDIN_URL}/messaging/")
+            logger.info(f"Checking responses for {sum(map(len, pending.values()))} conversations")
+            await self.browser.get(f"{LINKEDIN_URL}/messaging/")
             await asyncio.sleep(random.uniform(*DELAY_RANGE))
 
-            conversations = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS['conversation_list'])
-
-            for conv in conversations[:max_conversations]:
-                try:
-                    unread_badges = conv.find_elements(By.CSS_SELECTOR, SELECTORS['unread_badge'])
-                    if not unread_badges:
-                        continue
-
-                    participant_element = conv.find_element(By.CSS_SELECTOR, SELECTORS['participant_name'])
-                    participant_name = participant_element.text.strip()
-
-                    tracked_name = self.conversations[profile_url].user_name
-                    if participant_name.lower() != tracked_name.lower():
-                        continue
-
-                    await self._safe_click(conv)
-                    await asyncio.sleep(random.uniform(*Delays.MEDIUM.value))
-
-                    voice_messages = await self._find_voice_messages()
-                    if voice_messages:
-                        logger.info(f"Found {len(voice_messages)} voice message(s) from {participant_name}")
-                        downloaded = await self.download_voice_messages(self.driver)
-                        if downloaded:
-                            self.conversations[profile_url].voice_responses = downloaded
-
-                    messages = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS['last_message'])
-                    if messages:
-                        last_message = messages[-1].text
-
-                        if last_message != self.conversations[profile_url].message_sent:
-                            self.conversations[profile_url].has_response = True
-                            logger.info(f"Response received from {participant_name} ({profile_url})")
-                            return True
-
-                    if voice_messages:
-                        self.conversations[profile_url].has_response = True
-                        logger.info(f"Voice response received from {participant_name} ({profile_url})")
-                        return True
-
-                except Exception as e:
-                    logger.debug(f"Error checking conversation: {e}")
-                    continue
-
-            return False
-
+            conversations = await self.browser.find_elements(By.CSS_SELECTOR, SELECTORS['conversation_list'])
+            conversations = conversations[:max_conversations]
+            rows = await self.browser.execute_script(CONVERSATIONS_SCRIPT, conversations, {
+                'name': SELECTORS['participant_name'],
+                'unread': SELECTORS['unread_badge'],
+            }) or []
         except Exception as e:
-            logger.error(f"Error checking response: {e}")
+            logger.error(f"Error checking responses: {e}")
             return None
 
+        responses = {profile_url: False for urls in pending.values() for profile_url in urls}
+        for conv, row in zip(conversations, rows):
+            urls = pending.get((row.get('name') or '').strip().lower())
+            if not urls:
+                continue
+            profile_url = urls.pop(0)
+            if not row.get('unread'):
+                continue
+            try:
+                if await self._has_response(conv, self.conversations[profile_url]):
+                    self.conversations[profile_url].has_response = True
+                    responses[profile_url] = True
+                    logger.info(f"Response received from {row['name']} ({profile_url})")
+            except Exception as e:
+                logger.debug(f"Error checking conversation with {row['name']}: {e}")
+
+        return responses
+
     async def download_voice_messages(self, conversation_element) -> dict[str, str] | None:
         """Download voice messages from a conversation"""
         downloaded_files = {}
@@ -281,14 +297,14 @@ class LinkedInAutomation(BaseAutomation):
 
             audio_elements = await self._find_voice_messages()
 
-            cookies = self.driver.get_cookies()
+            cookies = await self.browser.get_cookies()
             session = requests.Session()
             for cookie in cookies:
                 session.cookies.set(cookie['name'], cookie['value'])
 
             for i, audio in enumerate(audio_elements):
                 try:
-                    audio_src = audio.get_attribute('src')
+                    audio_src = await self.browser.get_attribute(audio, 'src')
                     if not audio_src:
                         continue
 
@@ -297,22 +313,18 @@ class LinkedInAutomation(BaseAutomation):
                     filepath = os.path.join(DOWNLOAD_PATH, filename)
 
                     headers = {
-                        'User-Agent': self.driver.execute_script("return navigator.userAgent;"),
+                        'User-Agent': await self.browser.execute_script("return navigator.userAgent;"),
                         'Referer': 'https://www.linkedin.com/'
                     }
-                    response = session.get(audio_src, headers=headers, stream=True)
-
-                    if response.status_code == 200:
-                        async with aiofiles.open(filepath, 'wb') as f:
-                            async for chunk in response.aiter_content(chunk_size=Limits.DOWNLOAD_CHUNK_SIZE.value):
-                                await f.write(chunk)
+                    status_code = await asyncio.to_thread(self._download_file, session, audio_src, headers, filepath)
 
+                    if status_code == 200:
                         logger.info(f"Downloaded voice message: {filename}")
                         downloaded_files[f"message_{i}"] = filepath
 
                         await asyncio.sleep(random.uniform(*Delays.SHORT.value))
                     else:
-                        logger.error(f"Failed to download voice message: {response.status_code}")
+                        logger.error(f"Failed to download voice message: {status_code}")
 
                 except Exception as e:
                     logger.error(f"Error downloading individual voice message: {e}")
@@ -325,22 +337,19 @@ class LinkedInAutomation(BaseAutomation):
             return None
 
     async def run_response_checker(self, profile_urls: list[str], interval: int = CHECK_INTERVAL) -> None:
-        """Continuously check for responses"""
+        """Continuously check for responses, loading the messaging list once per cycle"""
         logger.info(f"Starting response checker with {interval}s interval")
 
         while True:
             try:
-                for profile_url in profile_urls:
-                    if profile_url in self.conversations and not self.conversations[profile_url].has_response:
-                        has_response = await self.check_response(profile_url)
-                        if has_response:
-                            logger.info(f"New response from {profile_url}!")
-
-                            voice_files = self.conversations[profile_url].voice_responses
-                            if voice_files:
-                                logger.info(f"Downloaded {len(voice_files)} voice messages")
+                responses = await self.check_responses(profile_urls) or {}
+                for profile_url, has_response in responses.items():
+                    if has_response:
+                        logger.info(f"New response from {profile_url}!")
 
-                        await asyncio.sleep(random.uniform(30, 60))
+                        voice_files = self.conversations[profile_url].voice_responses
+                        if voice_files:
+                            logger.info(f"Downloaded {len(voice_files)} voice messages")
 
                 logger.info(f"Waiting {interval} seconds before next check...")
                 await asyncio.sleep(interval)
@@ -353,12 +362,15 @@ class LinkedInAutomation(BaseAutomation):
                 await asyncio.sleep(60)
 
     async def close(self) -> None:
-        """Close the browser and save session"""
+        """Flush pending data, close the browser and save session"""
+        await self.writer.close()
         if self.driver:
             if self.logged_in and REUSE_SESSION:
                 await self._save_cookies()
-            self.driver.quit()
+            await self.browser.quit()
             logger.info("Browser closed")
+        if self.lag_monitor:
+            await self.lag_monitor.stop()
 
     # Private helper methods
     async def _get_or_create_user_agent(self) -> str:
@@ -367,7 +379,7 @@ class LinkedInAutomation(BaseAutomation):
             async with aiofiles.open(self.user_agent_path, 'r') as f:
                 return (await f.read()).strip()
         else:
-            user_agent = get_random_user_agent()
+            user_agent = await asyncio.to_thread(get_random_user_agent)
             async with aiofiles.open(self.user_agent_path, 'w') as f:
                 await f.write(user_agent)
             return user_agent
@@ -376,12 +388,23 @@ class LinkedInAutomation(BaseAutomation):
         """Check if proxy is working (sync function)"""
         return check_proxy(proxy)
 
+    @staticmethod
+    def _download_file(session: requests.Session, url: str, headers: dict[str, str], filepath: str) -> int:
+        """Stream a file to disk and return the response status (sync function)"""
+        with session.get(url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 200:
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=Limits.DOWNLOAD_CHUNK_SIZE.value):
+                        f.write(chunk)
+            return response.status_code
+
     async def _save_cookies(self) -> bool:
         """Save browser cookies using async context manager"""
         try:
-            cookies = self.driver.get_cookies()
-            async with aiofiles.open(self.cookies_path, 'w') as f:
-                await f.write(json.dumps(cookies, indent=2))
+            cookies = await self.browser.get_cookies()
+            data = await asyncio.to_thread(self.codec.encode, cookies)
+            async with aiofiles.open(self.cookies_path, 'wb') as f:
+                await f.write(data)
             logger.info(f"Saved {len(cookies)} cookies")
             return True
         except Exception as e:
@@ -394,21 +417,21 @@ class LinkedInAutomation(BaseAutomation):
             if not os.path.exists(self.cookies_path):
                 return False
 
-            self.driver.get(LINKEDIN_URL)
+            await self.browser.get(LINKEDIN_URL)
             await asyncio.sleep(random.uniform(*Delays.MEDIUM.value))
 
-            async with aiofiles.open(self.cookies_path, 'r') as f:
+            async with aiofiles.open(self.cookies_path, 'rb') as f:
                 content = await f.read()
-                cookies = json.loads(content)
+            cookies = await asyncio.to_thread(self.codec.decode, content)
 
             for cookie in cookies:
                 cookie.pop('expiry', None)  # Clean way to remove expiry
                 try:
-                    self.driver.add_cookie(cookie)
+                    await self.browser.add_cookie(cookie)
                 except:
                     pass
 
-            self.driver.refresh()
+            await self.browser.refresh()
             await asyncio.sleep(random.uniform(*Delays.LONG.value))
             return True
 
@@ -419,10 +442,10 @@ class LinkedInAutomation(BaseAutomation):
     async def _is_logged_in(self) -> bool:
         """Check if logged in using enum paths"""
         try:
-            current_url = self.driver.current_url
+            current_url = await self.browser.current_url()
             linkedin_paths = [path.value for path in LinkedInPaths]
             if any(path in current_url for path in linkedin_paths):
-                profile_elements = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS['profile_photo'])
+                profile_elements = await self.browser.find_elements(By.CSS_SELECTOR, SELECTORS['profile_photo'])
                 return bool(profile_elements)
             return False
         except:
@@ -431,24 +454,24 @@ class LinkedInAutomation(BaseAutomation):
     async def _perform_login(self) -> bool:
         """Perform actual login"""
         logger.info("Starting login process...")
-        self.driver.get(LOGIN_URL)
+        await self.browser.get(LOGIN_URL)
         await asyncio.sleep(random.uniform(*DELAY_RANGE))
 
-        email_input = self.wait_for_element(SELECTORS['email_input'])
+        email_input = await self.wait_for_element(SELECTORS['email_input'])
         if not email_input:
             raise Exception("Email input not found")
 
         await self._human_typing(email_input, LINKEDIN_EMAIL)
         await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
-        password_input = self.wait_for_element(SELECTORS['password_input'])
+        password_input = await self.wait_for_element(SELECTORS['password_input'])
         if not password_input:
             raise Exception("Password input not found")
 
         await self._human_typing(password_input, LINKEDIN_PASSWORD)
         await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
-        login_button = self.wait_for_element(SELECTORS['login_button'])
+        login_button = await self.wait_for_element(SELECTORS['login_button'])
         if not login_button:
             raise Exception("Login button not found")
 
@@ -459,7 +482,8 @@ class LinkedInAutomation(BaseAutomation):
             await asyncio.sleep(random.uniform(*Delays.LONG.value))
 
         linkedin_paths = [path.value for path in LinkedInPaths]
-        if any(path in self.driver.current_url for path in linkedin_paths):
+        current_url = await self.browser.current_url()
+        if any(path in current_url for path in linkedin_paths):
             self.logged_in = True
             logger.info("Login successful!")
             await self._save_cookies()
@@ -471,13 +495,14 @@ class LinkedInAutomation(BaseAutomation):
     async def _handle_verification(self) -> bool:
         """Handle verification if required using enum keys"""
         verification_keys = [key.value for key in VerificationKeys]
-        if not any(key in self.driver.current_url for key in verification_keys):
+        current_url = await self.browser.current_url()
+        if not any(key in current_url for key in verification_keys):
             return False
 
         logger.info("Verification required!")
         await asyncio.sleep(random.uniform(*Delays.MEDIUM.value))
 
-        verification_input = self.wait_for_element(SELECTORS['verification_inputs'], timeout=5)
+        verification_input = await self.wait_for_element(SELECTORS['verification_inputs'], timeout=5)
         if not verification_input:
             return False
 
@@ -488,11 +513,11 @@ class LinkedInAutomation(BaseAutomation):
         await self._human_typing(verification_input, code)
         await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
-        submit_button = self.wait_for_element(SELECTORS['verification_submit'], timeout=5)
+        submit_button = await self.wait_for_element(SELECTORS['verification_submit'], timeout=5)
         if submit_button:
             await self._safe_click(submit_button)
         else:
-            verification_input.send_keys(Keys.RETURN)
+            await self.browser.send_keys(verification_input, Keys.RETURN)
 
         logger.info("Verification code submitted")
         await asyncio.sleep(random.uniform(*Delays.LONG.value))
@@ -508,10 +533,28 @@ class LinkedInAutomation(BaseAutomation):
         except:
             return None
 
+    async def _has_response(self, conv, conversation: ConversationData) -> bool:
+        """Open an unread conversation and decide whether it holds a response: a voice message,
+        or a last message other than the one we sent"""
+        await self._safe_click(conv)
+        await asyncio.sleep(random.uniform(*Delays.MEDIUM.value))
+
+        voice_messages = await self._find_voice_messages()
+        if voice_messages:
+            logger.info(f"Found {len(voice_messages)} voice message(s) from {conversation.user_name}")
+            downloaded = await self.download_voice_messages(self.driver)
+            if downloaded:
+                conversation.voice_responses = downloaded
+
+        messages = await self.browser.find_elements(By.CSS_SELECTOR, SELECTORS['last_message'])
+        if messages and (await self.browser.text(messages[-1])) != conversation.message_sent:
+            return True
+        return bool(voice_messages)
+
     async def _find_voice_messages(self) -> list[Any]:
         """Find voice message elements"""
         for selector in SELECTORS['voice_messages']:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            elements = await self.browser.find_elements(By.CSS_SELECTOR, selector)
             if elements:
                 return elements
         return []
@@ -519,13 +562,13 @@ class LinkedInAutomation(BaseAutomation):
     async def _safe_click(self, element) -> bool:
         """Safely click an element"""
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            await self.browser.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
             await asyncio.sleep(random.uniform(0.5, 1))
-            element.click()
+            await self.browser.click(element)
             return True
         except:
             try:
-                self.driver.execute_script("arguments[0].click();", element)
+                await self.browser.execute_script("arguments[0].click();", element)
                 return True
             except Exception as e:
                 logger.error(f"Failed to click element: {e}")
@@ -533,9 +576,9 @@ class LinkedInAutomation(BaseAutomation):
 
     async def _human_typing(self, element, text: str) -> None:
         """Type with human-like speed using enum delays"""
-        element.clear()
+        await self.browser.clear(element)
         for char in text:
-            element.send_keys(char)
+            await self.browser.send_keys(element, char)
             await asyncio.sleep(random.uniform(Delays.TYPING_MIN.value, Delays.TYPING_MAX.value))
 
     async def _random_scroll(self, scrolls: int | None = None) -> None:
@@ -546,38 +589,21 @@ class LinkedInAutomation(BaseAutomation):
         for _ in range(scrolls):
             scroll_height = random.randint(300, 700)
             direction = random.choice([1, -1])
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_height * direction})")
+            await self.browser.execute_script(f"window.scrollBy(0, {scroll_height * direction})")
             await asyncio.sleep(random.uniform(*Delays.SHORT.value))
 
     async def _extract_username(self, profile_url: str) -> str:
         """Extract username from profile"""
         try:
-            name_elem = self.driver.find_element(By.CSS_SELECTOR, SELECTORS['profile_name'])
-            return name_elem.text.strip()
+            name_elem = await self.browser.find_element(By.CSS_SELECTOR, SELECTORS['profile_name'])
+            return (await self.browser.text(name_elem)).strip()
         except:
             return profile_url.split('/')[-2]
 
     async def _update_profile_data(self, profile_url: str, update_data: dict[str, Any]) -> bool:
-        """Update profile data in storage using async context manager"""
+        """Queue a profile data update for the background data writer (True means queued, see flush_data)"""
         try:
-            filepath = os.path.join(DATA_FOLDER, PROFILES_FILE)
-
-            profiles = {}
-            if os.path.exists(filepath):
-                async with aiofiles.open(filepath, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    profiles = json.loads(content)
-                    if isinstance(profiles, list):
-                        profiles = {p['profile_url']: p for p in profiles}
-
-            if profile_url not in profiles:
-                profiles[profile_url] = {'profile_url': profile_url}
-
-            profiles[profile_url].update(update_data)
-
-            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(profiles, indent=2, ensure_ascii=False))
-
+            await self.writer.update(os.path.join(DATA_FOLDER, PROFILES_FILE), 'profile_url', profile_url, update_data)
             return True
 
         except Exception as e:
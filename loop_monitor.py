@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+from config import LOOP_LAG_INTERVAL, LOOP_LAG_WARN
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measures how long the event loop is blocked: a task sleeps for interval seconds
+    and records how late it wakes up; lags above warn_threshold are logged"""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL, warn_threshold: float = LOOP_LAG_WARN):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.slow_ticks = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info(f"Event loop lag: {self.stats()}")
+
+    def stats(self) -> dict[str, float]:
+        return {
+            'samples': self.samples,
+            'avg_lag': round(self.total_lag / self.samples, 4) if self.samples else 0.0,
+            'max_lag': round(self.max_lag, 4),
+            'slow_ticks': self.slow_ticks,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.samples += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.warn_threshold:
+                self.slow_ticks += 1
+                logger.warning(f"Event loop was blocked for {lag:.3f}s")
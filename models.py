@@ -1,6 +1,11 @@
+from enum import Enum
+from pathlib import Path
+
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from config import DATA_FOLDER
+
 
 class BaseData(BaseModel):
     """Base model for all data types"""
@@ -81,3 +86,57 @@ class ConversationData(BaseModel):
     user_name: str
     voice_sent: bool = False
     voice_responses: dict[str, str] | None = Field(default=None)
+
+
+class SearchCursor(BaseModel):
+    """Progress of a search, persisted so an interrupted search can resume where it stopped"""
+    entity_type: str
+    keywords: str
+    location: str | None = None
+    page: int = 0
+    found: int = 0
+    seen_ids: list[str] = Field(default_factory=list)
+    updated_at: str = Field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+
+
+class QueryWatermark(BaseModel):
+    """Keys a standing query has already returned, used by incremental re-crawls"""
+    entity_type: str
+    keywords: str
+    location: str | None = None
+    keys: list[str] = Field(default_factory=list)
+    updated_at: str = Field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+
+
+class EntityType(Enum):
+    """Enum for LinkedIn search entity types"""
+    PEOPLE = "people"
+    COMPANIES = "companies"
+    JOBS = "jobs"
+
+    @property
+    def key_field(self) -> str:
+        """Primary key field of the entity's model"""
+        return {'people': 'profile_url', 'companies': 'company_url', 'jobs': 'job_id'}[self.value]
+
+    @property
+    def model(self) -> type[BaseData]:
+        """Model class of the entity"""
+        return {'people': ProfileData, 'companies': CompanyData, 'jobs': JobData}[self.value]
+
+    @property
+    def data_file(self) -> 'DataFile':
+        """Data file the entity is stored in"""
+        return {'people': DataFile.PROFILES, 'companies': DataFile.COMPANIES, 'jobs': DataFile.JOBS}[self.value]
+
+
+class DataFile(Enum):
+    """Enum for data file paths with descriptive names"""
+    PROFILES = "profiles.json"
+    COMPANIES = "companies.json"
+    JOBS = "jobs.json"
+
+    @property
+    def full_path(self) -> str:
+        """Get full file path"""
+        return str(Path(DATA_FOLDER) / self.value)
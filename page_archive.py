@@ -0,0 +1,72 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from config import ARCHIVE_FOLDER
+
+logger = logging.getLogger(__name__)
+
+
+class PageArchive:
+    """Compressed, content-addressed archive of raw search result pages"""
+
+    MANIFEST_FILE = "manifest.jsonl"
+
+    def __init__(self, folder: str = ARCHIVE_FOLDER, compress_level: int = 6):
+        self.folder = Path(folder)
+        self.objects_folder = self.folder / "objects"
+        self.manifest_path = self.folder / self.MANIFEST_FILE
+        self.compress_level = compress_level
+        self.objects_folder.mkdir(parents=True, exist_ok=True)
+
+    def store(self, html: str, entity_type: str, keywords: str, location: str | None, page: int,
+              url: str | None = None) -> str:
+        """Store a page and append its manifest entry, returning the content hash"""
+        raw = html.encode('utf-8')
+        content_hash = hashlib.sha256(raw).hexdigest()
+        object_path = self.object_path(content_hash)
+
+        if object_path.exists():
+            logger.debug(f"Page {page} already archived as {content_hash[:12]}")
+        else:
+            object_path.parent.mkdir(exist_ok=True)
+            tmp_path = object_path.with_suffix('.tmp')
+            tmp_path.write_bytes(gzip.compress(raw, compresslevel=self.compress_level))
+            os.replace(tmp_path, object_path)
+
+        entry = {
+            'hash': content_hash,
+            'entity_type': entity_type,
+            'keywords': keywords,
+            'location': location,
+            'page': page,
+            'url': url,
+            'archived_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'size': len(raw),
+            'compressed_size': object_path.stat().st_size,
+        }
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return content_hash
+
+    def load(self, content_hash: str) -> str:
+        """Load and decompress an archived page"""
+        return gzip.decompress(self.object_path(content_hash).read_bytes()).decode('utf-8')
+
+    def entries(self) -> Iterator[dict[str, Any]]:
+        """Iterate manifest entries in archive order"""
+        if not self.manifest_path.exists():
+            return
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def object_path(self, content_hash: str) -> Path:
+        """Get the object file path for a content hash"""
+        return self.objects_folder / content_hash[:2] / f"{content_hash}.html.gz"
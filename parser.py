@@ -1,16 +1,52 @@
-import json
 import logging
 import os
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
+from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 from base.base_parser import BaseParser
 from models import ProfileData, CompanyData, JobData
+from search_index import index_entities
+from storage import get_entity_store
 from config import SELECTORS, DATA_FOLDER, PROFILES_FILE, COMPANIES_FILE, JOBS_FILE, SEARCH_RESULTS_FILE
 
 logger = logging.getLogger(__name__)
 
+# Evaluates a field plan against every card in the browser, so a whole page costs one WebDriver call
+BATCH_EXTRACT_SCRIPT = """
+const [cards, plan] = arguments;
+const read = (el, attr) => {
+    if (!attr) return (el.innerText || '').trim();
+    return typeof el[attr] === 'string' ? el[attr] : el.getAttribute(attr);
+};
+const matchAll = (card, selector, spec) => {
+    if (selector === null) return [card];
+    try {
+        if (spec.attr || spec.last) return Array.from(card.querySelectorAll(selector));
+        const el = card.querySelector(selector);
+        return el ? [el] : [];
+    } catch (e) {
+        return [];
+    }
+};
+return cards.map(card => {
+    const out = {};
+    for (const [field, spec] of Object.entries(plan)) {
+        out[field] = null;
+        for (const selector of spec.selectors) {
+            let matches = matchAll(card, selector, spec);
+            if (spec.attr) matches = matches.filter(el => el.hasAttribute(spec.attr));
+            if (!matches.length) continue;
+            const el = spec.last ? matches[matches.length - 1] : matches[0];
+            out[field] = spec.exists ? true : read(el, spec.attr);
+            break;
+        }
+    }
+    return out;
+});
+"""
+
 
 class LinkedInParser(BaseParser):
     """Parser for LinkedIn data extraction"""
@@ -64,9 +100,8 @@ class LinkedInParser(BaseParser):
                 urn_attr = ""
         return urn_attr.split(':')[-1] if urn_attr else ""
 
-    def _parse_company_url(self, element: WebElement) -> Optional[str]:
+    def _parse_company_url(self, company_link_elem: Optional[WebElement]) -> Optional[str]:
         """Extract company URL"""
-        company_link_elem = self._find_element_by_selectors(element, SELECTORS['company_link'])
         if not company_link_elem:
             return None
         url = company_link_elem.get_attribute('href')
@@ -83,28 +118,14 @@ class LinkedInParser(BaseParser):
         """Extract industry and location from combined text"""
         industry_elem = self._find_element_by_selectors(element, SELECTORS['company_industry'])
         if industry_elem:
-            text = industry_elem.text.strip()
-            if "•" in text:
-                parts = text.split("•")
-                industry = parts[0].strip()
-                location_text = parts[1].strip() if len(parts) > 1 else ""
-            else:
-                industry = text
-                location_text = ""
-        else:
-            industry = ""
-            location_text = ""
-        return industry, location_text
+            return self._split_industry_location(industry_elem.text.strip())
+        return "", ""
 
     @staticmethod
     def _parse_job_id(card: WebElement, job_url: str) -> str:
         """Extract job ID"""
         job_id = card.get_attribute('data-occludable-job-id')
-        if not job_id and '/view/' in job_url:
-            job_id = job_url.split('/view/')[1].split('/')[0].split('?')[0]
-        elif not job_id:
-            job_id = job_url.split('/')[-1].split('?')[0]
-        return job_id
+        return job_id or BaseParser._job_id_from_url(job_url)
 
     @staticmethod
     def _parse_job_title(job_link_elem: WebElement) -> str:
@@ -167,11 +188,11 @@ class LinkedInParser(BaseParser):
         CompanyData]:
         """Parse company data from search result element"""
         try:
-            company_url = self._parse_company_url(element)
+            company_link_elem = self._find_element_by_selectors(element, SELECTORS['company_link'])
+            company_url = self._parse_company_url(company_link_elem)
             if not company_url:
                 return None
 
-            company_link_elem = self._find_element_by_selectors(element, SELECTORS['company_link'])
             industry, location_text = self._parse_industry_location(element)
 
             return CompanyData(
@@ -216,12 +237,81 @@ class LinkedInParser(BaseParser):
             logger.debug(f"Error parsing job from search: {e}")
             return None
 
+    def parse_profiles_from_page(self, driver: WebDriver, elements: list[WebElement], keywords: str,
+                                 location: Optional[str] = None) -> list[ProfileData]:
+        """Parse all profile cards of a results page in a single WebDriver call"""
+        return self._parse_page(driver, elements, self.PROFILE_FIELDS, self._build_profile,
+                                self.parse_profile_from_search, keywords, location)
+
+    def parse_companies_from_page(self, driver: WebDriver, elements: list[WebElement], keywords: str,
+                                  location: Optional[str] = None) -> list[CompanyData]:
+        """Parse all company cards of a results page in a single WebDriver call"""
+        return self._parse_page(driver, elements, self.COMPANY_FIELDS, self._build_company,
+                                self.parse_company_from_search, keywords, location)
+
+    def parse_jobs_from_page(self, driver: WebDriver, cards: list[WebElement], keywords: str,
+                             location: Optional[str] = None) -> list[JobData]:
+        """Parse all job cards of a results page in a single WebDriver call"""
+        return self._parse_page(driver, cards, self.JOB_FIELDS, self._build_job,
+                                self.parse_job_from_search, keywords, location)
+
+    def parse_profile_keys(self, driver: Optional[WebDriver], elements: list[WebElement]) -> list[Optional[str]]:
+        """Extract only the profile URL of each card"""
+        return self._parse_keys(driver, elements, self.PROFILE_KEY_FIELDS, self._profile_key,
+                                self._parse_profile_url)
+
+    def parse_company_keys(self, driver: Optional[WebDriver], elements: list[WebElement]) -> list[Optional[str]]:
+        """Extract only the company URL of each card"""
+        return self._parse_keys(driver, elements, self.COMPANY_KEY_FIELDS, self._company_key,
+                                lambda element: self._parse_company_url(
+                                    self._find_element_by_selectors(element, SELECTORS['company_link'])))
+
+    def parse_job_keys(self, driver: Optional[WebDriver], cards: list[WebElement]) -> list[Optional[str]]:
+        """Extract only the job ID of each card"""
+        return self._parse_keys(driver, cards, self.JOB_KEY_FIELDS, self._job_key,
+                                lambda card: card.get_attribute('data-occludable-job-id') or self._parse_job_id(
+                                    card, card.find_element(By.CSS_SELECTOR, SELECTORS['job_link']).get_attribute('href')))
+
+    def _parse_keys(self, driver: Optional[WebDriver], elements: list[WebElement], plan: dict[str, dict[str, Any]],
+                    key_builder: Callable, fallback: Callable) -> list[Optional[str]]:
+        """Extract card keys in a single WebDriver call, or card by card without a driver or if the script fails"""
+        if driver is not None and elements:
+            try:
+                raw_cards = driver.execute_script(BATCH_EXTRACT_SCRIPT, elements, plan) or []
+                if len(raw_cards) == len(elements):
+                    return [key_builder(raw) for raw in raw_cards]
+            except Exception as e:
+                logger.debug(f"Error running batch key extraction: {e}, falling back to per-card parsing")
+
+        keys = []
+        for element in elements:
+            try:
+                keys.append(fallback(element))
+            except Exception:
+                keys.append(None)
+        return keys
+
+    def _parse_page(self, driver: WebDriver, elements: list[WebElement], plan: dict[str, dict[str, Any]],
+                    builder: Callable, fallback: Callable, keywords: str,
+                    location: Optional[str] = None) -> list[Any]:
+        """Run the batch extraction script over the cards and build models from the returned dicts"""
+        if not elements:
+            return []
+
+        try:
+            raw_cards = driver.execute_script(BATCH_EXTRACT_SCRIPT, elements, plan) or []
+        except Exception as e:
+            logger.debug(f"Error running batch extraction: {e}, falling back to per-card parsing")
+            return [item for item in (fallback(element, keywords, location) for element in elements) if item]
+
+        return self._build_models(raw_cards, builder, keywords, location)
+
     @staticmethod
     def save_to_json(data: Union[
         ProfileData, CompanyData, JobData,
         list[ProfileData], list[CompanyData], list[JobData]
     ]):
-        """Save parsed data to JSON files"""
+        """Save parsed data to the configured entity store"""
         os.makedirs(DATA_FOLDER, exist_ok=True)
 
         items = data if isinstance(data, list) else [data]
@@ -235,13 +325,6 @@ class LinkedInParser(BaseParser):
         file_name = file_map.get(data_type, SEARCH_RESULTS_FILE)
         file_path = os.path.join(DATA_FOLDER, file_name)
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            existing_data = []
-
-        existing_data.extend(item.__dict__ for item in items)
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, ensure_ascii=False, indent=2)
+        if items:
+            get_entity_store(file_path).upsert(items)
+            index_entities(items)
@@ -0,0 +1,331 @@
+"""Indexed queries over the stored profiles, companies and jobs.
+
+    python query_engine.py jobs --location Madrid --easy-apply --posted-after 2024-05-01
+    python query_engine.py companies --min-size 1000 --industry software
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel
+
+from base.base_storage import BaseEntityStore
+from config import QUERY_INDEX_PATH
+from models import EntityType
+from storage import get_entity_store
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_state (entity_type TEXT PRIMARY KEY, signature TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS people (
+    key TEXT PRIMARY KEY, connection_sent INTEGER, message_sent INTEGER, searched_at TEXT, data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS people_connection ON people (connection_sent, message_sent);
+CREATE TABLE IF NOT EXISTS companies (
+    key TEXT PRIMARY KEY, industry TEXT, size_min INTEGER, size_max INTEGER, searched_at TEXT, data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS companies_size ON companies (size_min);
+CREATE INDEX IF NOT EXISTS companies_industry ON companies (industry);
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY, company TEXT, easy_apply INTEGER, is_promoted INTEGER, posted_date TEXT,
+    searched_at TEXT, data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_posted ON jobs (easy_apply, posted_date);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+CREATE TABLE IF NOT EXISTS locations (entity_type TEXT, part TEXT, key TEXT);
+CREATE INDEX IF NOT EXISTS locations_part ON locations (entity_type, part);
+CREATE INDEX IF NOT EXISTS locations_key ON locations (entity_type, key);
+"""
+
+_RELATIVE_TIME = re.compile(r'(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago', re.IGNORECASE)
+_RELATIVE_UNITS = {'minute': 1 / 1440, 'hour': 1 / 24, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+_SIZE_RANGE = re.compile(r'([\d,.]+)\s*([KM]?)\s*(?:-\s*([\d,.]+)\s*([KM]?)|(\+))?\s*employees', re.IGNORECASE)
+
+
+def normalize_text(value: str | None) -> str:
+    """Lowercase and collapse whitespace"""
+    return ' '.join((value or '').lower().split())
+
+
+def normalize_location(location: str | None) -> list[str]:
+    """Split a location into normalized searchable parts: the full value and each comma-separated component"""
+    text = normalize_text(re.sub(r'\(.*?\)', '', location or ''))
+    if not text:
+        return []
+    parts = [part.strip() for part in text.split(',') if part.strip()]
+    return list(dict.fromkeys([', '.join(parts), *parts]))
+
+
+def normalize_posted_date(posted_datetime: str | None, posted_time: str | None, searched_at: str | None) -> str | None:
+    """Get the posting date as YYYY-MM-DD, falling back to relative text like '3 days ago'"""
+    if posted_datetime:
+        return posted_datetime[:10]
+
+    match = _RELATIVE_TIME.search(posted_time or '')
+    if not match or not searched_at:
+        return None
+    try:
+        searched = datetime.strptime(searched_at, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return None
+    days = int(match.group(1)) * _RELATIVE_UNITS[match.group(2).lower()]
+    return (searched - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def parse_company_size(company_size: str | None) -> tuple[int | None, int | None]:
+    """Parse '51-200 employees', '1K-5K employees' or '10K+ employees' into a (min, max) bucket"""
+    match = _SIZE_RANGE.search(company_size or '')
+    if not match:
+        return None, None
+
+    low = _parse_count(match.group(1), match.group(2))
+    if match.group(3):
+        return low, _parse_count(match.group(3), match.group(4))
+    return low, None if match.group(5) else low
+
+
+def _parse_count(number: str, suffix: str) -> int:
+    multiplier = {'K': 1_000, 'M': 1_000_000}.get(suffix.upper(), 1)
+    return int(float(number.replace(',', '')) * multiplier)
+
+
+class QueryEngine:
+    """Secondary indexes over the entity stores, kept in a SQLite side database"""
+
+    def __init__(self, index_path: str = QUERY_INDEX_PATH):
+        self.index_path = index_path
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def jobs(self, location: str | None = None, easy_apply: bool | None = None, posted_after: str | None = None,
+             posted_before: str | None = None, company: str | None = None,
+             limit: int | None = None) -> list[dict[str, Any]]:
+        """Find jobs by location, easy apply flag, posting date range and company"""
+        conditions, params = [], []
+        if easy_apply is not None:
+            conditions.append("easy_apply = ?")
+            params.append(int(easy_apply))
+        if posted_after:
+            conditions.append("posted_date >= ?")
+            params.append(posted_after)
+        if posted_before:
+            conditions.append("posted_date <= ?")
+            params.append(posted_before)
+        if company:
+            conditions.append("company = ?")
+            params.append(normalize_text(company))
+        return self._query(EntityType.JOBS.value, conditions, params, location, "posted_date DESC", limit)
+
+    def companies(self, location: str | None = None, min_size: int | None = None, max_size: int | None = None,
+                  industry: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        """Find companies by location, size bucket and industry"""
+        conditions, params = [], []
+        if min_size is not None:
+            conditions.append("size_min >= ?")
+            params.append(min_size)
+        if max_size is not None:
+            conditions.append("size_max <= ?")
+            params.append(max_size)
+        if industry:
+            conditions.append("industry = ?")
+            params.append(normalize_text(industry))
+        return self._query(EntityType.COMPANIES.value, conditions, params, location, "size_min DESC", limit)
+
+    def profiles(self, location: str | None = None, connection_sent: bool | None = None,
+                 message_sent: bool | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        """Find profiles by location and outreach status"""
+        conditions, params = [], []
+        if connection_sent is not None:
+            conditions.append("connection_sent = ?")
+            params.append(int(connection_sent))
+        if message_sent is not None:
+            conditions.append("message_sent = ?")
+            params.append(int(message_sent))
+        return self._query(EntityType.PEOPLE.value, conditions, params, location, "searched_at DESC", limit)
+
+    def refresh(self, entity_type: str) -> bool:
+        """Bring an entity type's index up to date if its store changed since the last refresh.
+        Writes made through the data writer are applied by apply_changes, so this rescan only runs for the
+        first build and for stores written some other way (backfill, legacy save paths).
+        Only records whose data differs from the indexed copy are rewritten, and keys that left the store are dropped"""
+        store = get_entity_store(EntityType(entity_type).data_file.full_path)
+        key_field = EntityType(entity_type).key_field
+        signature = json.dumps(store.signature())
+
+        with self._lock:
+            if self._signature(entity_type) == signature:
+                return False
+
+            indexed = dict(self._conn.execute(f"SELECT key, data FROM {entity_type}"))
+            changed: dict[str, dict[str, Any]] = {}
+            seen = set()
+            for record in store.iter_records():
+                key = record.get(key_field)
+                if not key:
+                    continue
+                seen.add(key)
+                if indexed.get(key) != json.dumps(record, ensure_ascii=False):
+                    changed[key] = record
+            removed = [key for key in indexed if key not in seen]
+            self._write(entity_type, changed, removed, signature)
+
+        logger.info(f"Re-indexed {len(changed)} changed and dropped {len(removed)} {entity_type} records")
+        return True
+
+    def apply_changes(self, entity_type: str, records: list[dict[str, Any]], patches: dict[str, dict[str, Any]],
+                      before: tuple, after: tuple) -> bool:
+        """Index records saved and fields patched by one store write, without rescanning the store.
+        Applied only if the index matched the store signature before the write; otherwise the next refresh rescans"""
+        key_field = EntityType(entity_type).key_field
+        with self._lock:
+            if self._signature(entity_type) != json.dumps(before):
+                return False
+
+            changed = {record[key_field]: record for record in records if record.get(key_field)}
+            for key, fields in patches.items():
+                if key not in changed:
+                    row = self._conn.execute(f"SELECT data FROM {entity_type} WHERE key = ?", (key,)).fetchone()
+                    changed[key] = json.loads(row[0]) if row else {key_field: key}
+                changed[key] = {**changed[key], **fields}
+            self._write(entity_type, changed, [], json.dumps(after))
+        return True
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _signature(self, entity_type: str) -> str | None:
+        """Store signature the index was last brought up to date with"""
+        row = self._conn.execute("SELECT signature FROM index_state WHERE entity_type = ?", (entity_type,)).fetchone()
+        return row[0] if row else None
+
+    def _write(self, entity_type: str, changed: dict[str, dict[str, Any]], removed: list[str], signature: str) -> None:
+        """Replace the index rows of changed records, drop removed keys and record the store signature"""
+        rows = [self._index_row(entity_type, key, record) for key, record in changed.items()]
+        location_rows = [(entity_type, part, key) for key, record in changed.items()
+                         for part in normalize_location(record.get('location'))]
+        with self._conn:
+            self._conn.executemany("DELETE FROM locations WHERE entity_type = ? AND key = ?",
+                                   [(entity_type, key) for key in [*changed, *removed]])
+            self._conn.executemany(f"DELETE FROM {entity_type} WHERE key = ?", [(key,) for key in removed])
+            if rows:
+                placeholders = ','.join('?' * len(rows[0]))
+                self._conn.executemany(f"INSERT OR REPLACE INTO {entity_type} VALUES ({placeholders})", rows)
+            self._conn.executemany("INSERT INTO locations VALUES (?, ?, ?)", location_rows)
+            self._conn.execute("INSERT OR REPLACE INTO index_state VALUES (?, ?)", (entity_type, signature))
+
+    @staticmethod
+    def _index_row(entity_type: str, key: str, record: dict[str, Any]) -> tuple:
+        """Build the normalized index columns for a record"""
+        data = json.dumps(record, ensure_ascii=False)
+        searched_at = record.get('searched_at')
+        if entity_type == EntityType.JOBS.value:
+            posted_date = normalize_posted_date(record.get('posted_datetime'), record.get('posted_time'), searched_at)
+            return (key, normalize_text(record.get('company')), int(bool(record.get('easy_apply'))),
+                    int(bool(record.get('is_promoted'))), posted_date, searched_at, data)
+        if entity_type == EntityType.COMPANIES.value:
+            size_min, size_max = parse_company_size(record.get('company_size'))
+            return key, normalize_text(record.get('industry')), size_min, size_max, searched_at, data
+        return (key, int(bool(record.get('connection_sent'))), int(bool(record.get('message_sent'))),
+                searched_at, data)
+
+    def _query(self, entity_type: str, conditions: list[str], params: list[Any], location: str | None,
+               order_by: str, limit: int | None) -> list[dict[str, Any]]:
+        self.refresh(entity_type)
+
+        if location:
+            # Every component of the requested location must match, e.g. "Madrid, Spain"
+            location_parts = normalize_location(location)
+            for part in location_parts[1:] or location_parts:
+                conditions.append("key IN (SELECT key FROM locations WHERE entity_type = ? AND part = ?)")
+                params.extend([entity_type, part])
+
+        sql = f"SELECT data FROM {entity_type}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order_by}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+
+_engine: QueryEngine | None = None
+
+
+def get_query_engine() -> QueryEngine:
+    """Get the shared query engine instance"""
+    global _engine
+    if _engine is None:
+        _engine = QueryEngine()
+    return _engine
+
+
+def index_changes(filepath: str, store: BaseEntityStore, before: tuple, entities: list[BaseModel],
+                  patches: dict[tuple[str, str], dict[str, Any]]) -> bool:
+    """Apply a write to one of the entity data files to the query index once one has been built.
+    Index errors are logged and never fail the write"""
+    if _engine is None and not os.path.exists(QUERY_INDEX_PATH):
+        return False
+    filepath = os.path.abspath(filepath)
+    entity_type = next((entity_type for entity_type in EntityType
+                        if os.path.abspath(entity_type.data_file.full_path) == filepath), None)
+    if entity_type is None or not (entities or patches):
+        return False
+    try:
+        return get_query_engine().apply_changes(entity_type.value, [entity.dict() for entity in entities],
+                                                {key: fields for (_, key), fields in patches.items()},
+                                                before, store.signature())
+    except Exception as e:
+        logger.warning(f"Error updating query index: {e}")
+        return False
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Query stored LinkedIn data through secondary indexes")
+    subparsers = arg_parser.add_subparsers(dest='entity_type', required=True)
+
+    jobs_parser = subparsers.add_parser('jobs')
+    jobs_parser.add_argument('--location')
+    jobs_parser.add_argument('--easy-apply', action=argparse.BooleanOptionalAction, default=None)
+    jobs_parser.add_argument('--posted-after', help="YYYY-MM-DD")
+    jobs_parser.add_argument('--posted-before', help="YYYY-MM-DD")
+    jobs_parser.add_argument('--company')
+    jobs_parser.add_argument('--limit', type=int)
+
+    companies_parser = subparsers.add_parser('companies')
+    companies_parser.add_argument('--location')
+    companies_parser.add_argument('--min-size', type=int, help="Minimum employee count of the size bucket")
+    companies_parser.add_argument('--max-size', type=int, help="Maximum employee count of the size bucket")
+    companies_parser.add_argument('--industry')
+    companies_parser.add_argument('--limit', type=int)
+
+    people_parser = subparsers.add_parser('people')
+    people_parser.add_argument('--location')
+    people_parser.add_argument('--connection-sent', action=argparse.BooleanOptionalAction, default=None)
+    people_parser.add_argument('--message-sent', action=argparse.BooleanOptionalAction, default=None)
+    people_parser.add_argument('--limit', type=int)
+
+    args = vars(arg_parser.parse_args())
+    entity_type = args.pop('entity_type')
+
+    engine = QueryEngine()
+    query_methods = {'jobs': engine.jobs, 'companies': engine.companies, 'people': engine.profiles}
+    for record in query_methods[entity_type](**args):
+        print(json.dumps(record, ensure_ascii=False))
+    engine.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Compact in-memory records for bulk-loading large data files.
+
+    records = load_compact(get_entity_store(DataFile.PROFILES.full_path), ProfileData)
+    pending = [record for record in records if not record.connection_sent]
+    model = pending[0].to_model()
+"""
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+from base.base_storage import BaseEntityStore
+from models import ProfileData, CompanyData, JobData
+
+# Strings repeated across many records; one shared copy is kept per distinct value
+INTERNED_FIELDS = frozenset({
+    'searched_at', 'search_keywords', 'search_location', 'location', 'industry', 'company_size', 'company',
+    'current_company', 'posted_time', 'posted_datetime', 'connection_sent_at',
+})
+
+
+class Interner:
+    """Deduplicates equal strings; scoped to a load so the pool is freed with the records"""
+
+    def __init__(self):
+        self._pool: dict[str, str] = {}
+
+    def __call__(self, value: Any) -> Any:
+        if value.__class__ is not str:
+            return value
+        return self._pool.setdefault(value, value)
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+
+class CompactRecord:
+    """Slotted record holding a model's fields; unknown fields go to a lazily created dict"""
+    __slots__ = ('_extra',)
+    model: type[BaseModel] = BaseModel
+    fields: tuple[str, ...] = ()
+    defaults: tuple[Any, ...] = ()
+    key_field: str = ''
+
+    def __init__(self, record: dict[str, Any], intern: Interner | None = None):
+        for name, default in zip(self.fields, self.defaults):
+            value = record.get(name, default)
+            if intern is not None and name in INTERNED_FIELDS:
+                value = intern(value)
+            setattr(self, name, value)
+
+        extra = {name: value for name, value in record.items() if name not in self.fields}
+        self._extra = extra or None
+
+    @property
+    def key(self) -> Any:
+        return getattr(self, self.key_field)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self.fields:
+            return getattr(self, name)
+        return (self._extra or {}).get(name, default)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.fields}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def to_model(self) -> BaseModel:
+        """Build the full pydantic model on demand; missing fields fall back to the model defaults"""
+        data = {name: getattr(self, name) for name in self.fields if getattr(self, name) is not None}
+        if self._extra:
+            data.update(self._extra)
+        return self.model(**data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.key_field}={self.key!r})"
+
+
+def compact_record_class(model: type[BaseModel], key_field: str) -> type[CompactRecord]:
+    """Create a slotted record class with one slot per declared model field"""
+    fields = tuple(model.__fields__)
+    return type(f"{model.__name__}Record", (CompactRecord,), {
+        '__slots__': fields,
+        'model': model,
+        'fields': fields,
+        'defaults': tuple(_field_default(field) for field in model.__fields__.values()),
+        'key_field': key_field,
+    })
+
+
+def _field_default(field: Any) -> Any:
+    """Static default of a model field; required fields and default factories (searched_at) give None"""
+    if getattr(field, 'default_factory', None):
+        return None
+    is_required = getattr(field, 'is_required', None)
+    required = is_required() if callable(is_required) else getattr(field, 'required', False)
+    return None if required else field.default
+
+
+ProfileRecord = compact_record_class(ProfileData, 'profile_url')
+CompanyRecord = compact_record_class(CompanyData, 'company_url')
+JobRecord = compact_record_class(JobData, 'job_id')
+
+RECORD_CLASSES: dict[type[BaseModel], type[CompactRecord]] = {
+    ProfileData: ProfileRecord,
+    CompanyData: CompanyRecord,
+    JobData: JobRecord,
+}
+
+
+def compact_records(records: Iterable[dict[str, Any]], model: type[BaseModel],
+                    intern: Interner | None = None) -> list[CompactRecord]:
+    """Convert record dicts into compact records, sharing repeated strings"""
+    record_class = RECORD_CLASSES[model]
+    intern = intern if intern is not None else Interner()
+    return [record_class(record, intern) for record in records]
+
+
+def load_compact(store: BaseEntityStore, model: type[BaseModel], batch_size: int = 1000) -> list[CompactRecord]:
+    """Bulk-load a store into compact records without building pydantic models.
+    Records are converted as the store streams them, so peak memory stays close to the compact result;
+    the json backend cannot stream and decodes its whole array first"""
+    return compact_records(store.iter_records(batch_size), model)
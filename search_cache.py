@@ -0,0 +1,95 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from config import SEARCH_CACHE_PATH, SEARCH_CACHE_TTL, SEARCH_CACHE_MAX_MB
+from serialization import get_line_codec
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY, created_at REAL NOT NULL, accessed_at REAL NOT NULL,
+    complete INTEGER NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at);
+"""
+
+
+class SearchResultCache:
+    """Persistent cache of parsed search result pages keyed by (entity type, keywords, location, page).
+    Entries expire after ttl seconds; once the cache grows past max_bytes the least recently used go first"""
+
+    def __init__(self, path: str = SEARCH_CACHE_PATH, ttl: float = SEARCH_CACHE_TTL,
+                 max_bytes: int = SEARCH_CACHE_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.codec = get_line_codec()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def get(self, entity_type: str, keywords: str, location: str | None, page: int,
+            complete: bool = False) -> list[dict[str, Any]] | None:
+        """Get the cached records of a page, or None on a miss.
+        With complete=True only pages cached with every card parsed count as a hit"""
+        key = self._key(entity_type, keywords, location, page)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT created_at, complete, data FROM pages WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            created_at, is_complete, data = row
+            if now - created_at > self.ttl:
+                with self._conn:
+                    self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+                return None
+            if complete and not is_complete:
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (now, key))
+        return self.codec.decode(data)
+
+    def put(self, entity_type: str, keywords: str, location: str | None, page: int,
+            records: list[dict[str, Any]], complete: bool) -> None:
+        """Cache the records of a page; complete means no card on the page was skipped"""
+        key = self._key(entity_type, keywords, location, page)
+        data = self.codec.encode(records)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                               (key, now, now, int(complete), len(data), data))
+            self._evict(now)
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones until the cache fits max_bytes"""
+        self._conn.execute("DELETE FROM pages WHERE created_at < ?", (now - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM pages ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.debug(f"Evicted {evicted} cached search pages")
+
+    @staticmethod
+    def _key(entity_type: str, keywords: str, location: str | None, page: int) -> str:
+        normalize = lambda value: ' '.join((value or '').lower().split())
+        return json.dumps([entity_type, normalize(keywords), normalize(location), page])
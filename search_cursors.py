@@ -0,0 +1,66 @@
+import json
+import logging
+import os
+import threading
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from config import SEARCH_CURSORS_PATH, QUERY_WATERMARKS_PATH
+from models import QueryWatermark, SearchCursor
+from serialization import get_codec
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+
+class QueryStateStore(Generic[T]):
+    """Persists one record per search query (entity type, keywords, location) in a single file"""
+
+    def __init__(self, model: type[T], path: str):
+        self.model = model
+        self.codec = get_codec('json', pretty=True)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def get(self, entity_type: str, keywords: str, location: str | None) -> T | None:
+        with self._lock:
+            data = self._read().get(self._key(entity_type, keywords, location))
+        return self.model(**data) if data else None
+
+    def save(self, state: T) -> None:
+        with self._lock:
+            states = self._read()
+            states[self._key(state.entity_type, state.keywords, state.location)] = state.dict()
+            self.codec.dump(states, self.path)
+
+    def delete(self, entity_type: str, keywords: str, location: str | None) -> None:
+        with self._lock:
+            states = self._read()
+            if states.pop(self._key(entity_type, keywords, location), None) is not None:
+                self.codec.dump(states, self.path)
+
+    def _read(self) -> dict[str, dict]:
+        if not os.path.exists(self.path):
+            return {}
+        return self.codec.load(self.path)
+
+    @staticmethod
+    def _key(entity_type: str, keywords: str, location: str | None) -> str:
+        normalize = lambda value: ' '.join((value or '').lower().split())
+        return json.dumps([entity_type, normalize(keywords), normalize(location)])
+
+
+class SearchCursorStore(QueryStateStore[SearchCursor]):
+    """Cursors of unfinished searches"""
+
+    def __init__(self, path: str = SEARCH_CURSORS_PATH):
+        super().__init__(SearchCursor, path)
+
+
+class QueryWatermarkStore(QueryStateStore[QueryWatermark]):
+    """Keys already returned by each standing query"""
+
+    def __init__(self, path: str = QUERY_WATERMARKS_PATH):
+        super().__init__(QueryWatermark, path)
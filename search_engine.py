@@ -1,39 +1,25 @@
 import asyncio
 import logging
 import random
-from enum import Enum
-from pathlib import Path
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable
 from urllib.parse import quote
 
 from selenium.webdriver.common.by import By
 from undetected_chromedriver import WebElement
 
 from base.base_search_engine import BaseSearchEngine
-from config import LINKEDIN_URL, SELECTORS, DATA_FOLDER
-from models import CompanyData, ProfileData, JobData
+from config import (LINKEDIN_URL, SELECTORS, BATCH_EXTRACTION, SKIP_KNOWN_ENTITIES, RESUME_SEARCHES,
+                    INCREMENTAL_CRAWL, INCREMENTAL_STOP_PAGES, RESULTS_READY_TIMEOUT, RESULTS_RETRY_TIMEOUT)
+from models import BaseData, CompanyData, ProfileData, JobData, QueryWatermark, EntityType, DataFile
+from selector_engine import selector_engine
+from storage import get_entity_store
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class EntityType(Enum):
-    """Enum for LinkedIn search entity types"""
-    PEOPLE = "people"
-    COMPANIES = "companies"
-    JOBS = "jobs"
-
-
-class DataFile(Enum):
-    """Enum for data file paths with descriptive names"""
-    PROFILES = "profiles.json"
-    COMPANIES = "companies.json"
-    JOBS = "jobs.json"
-
-    @property
-    def full_path(self) -> str:
-        """Get full file path"""
-        return str(Path(DATA_FOLDER) / self.value)
+# Job cards LinkedIn shows per results page, used to address later pages through the start parameter
+JOBS_PAGE_SIZE = 25
 
 
 class LinkedInSearchEngine(BaseSearchEngine):
@@ -42,146 +28,298 @@ class LinkedInSearchEngine(BaseSearchEngine):
     async def search_people(self, keywords: str, location: str | None = None, max_results: int = 50) -> list[
         ProfileData]:
         """Search for people on LinkedIn"""
-        logger.info(f"Starting people search: keywords='{keywords}', location='{location}', max_results={max_results}")
-
-        results = await self.search_entities(
-            entity_type=EntityType.PEOPLE,
-            keywords=keywords,
-            location=location,
-            max_results=max_results,
-        )
-
-        await self.save_results(results, DataFile.PROFILES)
+        results = [profile async for profile in self.iter_people(keywords, location, max_results)]
         logger.info(f"Completed people search: found {len(results)} profiles")
         return results
 
     async def search_companies(self, keywords: str, location: str | None = None, max_results: int = 50) -> list[
         CompanyData]:
         """Search for companies on LinkedIn"""
-        logger.info(f"Starting company search: keywords='{keywords}', location='{location}', max_results={max_results}")
-
-        results = await self.search_entities(
-            entity_type=EntityType.COMPANIES,
-            keywords=keywords,
-            location=location,
-            max_results=max_results,
-        )
-
-        await self.save_results(results, DataFile.COMPANIES)
+        results = [company async for company in self.iter_companies(keywords, location, max_results)]
         logger.info(f"Completed company search: found {len(results)} companies")
         return results
 
     async def search_jobs(self, keywords: str, location: str | None = None, max_results: int = 50) -> list[JobData]:
         """Search for jobs on LinkedIn"""
+        return [job async for job in self.iter_jobs(keywords, location, max_results)]
+
+    async def search_entities(self, entity_type: EntityType, keywords: str,
+                              location: str | None = None, max_results: int = 50) -> list[Any]:
+        """Generic search method for different entity types"""
+        return [item async for item in self.iter_entities(entity_type, keywords, location, max_results)]
+
+    async def iter_people(self, keywords: str, location: str | None = None,
+                          max_results: int = 50) -> AsyncIterator[ProfileData]:
+        """Stream people search results, saving each page to the profiles file"""
+        async for profile in self.iter_entities(EntityType.PEOPLE, keywords, location, max_results,
+                                                data_file=DataFile.PROFILES):
+            yield profile
+
+    async def iter_companies(self, keywords: str, location: str | None = None,
+                             max_results: int = 50) -> AsyncIterator[CompanyData]:
+        """Stream company search results, saving each page to the companies file"""
+        async for company in self.iter_entities(EntityType.COMPANIES, keywords, location, max_results,
+                                                data_file=DataFile.COMPANIES):
+            yield company
+
+    async def iter_jobs(self, keywords: str, location: str | None = None, max_results: int = 50,
+                        data_file: DataFile | None = DataFile.JOBS,
+                        skip_known: bool = SKIP_KNOWN_ENTITIES,
+                        resume: bool = RESUME_SEARCHES,
+                        incremental: bool = INCREMENTAL_CRAWL) -> AsyncIterator[JobData]:
+        """Stream job search results as they are parsed, saving each page to the jobs file"""
         if not self.automation.logged_in:
             logger.error("Cannot search jobs: not logged in!")
-            return []
+            return
 
         logger.info(f"Starting job search: keywords='{keywords}', location='{location}', max_results={max_results}")
 
+        page_results: list[JobData] = []
+        processed_ids: set[str] = set()
+        returned_keys: list[str] = []
+        watermark = None
         try:
-            search_url = f"{LINKEDIN_URL}/jobs/search/?keywords={quote(keywords)}"
-            if location:
-                search_url += f"&location={quote(location)}"
-
-            logger.debug(f"Navigating to job search URL: {search_url}")
-            self.driver.get(search_url)
-            await asyncio.sleep(random.uniform(3, 5))
-
-            results = []
-            processed_ids = set()
-            page = 1
+            cursor = await self.load_cursor(EntityType.JOBS, keywords, location, resume)
+            found = cursor.found
+            page = cursor.page + 1
+            processed_ids.update(cursor.seen_ids)
+            known = await self._load_known_keys(EntityType.JOBS, data_file, skip_known)
+            if incremental:
+                watermark = await self.load_watermark(EntityType.JOBS, keywords, location)
+                known = (known if known is not None else set()) | set(watermark.keys)
+            empty_pages = 0
+            stopped = False
+
+            # Leading pages still in the search cache are served without touching the browser
+            while found < max_results:
+                page_start_found = found
+                cached_jobs = await self.get_cached_page(EntityType.JOBS, keywords, location, page, known is None)
+                if cached_jobs is None:
+                    break
+                for job_data in cached_jobs:
+                    if found >= max_results:
+                        break
+                    if job_data.job_id in processed_ids or (known is not None and job_data.job_id in known):
+                        continue
+                    processed_ids.add(job_data.job_id)
+                    if known is not None:
+                        known.add(job_data.job_id)
+                    page_results.append(job_data)
+                    found += 1
+                    returned_keys.append(job_data.job_id)
+                    yield job_data
+
+                await self._flush_page(page_results, data_file)
+                await self.save_cursor(cursor, page, found, processed_ids)
+                logger.info(f"Page {page} served from cache: {found} total jobs found")
+                empty_pages = empty_pages + 1 if found == page_start_found else 0
+                if found >= max_results or (stopped := self._stop_incremental(watermark, empty_pages)):
+                    break
+                page += 1
 
-            while len(results) < max_results:
-                logger.info(f"Processing job search page {page}... (found {len(results)}/{max_results} jobs so far)")
+            if found < max_results and not stopped:
+                search_url = self._search_url(EntityType.JOBS, keywords, location, page)
+                logger.debug(f"Navigating to job search URL: {search_url}")
+                await self.browser.get(search_url)
+                await asyncio.sleep(random.uniform(3, 5))
+
+            # page is the real results page (start offset); scrolling or 'See more' stays on the same page,
+            # whose jobs are collected in page_jobs and cached once the page is done. Cards are tracked by
+            # job ID (data-occludable-job-id), since occluded cards re-render and shift positions in the list
+            job_cards = await self._get_job_cards() if found < max_results and not stopped else []
+            handled_ids: set[str] = set()
+            page_jobs: list[JobData] = []
+            while found < max_results and not stopped:
+                logger.info(f"Processing job search page {page}... (found {found}/{max_results} jobs so far)")
+                page_start_found = found
 
-                job_cards = await self._get_job_cards()
                 if not job_cards:
                     logger.warning(f"No job cards found on page {page}")
                     break
 
-                logger.debug(f"Found {len(job_cards)} job cards on page {page}")
-
-                for i, card in enumerate(job_cards, 1):
-                    if len(results) >= max_results:
+                await self.archive_page(EntityType.JOBS, keywords, location, page)
+
+                # Read only the job IDs first; full extraction runs once per unseen card
+                card_ids = await self.browser.run(self.parser.parse_job_keys,
+                                                  self.driver if BATCH_EXTRACTION else None, job_cards)
+                fresh = [(card, job_id) for card, job_id in zip(job_cards, card_ids) if not job_id or job_id not in handled_ids]
+                handled_ids.update(job_id for _, job_id in fresh if job_id)
+                fresh_cards = [card for card, _ in fresh]
+                logger.debug(f"Found {len(job_cards)} job cards on page {page}, {len(fresh_cards)} not seen yet")
+                # Jobs already returned by this search are still parsed so page_jobs holds the whole page
+                # for the cache; they are not yielded again
+                new_cards = [card for card, job_id in fresh if not job_id or known is None or job_id not in known]
+                if len(new_cards) < len(fresh_cards):
+                    logger.info(f"Skipped {len(fresh_cards) - len(new_cards)} already stored job cards")
+                parsed_jobs = await self.browser.run(self._parse_cards, EntityType.JOBS, new_cards, keywords, location)
+                page_jobs.extend(job_data for job_data in parsed_jobs if job_data)
+
+                for i, job_data in enumerate(parsed_jobs, 1):
+                    if found >= max_results:
                         break
 
-                    job_data = self.parser.parse_job_from_search(card, keywords, location)
                     if job_data and job_data.job_id not in processed_ids:
                         processed_ids.add(job_data.job_id)
-                        results.append(job_data)
+                        if known is not None:
+                            known.add(job_data.job_id)
+                        page_results.append(job_data)
+                        found += 1
                         logger.debug(f"Page {page}, Card {i}: Found job '{job_data.title}' at '{job_data.company}'")
+                        returned_keys.append(job_data.job_id)
+                        yield job_data
 
-                logger.info(f"Page {page} processed: {len(results)} total jobs found")
+                await self._flush_page(page_results, data_file)
+                # Scroll batches stay on the same results page, so only the previous page counts as done:
+                # a resumed search reopens this page (start offset) and skips the processed IDs
+                await self.save_cursor(cursor, page - 1, found, processed_ids)
+                logger.info(f"Page {page} processed: {found} total jobs found")
 
-                if not await self._load_more_jobs(len(job_cards)):
+                empty_pages = empty_pages + 1 if found == page_start_found else 0
+                if found >= max_results or self._stop_incremental(watermark, empty_pages):
+                    break
+
+                more = await self._load_more_jobs(job_cards)
+                if more is None or not more[1]:
+                    # The results page is exhausted: it can be served from the cache next time
+                    await self.cache_page(EntityType.JOBS, keywords, location, page, page_jobs, complete=known is None)
+                    page_jobs = []
+                if more is None:
                     logger.info(f"No more job pages available after page {page}")
                     break
 
-                page += 1
+                job_cards, extends = more
+                if not extends:
+                    handled_ids.clear()
+                    page += 1
 
-            await self.save_results(results, DataFile.JOBS)
-            logger.info(f"Completed job search: found {len(results)} jobs across {page} pages")
-            return results
+            await self.clear_cursor(cursor)
+            selector_engine.log_stats()
+            logger.info(f"Completed job search: found {found} jobs across {page} pages")
 
+        except GeneratorExit:
+            # The consumer stopped early: nothing is left to resume, unlike after an error
+            await self.clear_cursor(cursor)
+            raise
         except Exception as e:
             logger.error(f"Error during job search: {e}")
-            return []
-
-    async def search_entities(self, entity_type: EntityType, keywords: str,
-                              location: str | None = None, max_results: int = 50) -> list[Any]:
-        """Generic search method for different entity types"""
+        finally:
+            await self._flush_page(page_results, data_file)
+            if watermark is not None:
+                await self.save_watermark(watermark, returned_keys)
+
+    async def iter_entities(self, entity_type: EntityType, keywords: str, location: str | None = None,
+                            max_results: int = 50, data_file: DataFile | None = None,
+                            skip_known: bool = SKIP_KNOWN_ENTITIES,
+                            resume: bool = RESUME_SEARCHES,
+                            incremental: bool = INCREMENTAL_CRAWL) -> AsyncIterator[Any]:
+        """Stream search results as they are parsed, optionally saving each page to a data file"""
         if not self.automation.logged_in:
             logger.error(f"Cannot search {entity_type.value}: not logged in!")
-            return []
+            return
 
+        page_results: list[Any] = []
+        seen_ids: set[str] = set()
+        returned_keys: list[str] = []
+        watermark = None
         try:
             logger.info(
                 f"Starting {entity_type.value} search: keywords='{keywords}', location='{location}', max_results={max_results}")
 
-            search_url = f"{LINKEDIN_URL}/search/results/{entity_type.value}/?keywords={quote(keywords)}"
-            if location:
-                search_url += f"&geoUrn={location}"
+            cursor = await self.load_cursor(entity_type, keywords, location, resume)
+            found = cursor.found
+            page = cursor.page + 1
+            seen_ids.update(cursor.seen_ids)
+
+            known = await self._load_known_keys(entity_type, data_file, skip_known)
+            if incremental:
+                watermark = await self.load_watermark(entity_type, keywords, location)
+                known = (known if known is not None else set()) | set(watermark.keys)
+            empty_pages = 0
+            stopped = False
+
+            # Leading pages still in the search cache are served without touching the browser
+            while found < max_results:
+                page_start_found = found
+                cached_items = await self.get_cached_page(entity_type, keywords, location, page, known is None)
+                if cached_items is None:
+                    break
+                for item in cached_items:
+                    if found >= max_results:
+                        break
+                    if item.get_key_value() in seen_ids:
+                        continue
+                    seen_ids.add(item.get_key_value())
+                    if known is not None:
+                        if item.get_key_value() in known:
+                            continue
+                        known.add(item.get_key_value())
+                    page_results.append(item)
+                    found += 1
+                    returned_keys.append(item.get_key_value())
+                    yield item
+
+                await self._flush_page(page_results, data_file)
+                await self.save_cursor(cursor, page, found, seen_ids)
+                logger.info(f"Page {page} served from cache: {found} total results")
+                empty_pages = empty_pages + 1 if found == page_start_found else 0
+                if found >= max_results or (stopped := self._stop_incremental(watermark, empty_pages)):
+                    break
+                page += 1
 
-            logger.debug(f"Navigating to search URL: {search_url}")
-            self.driver.get(search_url)
-            await asyncio.sleep(random.uniform(3, 5))
+            if found < max_results and not stopped:
+                search_url = self._search_url(entity_type, keywords, location, page)
+                logger.debug(f"Navigating to search URL: {search_url}")
+                await self.browser.get(search_url)
+                await asyncio.sleep(random.uniform(3, 5))
 
-            results = []
-            page = 1
-            parser_method = self._get_parser_method(entity_type)
-            while len(results) < max_results:
+            while found < max_results and not stopped:
                 logger.info(
-                    f"Processing {entity_type.value} search page {page}... (found {len(results)}/{max_results} results so far)")
+                    f"Processing {entity_type.value} search page {page}... (found {found}/{max_results} results so far)")
+                page_start_found = found
 
                 elements = await self.get_search_results('search_results')
 
                 if not elements:
                     logger.warning(f"No elements found on page {page}, trying scroll and retry...")
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    await asyncio.sleep(2)
-                    elements = await self.get_search_results('search_results')
+                    await self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    elements = await self.get_search_results('search_results', RESULTS_RETRY_TIMEOUT)
 
                     if not elements:
                         logger.warning(f"Still no elements found on page {page}, ending search")
                         break
 
                 logger.debug(f"Found {len(elements)} elements to parse on page {page}")
+                await self.archive_page(entity_type, keywords, location, page)
+
+                new_elements = await self._filter_known(entity_type, elements, known) if known is not None else elements
+                page_items = await self.browser.run(self._parse_cards, entity_type, new_elements, keywords, location)
+                await self.cache_page(entity_type, keywords, location, page, page_items, complete=known is None)
 
                 parsed_count = 0
-                for i, element in enumerate(elements, 1):
-                    if len(results) >= max_results:
+                for i, parsed_data in enumerate(page_items, 1):
+                    if found >= max_results:
                         break
 
-                    parsed_data = parser_method(element, keywords, location)
-                    if parsed_data:
-                        results.append(parsed_data)
+                    if parsed_data and parsed_data.get_key_value() not in seen_ids:
+                        seen_ids.add(parsed_data.get_key_value())
+                        if known is not None:
+                            known.add(parsed_data.get_key_value())
+                        page_results.append(parsed_data)
                         parsed_count += 1
+                        found += 1
                         logger.debug(
-                            f"Page {page}, Element {i}: Successfully parsed {entity_type.value} result #{len(results)}")
+                            f"Page {page}, Element {i}: Successfully parsed {entity_type.value} result #{found}")
+                        returned_keys.append(parsed_data.get_key_value())
+                        yield parsed_data
 
+                await self._flush_page(page_results, data_file)
+                await self.save_cursor(cursor, page, found, seen_ids)
                 logger.info(
-                    f"Page {page} processed: {parsed_count}/{len(elements)} elements parsed successfully, {len(results)} total results")
+                    f"Page {page} processed: {parsed_count}/{len(new_elements)} new elements parsed successfully, {found} total results")
+
+                empty_pages = empty_pages + 1 if found == page_start_found else 0
+                if found >= max_results or self._stop_incremental(watermark, empty_pages):
+                    break
 
                 if not await self._go_to_next_page():
                     logger.info(f"No more pages available after page {page}")
@@ -189,25 +327,89 @@ class LinkedInSearchEngine(BaseSearchEngine):
 
                 page += 1
 
-            logger.info(f"Completed {entity_type.value} search: found {len(results)} results across {page} pages")
-            return results
+            await self.clear_cursor(cursor)
+            selector_engine.log_stats()
+            logger.info(f"Completed {entity_type.value} search: found {found} results across {page} pages")
 
+        except GeneratorExit:
+            # The consumer stopped early: nothing is left to resume, unlike after an error
+            await self.clear_cursor(cursor)
+            raise
         except Exception as e:
             logger.error(f"Error searching {entity_type.value}: {e}")
-            return []
+        finally:
+            await self._flush_page(page_results, data_file)
+            if watermark is not None:
+                await self.save_watermark(watermark, returned_keys)
+
+    @staticmethod
+    def _stop_incremental(watermark: QueryWatermark | None, empty_pages: int) -> bool:
+        """In incremental mode, stop paginating after INCREMENTAL_STOP_PAGES pages without new results"""
+        if watermark is None or empty_pages < INCREMENTAL_STOP_PAGES:
+            return False
+        logger.info(f"No new results on the last {empty_pages} pages, stopping incremental crawl")
+        return True
 
-    async def get_search_results(self, selector_key: str) -> list[WebElement]:
-        """Get search result elements with multiple selector strategies"""
+    @staticmethod
+    def _search_url(entity_type: EntityType, keywords: str, location: str | None, page: int = 1) -> str:
+        """Build the search URL, pointing directly at a later results page when page > 1"""
+        if entity_type == EntityType.JOBS:
+            search_url = f"{LINKEDIN_URL}/jobs/search/?keywords={quote(keywords)}"
+            if location:
+                search_url += f"&location={quote(location)}"
+            if page > 1:
+                search_url += f"&start={(page - 1) * JOBS_PAGE_SIZE}"
+            return search_url
+
+        search_url = f"{LINKEDIN_URL}/search/results/{entity_type.value}/?keywords={quote(keywords)}"
+        if location:
+            search_url += f"&geoUrn={location}"
+        if page > 1:
+            search_url += f"&page={page}"
+        return search_url
+
+    async def _load_known_keys(self, entity_type: EntityType, data_file: DataFile | None,
+                               skip_known: bool) -> set[str] | None:
+        """Load the stored keys of the data file, used to skip known cards before full parsing"""
+        if not skip_known or not data_file:
+            return None
+        try:
+            store = get_entity_store(data_file.full_path)
+            known = await asyncio.to_thread(store.keys, entity_type.key_field)
+        except Exception as e:
+            logger.warning(f"Could not load stored {entity_type.value} keys, parsing every card: {e}")
+            return None
+        logger.debug(f"Loaded {len(known)} stored {entity_type.value} keys")
+        return known
+
+    async def _filter_known(self, entity_type: EntityType, elements: list[WebElement],
+                            known: set[str]) -> list[WebElement]:
+        """Keep only cards whose key is not stored yet; cards without a readable key are kept"""
+        keys = await self.browser.run(self._get_key_parser_method(entity_type),
+                                      self.driver if BATCH_EXTRACTION else None, elements)
+        new_elements = [element for element, key in zip(elements, keys) if not key or key not in known]
+        if len(new_elements) < len(elements):
+            logger.info(f"Skipped {len(elements) - len(new_elements)} already stored {entity_type.value} cards")
+        return new_elements
+
+    async def _flush_page(self, page_results: list[Any], data_file: DataFile | None) -> None:
+        """Save and release the results buffered for the current page"""
+        if data_file and page_results:
+            await self.save_results(page_results, data_file)
+        page_results.clear()
+
+    async def get_search_results(self, selector_key: str, timeout: float = RESULTS_READY_TIMEOUT) -> list[WebElement]:
+        """Get search result elements with multiple selector strategies, once the result cards have rendered"""
         try:
-            await asyncio.sleep(2)
             selectors = SELECTORS.get(selector_key, SELECTORS['search_results'])
             if isinstance(selectors, str):
                 selectors = [selectors]
+            await self.wait_for_results(SELECTORS['results_ready'], timeout)
 
             for i, selector in enumerate(selectors, 1):
                 try:
                     logger.debug(f"Trying selector {i}/{len(selectors)}: {selector}")
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    elements = await self.browser.find_elements(By.CSS_SELECTOR, selector)
 
                     valid_elements = []
                     for element in elements:
@@ -228,6 +430,14 @@ class LinkedInSearchEngine(BaseSearchEngine):
             logger.error(f"Error getting search results: {e}")
             return []
 
+    def _parse_cards(self, entity_type: EntityType, elements: list[WebElement], keywords: str,
+                     location: str | None) -> list[Any]:
+        """Parse result cards (sync function, runs on the driver thread)"""
+        if BATCH_EXTRACTION:
+            return self._get_page_parser_method(entity_type)(self.driver, elements, keywords, location)
+        parser_method = self._get_parser_method(entity_type)
+        return [parser_method(element, keywords, location) for element in elements]
+
     def _get_parser_method(self, entity_type: EntityType) -> Callable:
         """Get the appropriate parser method for entity type"""
         parser_map = {
@@ -237,13 +447,31 @@ class LinkedInSearchEngine(BaseSearchEngine):
         }
         return parser_map[entity_type]
 
+    def _get_page_parser_method(self, entity_type: EntityType) -> Callable:
+        """Get the batch page parser method for entity type"""
+        parser_map = {
+            EntityType.PEOPLE: self.parser.parse_profiles_from_page,
+            EntityType.COMPANIES: self.parser.parse_companies_from_page,
+            EntityType.JOBS: self.parser.parse_jobs_from_page,
+        }
+        return parser_map[entity_type]
+
+    def _get_key_parser_method(self, entity_type: EntityType) -> Callable:
+        """Get the key-only parser method for entity type"""
+        parser_map = {
+            EntityType.PEOPLE: self.parser.parse_profile_keys,
+            EntityType.COMPANIES: self.parser.parse_company_keys,
+            EntityType.JOBS: self.parser.parse_job_keys,
+        }
+        return parser_map[entity_type]
+
     async def _get_job_cards(self) -> list[WebElement]:
         """Get job card elements"""
         logger.debug("Looking for job cards...")
         for i, selector in enumerate(SELECTORS['job_cards'], 1):
             try:
                 logger.debug(f"Trying job card selector {i}/{len(SELECTORS['job_cards'])}: {selector}")
-                cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                cards = await self.browser.find_elements(By.CSS_SELECTOR, selector)
                 if cards:
                     logger.debug(f"Found {len(cards)} job cards with selector {i}")
                     return cards
@@ -254,32 +482,35 @@ class LinkedInSearchEngine(BaseSearchEngine):
         logger.warning("No job cards found with any selector")
         return []
 
-    async def _load_more_jobs(self, current_count: int) -> bool:
-        """Load more job results"""
+    async def _load_more_jobs(self, current_cards: list[WebElement]) -> tuple[list[WebElement], bool] | None:
+        """Load more job results. Returns the new card list and whether it extends the current one
+        (scrolling, 'See more') or replaces it (next page); None when there are no more results"""
         try:
             logger.debug("Attempting to load more jobs...")
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            await self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             await asyncio.sleep(random.uniform(2, 3))
 
             new_cards = await self._get_job_cards()
-            if len(new_cards) == current_count:
+            if len(new_cards) == len(current_cards):
                 logger.debug("Card count unchanged, looking for 'See more' button...")
                 try:
-                    see_more_btn = self.driver.find_element(By.XPATH, SELECTORS['see_more_button'])
-                    self.driver.execute_script("arguments[0].click();", see_more_btn)
+                    see_more_btn = await self.browser.find_element(By.XPATH, SELECTORS['see_more_button'])
+                    await self.browser.execute_script("arguments[0].click();", see_more_btn)
                     await asyncio.sleep(random.uniform(2, 3))
                     logger.debug("Clicked 'See more' button")
-                    return True
+                    return await self._get_job_cards(), True
                 except Exception as e:
                     logger.debug(f"'See more' button not found: {e}, trying next page...")
-                    return await self._go_to_next_page()
+                    if await self._go_to_next_page():
+                        return await self._get_job_cards(), False
+                    return None
 
-            logger.debug(f"New cards loaded: {len(new_cards)} (was {current_count})")
-            return True
+            logger.debug(f"New cards loaded: {len(new_cards)} (was {len(current_cards)})")
+            return new_cards, True
 
         except Exception as e:
             logger.debug(f"Error loading more jobs: {e}")
-            return False
+            return None
 
     async def _go_to_next_page(self) -> bool:
         """Navigate to next page of results"""
@@ -287,8 +518,9 @@ class LinkedInSearchEngine(BaseSearchEngine):
         for i, selector in enumerate(SELECTORS['next_page_button'], 1):
             try:
                 logger.debug(f"Trying next page selector {i}/{len(SELECTORS['next_page_button'])}: {selector}")
-                next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if next_button.is_enabled() and not next_button.get_attribute('disabled'):
+                next_button = await self.browser.find_element(By.CSS_SELECTOR, selector)
+                disabled = await self.browser.get_attribute(next_button, 'disabled')
+                if await self.browser.is_enabled(next_button) and not disabled:
                     await self.automation._safe_click(next_button)
                     await asyncio.sleep(random.uniform(3, 5))
                     logger.debug(f"Successfully clicked next page button with selector {i}")
@@ -0,0 +1,185 @@
+"""Full-text index over profile headlines, company summaries/industries and job titles.
+
+    python search_index.py "machine learn*"
+    python search_index.py --entity-type jobs "mlops engineer"
+    python search_index.py --rebuild
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+from config import FULL_TEXT_INDEX, FULL_TEXT_INDEX_PATH, DATA_FOLDER, PROFILES_FILE, COMPANIES_FILE, JOBS_FILE
+from models import ProfileData, CompanyData, JobData
+from storage import get_entity_store
+
+logger = logging.getLogger(__name__)
+
+# entity type -> (model, data file, key field, indexed fields)
+INDEXED_ENTITIES: dict[str, tuple[type[BaseModel], str, str, tuple[str, ...]]] = {
+    'people': (ProfileData, PROFILES_FILE, 'profile_url', ('headline',)),
+    'companies': (CompanyData, COMPANIES_FILE, 'company_url', ('summary', 'industry')),
+    'jobs': (JobData, JOBS_FILE, 'job_id', ('title',)),
+}
+TEXT_COLUMNS = ('title', 'headline', 'summary', 'industry')
+# bm25 column weights, in TEXT_COLUMNS order: titles and headlines outrank long summaries
+COLUMN_WEIGHTS = (2.0, 2.0, 1.0, 1.5)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY, entity_type TEXT NOT NULL, key TEXT NOT NULL, UNIQUE (entity_type, key)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS fts USING fts5(
+    {', '.join(TEXT_COLUMNS)}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+"""
+
+_TOKEN = re.compile(r'\w+\*?', re.UNICODE)
+
+
+class FullTextIndex:
+    """Incrementally maintained on-disk inverted index (SQLite FTS5, memory-mapped)"""
+
+    def __init__(self, index_path: str = FULL_TEXT_INDEX_PATH, mmap_size: int = 256 * 1024 * 1024):
+        self.index_path = index_path
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA mmap_size={mmap_size}")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._entity_types = {model: entity_type for entity_type, (model, *_) in INDEXED_ENTITIES.items()}
+
+    def add_entities(self, entities: Iterable[BaseModel]) -> int:
+        """Index (or re-index) the text fields of saved entities"""
+        records = []
+        for entity in entities:
+            entity_type = self._entity_types.get(type(entity))
+            if entity_type:
+                records.append((entity_type, entity.dict()))
+        return self.add_records(records)
+
+    def add_records(self, records: Iterable[tuple[str, dict[str, Any]]]) -> int:
+        """Index (or re-index) (entity_type, record) pairs in one transaction"""
+        count = 0
+        with self._lock, self._conn:
+            for entity_type, record in records:
+                _, _, key_field, fields = INDEXED_ENTITIES[entity_type]
+                key = record.get(key_field)
+                if not key:
+                    continue
+
+                self._conn.execute("INSERT OR IGNORE INTO documents (entity_type, key) VALUES (?, ?)",
+                                   (entity_type, key))
+                doc_id = self._conn.execute("SELECT id FROM documents WHERE entity_type = ? AND key = ?",
+                                            (entity_type, key)).fetchone()[0]
+                values = [(record.get(column) or '') if column in fields else '' for column in TEXT_COLUMNS]
+                self._conn.execute("DELETE FROM fts WHERE rowid = ?", (doc_id,))
+                self._conn.execute(f"INSERT INTO fts (rowid, {', '.join(TEXT_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                                   (doc_id, *values))
+                count += 1
+        return count
+
+    def search(self, query: str, entity_type: str | None = None, limit: int = 20,
+               prefix: bool = True) -> list[dict[str, Any]]:
+        """Ranked search; every term must match, the last term (or any term ending in *) as a prefix"""
+        match = self._build_match(query, prefix)
+        if not match:
+            return []
+
+        sql = (
+            f"SELECT d.entity_type, d.key, bm25(fts, {', '.join(map(str, COLUMN_WEIGHTS))}) AS score "
+            f"FROM fts JOIN documents d ON d.id = fts.rowid WHERE fts MATCH ?"
+        )
+        params: list[Any] = [match]
+        if entity_type:
+            sql += " AND d.entity_type = ?"
+            params.append(entity_type)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{'entity_type': row[0], 'key': row[1], 'score': round(-row[2], 4)} for row in rows]
+
+    def rebuild(self) -> int:
+        """Re-index everything currently in the entity stores"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM fts")
+            self._conn.execute("DELETE FROM documents")
+
+        count = 0
+        for entity_type, (_, data_file, _, _) in INDEXED_ENTITIES.items():
+            store = get_entity_store(os.path.join(DATA_FOLDER, data_file))
+            count += self.add_records((entity_type, record) for record in store.iter_records())
+        self.optimize()
+        return count
+
+    def optimize(self) -> None:
+        """Merge FTS index segments"""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO fts (fts) VALUES ('optimize')")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def _build_match(query: str, prefix: bool) -> str:
+        """Turn free text into an FTS5 query with quoted terms"""
+        tokens = _TOKEN.findall(query)
+        terms = []
+        for i, token in enumerate(tokens):
+            is_prefix = token.endswith('*') or (prefix and i == len(tokens) - 1)
+            word = token.rstrip('*')
+            if word:
+                terms.append(f'"{word}"' + ('*' if is_prefix else ''))
+        return ' '.join(terms)
+
+
+_index: FullTextIndex | None = None
+
+
+def get_full_text_index() -> FullTextIndex:
+    """Get the shared index instance"""
+    global _index
+    if _index is None:
+        _index = FullTextIndex()
+    return _index
+
+
+def index_entities(entities: Iterable[BaseModel]) -> int:
+    """Index saved entities when FULL_TEXT_INDEX is on; index errors are logged and never fail the save"""
+    if not FULL_TEXT_INDEX:
+        return 0
+    try:
+        return get_full_text_index().add_entities(entities)
+    except Exception as e:
+        logger.warning(f"Error updating full-text index: {e}")
+        return 0
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    arg_parser = argparse.ArgumentParser(description="Full-text search over stored LinkedIn data")
+    arg_parser.add_argument('query', nargs='?', default='', help="Search terms; a trailing * marks a prefix")
+    arg_parser.add_argument('--entity-type', choices=list(INDEXED_ENTITIES))
+    arg_parser.add_argument('--limit', type=int, default=20)
+    arg_parser.add_argument('--rebuild', action='store_true', help="Re-index all stored records first")
+    args = arg_parser.parse_args()
+
+    index = get_full_text_index()
+    if args.rebuild:
+        logger.info(f"Indexed {index.rebuild()} records")
+    if args.query:
+        for hit in index.search(args.query, args.entity_type, args.limit):
+            print(json.dumps(hit, ensure_ascii=False))
+    index.close()
+
+
+if __name__ == '__main__':
+    main()
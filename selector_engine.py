@@ -0,0 +1,125 @@
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+@dataclass
+class SelectorStats:
+    """Hit/miss/latency counters for a single selector"""
+    hits: int = 0
+    misses: int = 0
+    total_time: float = 0.0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def score(self) -> float:
+        """Smoothed hit rate used for ordering, untried selectors start at 0.5"""
+        return (self.hits + 1) / (self.lookups + 2)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_time / self.lookups * 1000 if self.lookups else 0.0
+
+
+class SelectorEngine:
+    """Resolves fallback selector chains with per-element memoization and hit-rate ordering.
+    Counters are kept per (chain, selector): a selector shared by two chains is ranked separately in each"""
+
+    def __init__(self, cache_size: int = 2048):
+        self.cache_size = cache_size
+        self.stats: dict[tuple[tuple[str, ...], str], SelectorStats] = defaultdict(SelectorStats)
+        self._cache: OrderedDict[tuple, Any] = OrderedDict()
+
+    def find(self, parent, selectors: str | list[str], require_text: bool = False) -> Any | None:
+        """Find the first element matched by a selector chain, best-performing selectors first"""
+        chain = (selectors,) if isinstance(selectors, str) else tuple(selectors)
+
+        # Only elements are cached: a driver's document changes under us between lookups
+        parent_id = getattr(parent, 'id', None)
+        cache_key = (parent_id, chain, require_text)
+        if parent_id is not None:
+            cached = self._cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+        element = None
+        for selector in self.ordered(chain):
+            element = self._try_selector(parent, chain, selector, require_text)
+            if element is not None:
+                break
+
+        # Misses are not memoized: lazily rendered (occludable) cards fill in after the first lookup
+        if parent_id is not None and element is not None:
+            self._cache[cache_key] = element
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return element
+
+    def ordered(self, chain: tuple[str, ...]) -> list[str]:
+        """Order a fallback chain by observed hit rate, keeping config order for ties"""
+        return sorted(chain, key=lambda selector: -self.stats[(chain, selector)].score)
+
+    def get_stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Get per-selector counters grouped by chain (chain selectors joined with ' | ')"""
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for (chain, selector), s in self.stats.items():
+            result.setdefault(' | '.join(chain), {})[selector] = {
+                'hits': s.hits,
+                'misses': s.misses,
+                'hit_rate': round(s.hit_rate, 3),
+                'avg_latency_ms': round(s.avg_latency_ms, 3),
+            }
+        return result
+
+    def log_stats(self) -> None:
+        """Log per-selector counters, most used first"""
+        for (chain, selector), s in sorted(self.stats.items(), key=lambda item: -item[1].lookups):
+            logger.debug(f"Selector {selector} (chain of {len(chain)}): {s.hits} hits, {s.misses} misses, "
+                         f"hit rate {s.hit_rate:.0%}, avg {s.avg_latency_ms:.1f}ms")
+
+    def clear_cache(self) -> None:
+        """Drop memoized lookups, e.g. after navigating to a new page"""
+        self._cache.clear()
+
+    def reset(self) -> None:
+        """Drop memoized lookups and counters"""
+        self._cache.clear()
+        self.stats.clear()
+
+    def _try_selector(self, parent, chain: tuple[str, ...], selector: str, require_text: bool) -> Any | None:
+        """Run one selector; find_elements reports misses without raising"""
+        started = time.perf_counter()
+        try:
+            elements = parent.find_elements(By.CSS_SELECTOR, selector)
+            element = elements[0] if elements else None
+            if element is not None and require_text and hasattr(element, 'text') and not element.text.strip():
+                element = None
+        except Exception:
+            element = None
+
+        stats = self.stats[(chain, selector)]
+        stats.total_time += time.perf_counter() - started
+        if element is None:
+            stats.misses += 1
+        else:
+            stats.hits += 1
+        return element
+
+
+selector_engine = SelectorEngine()
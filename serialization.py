@@ -0,0 +1,105 @@
+import json
+import logging
+from typing import Any
+
+from pydantic import BaseModel
+
+from base.base_codec import BaseCodec
+from config import DATA_CODEC, PRETTY_DATA
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _model_json(entity: BaseModel) -> bytes | None:
+    """Serialize a model to compact JSON directly (pydantic v2), without a dict intermediate"""
+    dump_json = getattr(entity, 'model_dump_json', None)
+    if dump_json is None:
+        return None
+    return dump_json(exclude_none=True).encode('utf-8')
+
+
+class JsonCodec(BaseCodec):
+    """Standard library JSON"""
+    name = 'json'
+    extension = '.json'
+
+    def __init__(self, pretty: bool = False):
+        super().__init__(pretty)
+        self.json_lines = not pretty
+
+    def encode(self, obj: Any) -> bytes:
+        if self.pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def encode_model(self, entity: BaseModel) -> bytes:
+        if not self.pretty and (data := _model_json(entity)) is not None:
+            return data
+        return super().encode_model(entity)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson: same JSON output, several times faster to encode and decode"""
+    name = 'orjson'
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if self.pretty else 0)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(BaseCodec):
+    """MessagePack: compact binary encoding, not human-readable"""
+    name = 'msgpack'
+    extension = '.msgpack'
+
+    def encode(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+CODECS: dict[str, tuple[type[BaseCodec], Any]] = {
+    'json': (JsonCodec, json),
+    'orjson': (OrjsonCodec, orjson),
+    'msgpack': (MsgpackCodec, msgpack),
+}
+
+_codecs: dict[tuple[str, bool], BaseCodec] = {}
+
+
+def get_codec(name: str = DATA_CODEC, pretty: bool = PRETTY_DATA) -> BaseCodec:
+    """Get a shared codec instance, falling back to stdlib JSON if its library is not installed"""
+    codec_key = (name, pretty)
+    if codec_key not in _codecs:
+        if name not in CODECS:
+            raise ValueError(f"Unknown codec: {name}")
+        codec_class, module = CODECS[name]
+        if module is None:
+            logger.warning(f"{name} is not installed, falling back to json")
+            codec_class = JsonCodec
+        _codecs[codec_key] = codec_class(pretty)
+    return _codecs[codec_key]
+
+
+def get_line_codec() -> BaseCodec:
+    """Compact JSON codec for line-oriented files and SQLite json columns"""
+    codec = get_codec()
+    if codec.json_lines:
+        return codec
+    return get_codec('orjson' if orjson is not None else 'json', False)
@@ -0,0 +1,809 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+
+from base.base_codec import BaseCodec
+from base.base_storage import BaseEntityStore
+from config import STORAGE_BACKEND, JSONL_COMPACT_RATIO, SQLITE_PATH, PATCH_JOURNAL_MAX, SHARD_MAX_RECORDS
+from serialization import get_codec, get_line_codec
+
+logger = logging.getLogger(__name__)
+
+# Primary key fields of the stored models (see BaseData.get_key_field), used when a store
+# is read before any entity has told it which field is the key
+KEY_FIELDS = ('profile_url', 'company_url', 'job_id')
+
+# Keys bound per lookup query, within SQLite's host parameter limit (999 on builds before 3.32)
+SQLITE_MAX_VARIABLES = 999
+
+
+def _merge_fields(entity: BaseModel, partial: bool) -> dict[str, Any]:
+    """Fields an upsert merges into a stored record: all non-None fields, or only the explicitly set ones"""
+    return entity.dict(exclude_unset=partial, exclude_none=True)
+
+
+def _detect_key_field(record: dict[str, Any]) -> str | None:
+    return next((field for field in KEY_FIELDS if field in record), None)
+
+
+def _terminate_last_line(path: str) -> None:
+    """Terminate a partially written last line so the next append starts on a fresh line"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb+') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            f.write(b'\n')
+
+
+class JsonEntityStore(BaseEntityStore):
+    """Stores entities as a single array (JSON or another codec's format), rewritten on every save.
+    Field updates go to an append-only patch journal that is merged on read and folded
+    back into the array on the next save or once it grows past max_patches"""
+
+    def __init__(self, filepath: str, max_patches: int = PATCH_JOURNAL_MAX, codec: BaseCodec | None = None):
+        super().__init__(filepath)
+        self.codec = codec or get_codec()
+        self.line_codec = get_line_codec()
+        self.legacy_path = filepath
+        self.filepath = self.codec.path_for(filepath)
+        self.journal_path = os.path.splitext(filepath)[0] + '.patches.jsonl'
+        self.max_patches = max_patches
+        self._journal_size: int | None = None
+
+    def save_new(self, entities: list[BaseModel]) -> list[BaseModel]:
+        with self._lock:
+            existing_data = self.load()
+            new_data = [entity.dict(exclude_none=True) for entity in entities]
+
+            if new_data:
+                key_field = entities[0].get_key_field()
+                existing_keys = {item.get(key_field) for item in existing_data if item.get(key_field)}
+
+                unique_new = [
+                    (entity, item) for entity, item in zip(entities, new_data)
+                    if item.get(key_field) not in existing_keys
+                ]
+
+                all_data = existing_data + [item for _, item in unique_new]
+                added = [entity for entity, _ in unique_new]
+            else:
+                all_data = existing_data
+                added = []
+
+            self._write(all_data)
+            return added
+
+    def upsert(self, entities: list[BaseModel], partial: bool = False) -> int:
+        if not entities:
+            return 0
+
+        with self._lock:
+            key_field = entities[0].get_key_field()
+            all_data = self.load()
+            index = {item.get(key_field): item for item in all_data if item.get(key_field)}
+
+            added = 0
+            for entity in entities:
+                key = entity.get_key_value()
+                if key in index:
+                    index[key].update(_merge_fields(entity, partial))
+                else:
+                    record = entity.dict(exclude_none=True)
+                    index[key] = record
+                    all_data.append(record)
+                    added += 1
+
+            self._write(all_data)
+            return added
+
+    def update(self, key_field: str, key: str, fields: dict[str, Any]) -> None:
+        """Append a field-level patch to the journal without touching the array file"""
+        with self._lock:
+            if self._journal_size is None:
+                self._journal_size = len(self._read_patches())
+                _terminate_last_line(self.journal_path)
+
+            patch = {'key_field': key_field, 'key': key, 'fields': fields}
+            with open(self.journal_path, 'ab') as f:
+                f.write(self.line_codec.encode(patch) + b'\n')
+            self._journal_size += 1
+
+            if self._journal_size > self.max_patches:
+                self.compact()
+
+    def load(self) -> list[dict[str, Any]]:
+        with self._lock:
+            data = self._read()
+            all_data = list(data.values()) if isinstance(data, dict) else data
+            patches = self._read_patches()
+            if patches:
+                self._apply_patches(all_data, patches)
+            return all_data
+
+    def iter_records(self, batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """Not streamed: an array file can only be decoded whole, so this loads every record.
+        Use the jsonl, sqlite or sharded backend to read large stores incrementally"""
+        yield from self.load()
+
+    def keys(self, key_field: str) -> set[str]:
+        return {item.get(key_field) for item in self.load() if item.get(key_field)}
+
+    def data_paths(self) -> list[str]:
+        return [self.filepath, self.journal_path]
+
+    def compact(self) -> None:
+        """Fold the patch journal back into the array file"""
+        with self._lock:
+            if os.path.exists(self.journal_path):
+                self._write(self.load())
+                logger.info(f"Folded patch journal into {self.filepath}")
+
+    def _write(self, all_data: list[dict[str, Any]]) -> None:
+        """Rewrite the array file; the data written already includes any journaled patches"""
+        self.codec.dump(all_data, self.filepath)
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_size = 0
+
+    def _read(self) -> list[dict[str, Any]] | dict[str, Any]:
+        if os.path.exists(self.filepath):
+            return self.codec.load(self.filepath)
+        if os.path.exists(self.legacy_path):
+            # JSON file written before switching to a codec with another extension
+            return self.line_codec.load(self.legacy_path)
+        return []
+
+    def _read_patches(self) -> list[dict[str, Any]]:
+        """Read journaled patches in order, skipping a torn last line"""
+        if not os.path.exists(self.journal_path):
+            return []
+        patches = []
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    patches.append(self.line_codec.decode(line))
+                except ValueError:
+                    continue
+        return patches
+
+    @staticmethod
+    def _apply_patches(all_data: list[dict[str, Any]], patches: list[dict[str, Any]]) -> None:
+        """Apply patches in journal order, creating records for unknown keys"""
+        indexes: dict[str, dict[str, dict[str, Any]]] = {}
+        for patch in patches:
+            key_field = patch['key_field']
+            if key_field not in indexes:
+                indexes[key_field] = {item.get(key_field): item for item in all_data if item.get(key_field)}
+            index = indexes[key_field]
+
+            record = index.get(patch['key'])
+            if record is None:
+                record = index[patch['key']] = {key_field: patch['key']}
+                all_data.append(record)
+            record.update(patch['fields'])
+
+
+class JsonlEntityStore(BaseEntityStore):
+    """Append-only JSON Lines log with an in-memory key index loaded once per process.
+    Upserts and updates append (partial) records that are merged over earlier ones on read"""
+
+    def __init__(self, filepath: str, compact_ratio: float = JSONL_COMPACT_RATIO):
+        super().__init__(filepath)
+        self.codec = get_line_codec()
+        self.legacy_path = filepath
+        self.filepath = os.path.splitext(filepath)[0] + '.jsonl'
+        self.compact_ratio = compact_ratio
+        self.key_field: str | None = None
+        self._index: set[str] | None = None
+        self._stale_lines = 0
+
+    def save_new(self, entities: list[BaseModel]) -> list[BaseModel]:
+        if not entities:
+            return []
+
+        with self._lock:
+            key_field = entities[0].get_key_field()
+            index = self._ensure_index(key_field)
+
+            added = []
+            for entity in entities:
+                key = entity.get_key_value()
+                if not key or key in index:
+                    continue
+                index.add(key)
+                added.append(entity)
+
+            self._append([self.codec.encode_model(entity) for entity in added])
+            return added
+
+    def upsert(self, entities: list[BaseModel], partial: bool = False) -> int:
+        if not entities:
+            return 0
+
+        with self._lock:
+            index = self._ensure_index(entities[0].get_key_field())
+            lines = []
+            added = 0
+            for entity in entities:
+                key = entity.get_key_value()
+                if key in index:
+                    self._stale_lines += 1
+                    lines.append(self.codec.encode(_merge_fields(entity, partial)) if partial
+                                 else self.codec.encode_model(entity))
+                else:
+                    index.add(key)
+                    added += 1
+                    lines.append(self.codec.encode_model(entity))
+            self._append(lines)
+            return added
+
+    def update(self, key_field: str, key: str, fields: dict[str, Any]) -> None:
+        with self._lock:
+            index = self._ensure_index(key_field)
+            if key in index:
+                self._stale_lines += 1
+            index.add(key)
+            self._append([self.codec.encode({key_field: key, **fields})])
+
+    def load(self) -> list[dict[str, Any]]:
+        with self._lock:
+            self._migrate_legacy()
+            records, _ = self._read_records(self.key_field)
+            return list(records.values())
+
+    def iter_records(self, batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """Stream merged records in first-seen order, holding only line offsets per key in memory.
+        The first pass indexes where each key's lines are, the second decodes each record once
+        and merges the later (partial) lines of a key into it"""
+        with self._lock:
+            self._migrate_legacy()
+            if not os.path.exists(self.filepath):
+                return
+            f = open(self.filepath, 'rb')
+            # Appends after this point are not part of the snapshot; compaction replaces the file, not this inode
+            end = os.fstat(f.fileno()).st_size
+
+        with f:
+            offsets: dict[str, int | list[int]] = {}
+            for offset, record in self._scan(f, end):
+                key = record.get(self.key_field or _detect_key_field(record))
+                if key is None:
+                    continue
+                known = offsets.get(key)
+                if known is None:
+                    offsets[key] = offset
+                elif isinstance(known, list):
+                    known.append(offset)
+                else:
+                    offsets[key] = [known, offset]
+
+            for offset, record in self._scan(f, end):
+                key = record.get(self.key_field or _detect_key_field(record))
+                known = offsets.get(key) if key is not None else offset
+                if isinstance(known, list):
+                    if known[0] != offset:
+                        continue
+                    resume = f.tell()
+                    for later in known[1:]:
+                        f.seek(later)
+                        record.update(self.codec.decode(f.readline()))
+                    f.seek(resume)
+                elif known != offset:
+                    continue
+                yield record
+
+    def keys(self, key_field: str) -> set[str]:
+        with self._lock:
+            return set(self._ensure_index(key_field))
+
+    def compact(self) -> None:
+        """Rewrite the log keeping one record per key and dropping unreadable lines"""
+        with self._lock:
+            records, _ = self._read_records(self.key_field)
+            tmp_path = f"{self.filepath}.tmp"
+            with open(tmp_path, 'wb') as f:
+                for record in records.values():
+                    f.write(self.codec.encode(record) + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+            logger.info(f"Compacted {self.filepath}: dropped {self._stale_lines} stale lines")
+            self._stale_lines = 0
+
+    def _append(self, lines: list[bytes]) -> None:
+        """Append encoded records to the log, compacting once superseded lines dominate"""
+        if lines:
+            with open(self.filepath, 'ab') as f:
+                f.write(b''.join(line + b'\n' for line in lines))
+
+        if self._stale_lines and self._stale_lines > len(self._index or ()) * self.compact_ratio:
+            self.compact()
+
+    def _ensure_index(self, key_field: str) -> set[str]:
+        """Build the key index on first use, afterwards it is maintained incrementally"""
+        if self._index is None or self.key_field != key_field:
+            self._migrate_legacy()
+            self.key_field = key_field
+            records, self._stale_lines = self._read_records(key_field)
+            self._index = set(records)
+            _terminate_last_line(self.filepath)
+        return self._index
+
+    def _read_records(self, key_field: str | None) -> tuple[dict[str, dict[str, Any]], int]:
+        """Read the log, merging later (possibly partial) records for a key over earlier ones.
+        Returns records and stale line count"""
+        records: dict[str, dict[str, Any]] = {}
+        stale = 0
+        if not os.path.exists(self.filepath):
+            return records, stale
+
+        with open(self.filepath, 'rb') as f:
+            for position, line in enumerate(f):
+                if not line.strip():
+                    continue
+                try:
+                    record = self.codec.decode(line)
+                except ValueError:
+                    stale += 1
+                    continue
+                key = record.get(key_field or _detect_key_field(record))
+                if key is None:
+                    key = f"__line_{position}"
+                if key in records:
+                    stale += 1
+                    records[key].update(record)
+                else:
+                    records[key] = record
+        return records, stale
+
+    def _scan(self, f, end: int) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (offset, record) for every readable line before end"""
+        f.seek(0)
+        while (offset := f.tell()) < end:
+            line = f.readline()
+            if not line.strip():
+                continue
+            try:
+                yield offset, self.codec.decode(line)
+            except ValueError:
+                continue
+
+    def _migrate_legacy(self) -> None:
+        """Convert an existing JSON array file into the log on first use"""
+        if os.path.exists(self.filepath) or not os.path.exists(self.legacy_path):
+            return
+        data = self.codec.load(self.legacy_path)
+        items = list(data.values()) if isinstance(data, dict) else data
+        with open(self.filepath, 'wb') as f:
+            for item in items:
+                f.write(self.codec.encode(item) + b'\n')
+        logger.info(f"Migrated {len(items)} records from {self.legacy_path} to {self.filepath}")
+
+
+class SqliteEntityStore(BaseEntityStore):
+    """Stores entities in an embedded SQLite database (WAL mode), one table per data file/model.
+    Records are kept as JSON documents keyed by get_key_value(), so point updates touch one row"""
+
+    def __init__(self, filepath: str, db_path: str = SQLITE_PATH):
+        super().__init__(filepath)
+        self.db_path = db_path
+        self.table = re.sub(r'\W', '_', Path(filepath).stem)
+        self.codec = get_line_codec()
+        self._conn: sqlite3.Connection | None = None
+
+    def save_new(self, entities: list[BaseModel]) -> list[BaseModel]:
+        return self._write_many(entities, "ON CONFLICT(key) DO NOTHING")
+
+    def upsert(self, entities: list[BaseModel], partial: bool = False) -> int:
+        if partial:
+            return len(self._write_many(entities, "ON CONFLICT(key) DO UPDATE SET data = json_patch(data, ?)",
+                                        partial=True))
+        return len(self._write_many(entities, "ON CONFLICT(key) DO UPDATE SET data = json_patch(data, excluded.data)"))
+
+    def update(self, key_field: str, key: str, fields: dict[str, Any]) -> None:
+        patch = self.codec.encode({key_field: key, **fields}).decode('utf-8')
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO {self.table} (key, data) VALUES (?, ?) "
+                f"ON CONFLICT(key) DO UPDATE SET data = json_patch(data, excluded.data)",
+                (key, patch)
+            )
+
+    def load(self) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._connect().execute(f"SELECT data FROM {self.table} ORDER BY rowid").fetchall()
+        return [self.codec.decode(data) for (data,) in rows]
+
+    def iter_records(self, batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """Stream rows in insertion order without loading the whole table"""
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._connect().execute(
+                    f"SELECT rowid, data FROM {self.table} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for last_rowid, data in rows:
+                yield self.codec.decode(data)
+
+    def keys(self, key_field: str) -> set[str]:
+        with self._lock:
+            return {key for (key,) in self._connect().execute(f"SELECT key FROM {self.table}")}
+
+    def data_paths(self) -> list[str]:
+        return [self.db_path, f"{self.db_path}-wal"]
+
+    def compact(self) -> None:
+        with self._lock:
+            self._connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _write_many(self, entities: list[BaseModel], conflict_clause: str, partial: bool = False) -> list[BaseModel]:
+        """Write a batch of entities in a single transaction. Returns the first entity of each new key.
+        With partial, each row also binds the explicitly set fields for the conflict clause"""
+        entities = [entity for entity in entities if entity.get_key_value()]
+        if not entities:
+            return []
+        rows = [
+            (entity.get_key_value(), self.codec.encode_model(entity).decode('utf-8'))
+            + ((self.codec.encode(_merge_fields(entity, True)).decode('utf-8'),) if partial else ())
+            for entity in entities
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            keys = list({row[0] for row in rows})
+            existing = set()
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+                existing.update(key for (key,) in conn.execute(
+                    f"SELECT key FROM {self.table} WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ))
+            with conn:
+                conn.executemany(f"INSERT INTO {self.table} (key, data) VALUES (?, ?) {conflict_clause}", rows)
+
+        added = {}
+        for entity in entities:
+            key = entity.get_key_value()
+            if key not in existing:
+                added.setdefault(key, entity)
+        return list(added.values())
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection and create the table on first use"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+            conn.commit()
+            self._conn = conn
+            self._migrate_legacy(conn)
+        return self._conn
+
+    def _migrate_legacy(self, conn: sqlite3.Connection) -> None:
+        """Import an existing JSON array file into an empty table"""
+        if not os.path.exists(self.filepath) or conn.execute(f"SELECT 1 FROM {self.table} LIMIT 1").fetchone():
+            return
+        data = self.codec.load(self.filepath)
+        items = list(data.values()) if isinstance(data, dict) else data
+        rows = [
+            (item[key_field], self.codec.encode(item).decode('utf-8'))
+            for item in items if (key_field := _detect_key_field(item)) and item.get(key_field)
+        ]
+        with conn:
+            conn.executemany(f"INSERT OR IGNORE INTO {self.table} (key, data) VALUES (?, ?)", rows)
+        logger.info(f"Migrated {len(rows)} records from {self.filepath} to {self.db_path}:{self.table}")
+
+
+def _query_slug(keywords: str | None, location: str | None) -> str:
+    """Filesystem-safe shard name for a search query"""
+    query = ' '.join(part for part in (keywords, location) if part)
+    return re.sub(r'[^a-z0-9]+', '-', query.lower()).strip('-')[:60] or 'unknown'
+
+
+def read_segment(path: str, key_field: str | None = None, checksum: str | None = None) -> list[dict[str, Any]]:
+    """Read one shard segment, merging later (partial) lines for a key over earlier ones.
+    Module level so process pools can load segments in parallel"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if checksum and hashlib.sha256(data).hexdigest() != checksum:
+        logger.warning(f"Checksum mismatch in segment {path}")
+
+    codec = get_line_codec()
+    records: dict[str, dict[str, Any]] = {}
+    for position, line in enumerate(data.splitlines()):
+        if not line.strip():
+            continue
+        try:
+            record = codec.decode(line)
+        except ValueError:
+            continue
+        key = record.get(key_field or _detect_key_field(record)) or f"__line_{position}"
+        if key in records:
+            records[key].update(record)
+        else:
+            records[key] = record
+    return list(records.values())
+
+
+class ShardedEntityStore(BaseEntityStore):
+    """Stores entities in bounded JSON Lines segments sharded by search date and query.
+    A manifest lists every segment with its key range, record count and checksum, so segments
+    can be loaded in parallel and old ones dropped without rewriting the rest. Each key lives in
+    exactly one segment; upserts and updates append partial records to that segment"""
+
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, filepath: str, max_records: int = SHARD_MAX_RECORDS):
+        super().__init__(filepath)
+        self.legacy_path = filepath
+        self.folder = os.path.splitext(filepath)[0] + '.shards'
+        self.manifest_path = os.path.join(self.folder, self.MANIFEST_FILE)
+        self.max_records = max_records
+        self.codec = get_line_codec()
+        self.key_field: str | None = None
+        self._segments: dict[str, dict[str, Any]] | None = None
+        self._index: dict[str, str] | None = None
+
+    def save_new(self, entities: list[BaseModel]) -> list[BaseModel]:
+        return self._write_entities(entities, merge=False)
+
+    def upsert(self, entities: list[BaseModel], partial: bool = False) -> int:
+        return len(self._write_entities(entities, merge=True, partial=partial))
+
+    def update(self, key_field: str, key: str, fields: dict[str, Any]) -> None:
+        with self._lock:
+            index = self._ensure_index(key_field)
+            line = self.codec.encode({key_field: key, **fields})
+            if key in index:
+                self._append_existing({index[key]: [line]})
+            else:
+                self._append_new({(datetime.now().strftime('%Y-%m-%d'), '_updates'): [(key, line)]})
+            self._write_manifest()
+
+    def load(self) -> list[dict[str, Any]]:
+        return list(self.iter_records())
+
+    def iter_records(self, batch_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """Stream records segment by segment"""
+        for entry in self.segments():
+            yield from read_segment(os.path.join(self.folder, entry['path']), self.key_field)
+
+    def iter_records_parallel(self, workers: int | None = None) -> Iterator[dict[str, Any]]:
+        """Stream records with segments read and checksum-verified across worker processes"""
+        entries = self.segments()
+        paths = [os.path.join(self.folder, entry['path']) for entry in entries]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for records in pool.map(read_segment, paths, [self.key_field] * len(paths),
+                                    [entry['checksum'] for entry in entries]):
+                yield from records
+
+    def keys(self, key_field: str) -> set[str]:
+        with self._lock:
+            return set(self._ensure_index(key_field))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up one record, reading only segments whose key range covers the key"""
+        for entry in self.segments():
+            if entry['count'] and entry['min_key'] <= key <= entry['max_key']:
+                for record in read_segment(os.path.join(self.folder, entry['path']), self.key_field):
+                    if record.get(self.key_field or _detect_key_field(record)) == key:
+                        return record
+        return None
+
+    def segments(self) -> list[dict[str, Any]]:
+        """Manifest entries of all segments, oldest first"""
+        with self._lock:
+            return [dict(entry) for entry in self._load_manifest().values()]
+
+    def data_paths(self) -> list[str]:
+        return [self.manifest_path]
+
+    def drop_before(self, date: str) -> int:
+        """Delete segments of searches older than date (YYYY-MM-DD). Returns the number of records dropped"""
+        with self._lock:
+            segments = self._load_manifest()
+            dropped = [path for path, entry in segments.items() if entry['date'] < date]
+            records = 0
+            for path in dropped:
+                records += segments.pop(path)['count']
+                os.remove(os.path.join(self.folder, path))
+            if dropped:
+                self._index = None
+                self._write_manifest()
+                logger.info(f"Dropped {len(dropped)} segments ({records} records) older than {date} from {self.folder}")
+            return records
+
+    def compact(self) -> None:
+        """Rewrite segments holding superseded lines so each key has a single line"""
+        with self._lock:
+            for path, entry in self._load_manifest().items():
+                if entry['lines'] <= entry['count']:
+                    continue
+                full_path = os.path.join(self.folder, path)
+                records = read_segment(full_path, self.key_field)
+                data = b''.join(self.codec.encode(record) + b'\n' for record in records)
+                self._replace_segment(full_path, data)
+                entry.update(lines=len(records), count=len(records), bytes=len(data),
+                             checksum=hashlib.sha256(data).hexdigest())
+            self._write_manifest()
+
+    def _write_entities(self, entities: list[BaseModel], merge: bool, partial: bool = False) -> list[BaseModel]:
+        """Append new entities to their shards and, when merging, known ones (only their set fields
+        with partial) to their segments. Returns the entities stored under new keys"""
+        if not entities:
+            return []
+
+        with self._lock:
+            index = self._ensure_index(entities[0].get_key_field())
+            new_records: dict[str, tuple[tuple[str, str], bytes]] = {}
+            new_entities: dict[str, BaseModel] = {}
+            existing_lines: dict[str, list[bytes]] = {}
+            for entity in entities:
+                key = entity.get_key_value()
+                if not key:
+                    continue
+                if key in index:
+                    if merge:
+                        line = (self.codec.encode(_merge_fields(entity, True)) if partial
+                                else self.codec.encode_model(entity))
+                        existing_lines.setdefault(index[key], []).append(line)
+                    continue
+                if key in new_records and not merge:
+                    continue
+                shard = (entity.searched_at[:10], _query_slug(entity.search_keywords, entity.search_location))
+                new_records[key] = (shard, self.codec.encode_model(entity))
+                new_entities[key] = entity
+
+            new_lines: dict[tuple[str, str], list[tuple[str, bytes]]] = {}
+            for key, (shard, line) in new_records.items():
+                new_lines.setdefault(shard, []).append((key, line))
+
+            self._append_new(new_lines)
+            self._append_existing(existing_lines)
+            if new_lines or existing_lines:
+                self._write_manifest()
+            return list(new_entities.values())
+
+    def _append_new(self, shard_lines: dict[tuple[str, str], list[tuple[str, bytes]]]) -> int:
+        """Append records with new keys to the open segment of each shard, starting segments as they fill"""
+        segments = self._load_manifest()
+        added = 0
+        for (date, query), lines in shard_lines.items():
+            lines = list(lines)
+            while lines:
+                entry = self._open_segment(date, query)
+                room = self.max_records - entry['count']
+                chunk, lines = lines[:room], lines[room:]
+                new_keys = [key for key, _ in chunk]
+                self._append_lines(entry, [line for _, line in chunk])
+                for key in new_keys:
+                    self._index[key] = entry['path']
+                entry['count'] += len(new_keys)
+                entry['min_key'] = min([entry['min_key'], *new_keys] if entry['min_key'] else new_keys)
+                entry['max_key'] = max([entry['max_key'], *new_keys] if entry['max_key'] else new_keys)
+                segments[entry['path']] = entry
+                added += len(new_keys)
+        return added
+
+    def _append_existing(self, segment_lines: dict[str, list[bytes]]) -> None:
+        segments = self._load_manifest()
+        for path, lines in segment_lines.items():
+            self._append_lines(segments[path], lines)
+
+    def _append_lines(self, entry: dict[str, Any], lines: list[bytes]) -> None:
+        """Append lines to a segment and refresh its size and checksum"""
+        full_path = os.path.join(self.folder, entry['path'])
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        _terminate_last_line(full_path)
+        with open(full_path, 'ab') as f:
+            f.write(b''.join(line + b'\n' for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        entry['lines'] += len(lines)
+        entry['bytes'] = len(data)
+        entry['checksum'] = hashlib.sha256(data).hexdigest()
+
+    def _open_segment(self, date: str, query: str) -> dict[str, Any]:
+        """Get the last segment of a shard if it has room, otherwise start a new one"""
+        shard_entries = [
+            entry for entry in self._load_manifest().values() if entry['date'] == date and entry['query'] == query
+        ]
+        if shard_entries and shard_entries[-1]['count'] < self.max_records:
+            return shard_entries[-1]
+        return {
+            'path': f"{date}/{query}-{len(shard_entries):04d}.jsonl", 'date': date, 'query': query,
+            'count': 0, 'lines': 0, 'bytes': 0, 'min_key': None, 'max_key': None, 'checksum': None,
+        }
+
+    def _ensure_index(self, key_field: str) -> dict[str, str]:
+        """Build the key -> segment index on first use, afterwards it is maintained incrementally"""
+        if self._index is None or self.key_field != key_field:
+            entries = self.segments()
+            self.key_field = key_field
+            self._index = {}
+            for entry in entries:
+                for record in read_segment(os.path.join(self.folder, entry['path']), key_field):
+                    if record.get(key_field):
+                        self._index[record[key_field]] = entry['path']
+        return self._index
+
+    def _load_manifest(self) -> dict[str, dict[str, Any]]:
+        if self._segments is None:
+            if os.path.exists(self.manifest_path):
+                manifest = self.codec.load(self.manifest_path)
+                self._segments = {entry['path']: entry for entry in manifest['segments']}
+            else:
+                self._segments = {}
+                self._migrate_legacy()
+        return self._segments
+
+    def _write_manifest(self) -> None:
+        os.makedirs(self.folder, exist_ok=True)
+        get_codec('json', pretty=True).dump({'version': 1, 'segments': list(self._segments.values())},
+                                            self.manifest_path)
+
+    @staticmethod
+    def _replace_segment(path: str, data: bytes) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _migrate_legacy(self) -> None:
+        """Shard an existing JSON array file on first use"""
+        if not os.path.exists(self.legacy_path):
+            return
+        data = self.codec.load(self.legacy_path)
+        items = list(data.values()) if isinstance(data, dict) else data
+        self._index = {}
+        shard_lines: dict[tuple[str, str], list[tuple[str, bytes]]] = {}
+        for item in items:
+            key_field = self.key_field or _detect_key_field(item)
+            if not key_field or not item.get(key_field) or item[key_field] in self._index:
+                continue
+            self.key_field = key_field
+            self._index[item[key_field]] = None
+            shard = ((item.get('searched_at') or '')[:10] or 'undated',
+                     _query_slug(item.get('search_keywords'), item.get('search_location')))
+            shard_lines.setdefault(shard, []).append((item[key_field], self.codec.encode(item)))
+        self._append_new(shard_lines)
+        self._write_manifest()
+        self._index = None
+        logger.info(f"Migrated {len(items)} records from {self.legacy_path} to {self.folder}")
+
+
+STORE_BACKENDS: dict[str, type[BaseEntityStore]] = {
+    'json': JsonEntityStore,
+    'jsonl': JsonlEntityStore,
+    'sqlite': SqliteEntityStore,
+    'sharded': ShardedEntityStore,
+}
+
+_stores: dict[tuple[str, str], BaseEntityStore] = {}
+
+
+def get_entity_store(filepath: str, backend: str = STORAGE_BACKEND) -> BaseEntityStore:
+    """Get the shared store instance for a data file"""
+    store_key = (backend, os.path.abspath(filepath))
+    if store_key not in _stores:
+        if backend not in STORE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {backend}")
+        _stores[store_key] = STORE_BACKENDS[backend](filepath)
+    return _stores[store_key]
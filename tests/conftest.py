@@ -0,0 +1,11 @@
+"""Point every configured data path at a throwaway folder before any module reads config"""
+import os
+import tempfile
+
+_data_folder = tempfile.mkdtemp(prefix='linkedin-parser-tests-')
+os.environ['DATA_FOLDER'] = _data_folder
+os.environ['SESSION_FOLDER'] = os.path.join(_data_folder, 'sessions')
+os.environ['SEARCH_CACHE'] = 'false'
+os.environ['FULL_TEXT_INDEX'] = 'false'
+os.environ['ARCHIVE_PAGES'] = 'false'
+os.environ['LOOP_LAG_MONITOR'] = 'false'
@@ -0,0 +1,18 @@
+from backfill import merge_into_store
+from models import ProfileData
+from storage import get_entity_store
+
+
+def test_merge_keeps_fields_the_parser_does_not_produce(tmp_path):
+    filepath = str(tmp_path / 'profiles.json')
+    url = 'https://www.linkedin.com/in/user1/'
+    store = get_entity_store(filepath)
+    store.save([ProfileData(profile_url=url, name='User 1', headline='Engineer')])
+    store.update('profile_url', url, {'connection_sent': True})
+
+    records = [{'profile_url': url, 'name': 'Renamed'},
+               {'profile_url': 'https://www.linkedin.com/in/user2/', 'name': 'User 2'}]
+
+    assert merge_into_store(filepath, records, 'people') == (1, 1)
+    merged = {record['profile_url']: record for record in store.load()}[url]
+    assert (merged['name'], merged['headline'], merged['connection_sent']) == ('Renamed', 'Engineer', True)
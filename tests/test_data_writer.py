@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+import data_writer
+from data_writer import DataWriter, WriteError
+from models import ProfileData
+from storage import JsonlEntityStore
+
+
+def profile(n: int) -> ProfileData:
+    return ProfileData(profile_url=f'https://www.linkedin.com/in/user{n}/', name=f'User {n}')
+
+
+class FailingStore:
+    """Store whose writes always fail"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.attempts = 0
+
+    def signature(self) -> tuple:
+        return ()
+
+    def save_new(self, entities):
+        self.attempts += 1
+        raise OSError("disk full")
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    """Route the writer to per-test stores; files named bad.json fail"""
+    stores = {}
+
+    def get_store(filepath):
+        if filepath not in stores:
+            stores[filepath] = FailingStore(filepath) if filepath.endswith('bad.json') else JsonlEntityStore(filepath)
+        return stores[filepath]
+
+    monkeypatch.setattr(data_writer, 'get_entity_store', get_store)
+    return stores
+
+
+def test_saves_and_updates_are_coalesced(tmp_path, stores):
+    path = str(tmp_path / 'profiles.json')
+
+    async def run():
+        writer = DataWriter(flush_interval=0.01)
+        await writer.save([profile(1), profile(2)], path)
+        await writer.save([profile(2), profile(3)], path)
+        await writer.update(path, 'profile_url', profile(1).profile_url, {'connection_sent': True})
+        await writer.update(path, 'profile_url', profile(1).profile_url, {'message_sent': True})
+        await writer.close()
+
+    asyncio.run(run())
+
+    records = {record['profile_url']: record for record in stores[path].load()}
+    assert len(records) == 3
+    assert records[profile(1).profile_url]['connection_sent'] is True
+    assert records[profile(1).profile_url]['message_sent'] is True
+
+
+def test_failing_file_does_not_drop_others(tmp_path, stores):
+    good, bad = str(tmp_path / 'profiles.json'), str(tmp_path / 'bad.json')
+
+    async def run():
+        writer = DataWriter(flush_interval=0.01, max_retries=2)
+        await writer.save([profile(1)], good)
+        await writer.save([profile(2)], bad)
+        with pytest.raises(WriteError) as error:
+            await writer.flush()
+        await writer.flush()
+        await writer.close()
+        return error.value
+
+    error = asyncio.run(run())
+
+    assert list(error.failures) == [bad]
+    assert stores[bad].attempts == 3
+    assert len(stores[good].load()) == 1
+
+
+def test_close_retries_pending_failures(tmp_path, stores):
+    bad = str(tmp_path / 'bad.json')
+
+    async def run():
+        writer = DataWriter(flush_interval=10, max_retries=1)
+        await writer.save([profile(1)], bad)
+        await writer.close()
+        return writer
+
+    writer = asyncio.run(run())
+
+    assert stores[bad].attempts == 2
+    assert list(writer.failures) == [bad]
+
+
+def test_disabled_writer_raises_immediately(tmp_path, stores):
+    good, bad = str(tmp_path / 'profiles.json'), str(tmp_path / 'bad.json')
+
+    async def run():
+        writer = DataWriter(enabled=False)
+        await writer.save([profile(1)], good)
+        with pytest.raises(WriteError):
+            await writer.save([profile(2)], bad)
+
+    asyncio.run(run())
+
+    assert len(stores[good].load()) == 1
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from benchmarks.bench_parser import FixtureDriver, FixtureElement, RoundTripCounter
+from config import SELECTORS
+from html_parser import LinkedInHTMLParser
+from parser import LinkedInParser
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+def test_multi_line_text_matches_browser_inner_text():
+    html = (FIXTURES_DIR / 'companies_multiline.html').read_text(encoding='utf-8')
+
+    companies = LinkedInHTMLParser().parse_companies(html, 'ai')
+
+    assert [company.summary for company in companies] == [
+        'Neural Labs builds applied AI products for enterprise customers.\nHiring in Seville and Madrid.',
+        'Data platforms for retail.\n\nSince 2012.',
+    ]
+
+
+def test_offline_and_live_parsers_agree_on_multi_line_text():
+    html = (FIXTURES_DIR / 'companies_multiline.html').read_text(encoding='utf-8')
+    html_parser = LinkedInHTMLParser()
+    counter = RoundTripCounter()
+    cards = [FixtureElement(node, counter) for node in html_parser.get_cards(html, SELECTORS['search_results'])]
+    parser = LinkedInParser()
+
+    offline = [company.dict(exclude={'searched_at'}) for company in html_parser.parse_companies(html, 'ai')]
+    batch = parser.parse_companies_from_page(FixtureDriver(counter), cards, 'ai')
+    per_card = [parser.parse_company_from_search(card, 'ai') for card in cards]
+
+    assert [company.dict(exclude={'searched_at'}) for company in batch] == offline
+    assert [company.summary for company in per_card] == [company['summary'] for company in offline]
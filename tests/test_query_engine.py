@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+import data_writer
+import models
+import query_engine
+from data_writer import DataWriter
+from models import CompanyData, JobData
+from query_engine import QueryEngine, normalize_location, normalize_posted_date, parse_company_size
+from search_engine import EntityType
+from storage import JsonlEntityStore
+
+
+def job(n: int, **fields) -> JobData:
+    fields.setdefault('searched_at', '2026-03-10 12:00:00')
+    return JobData(job_id=str(n), job_url=f'https://www.linkedin.com/jobs/view/{n}/', title=f'Job {n}', **fields)
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    """Serve every entity type from a throwaway JSONL store"""
+    monkeypatch.setattr(models, 'DATA_FOLDER', str(tmp_path))
+    stores = {entity_type.value: JsonlEntityStore(entity_type.data_file.full_path) for entity_type in EntityType}
+    paths = {entity_type.data_file.full_path: entity_type.value for entity_type in EntityType}
+    for module in (query_engine, data_writer):
+        monkeypatch.setattr(module, 'get_entity_store', lambda filepath: stores[paths[filepath]])
+    return stores
+
+
+@pytest.fixture
+def engine(tmp_path, stores):
+    engine = QueryEngine(str(tmp_path / 'query_index.db'))
+    yield engine
+    engine.close()
+
+
+def test_normalizers():
+    assert normalize_location('Madrid, Community of Madrid, Spain (Hybrid)') == [
+        'madrid, community of madrid, spain', 'madrid', 'community of madrid', 'spain']
+    assert normalize_posted_date(None, '3 days ago', '2026-03-10 12:00:00') == '2026-03-07'
+    assert normalize_posted_date('2026-03-01T08:00:00', '3 days ago', None) == '2026-03-01'
+    assert parse_company_size('1K-5K employees') == (1_000, 5_000)
+    assert parse_company_size('10,001+ employees') == (10_001, None)
+
+
+def test_job_filters(engine, stores):
+    stores['jobs'].save([
+        job(1, company='Acme', location='Madrid, Spain', easy_apply=True, posted_time='1 day ago'),
+        job(2, company='Acme', location='Barcelona, Spain', posted_time='2 weeks ago'),
+        job(3, company='Globex', location='Madrid, Spain', easy_apply=True, posted_time='3 weeks ago'),
+    ])
+
+    assert [record['job_id'] for record in engine.jobs(location='Spain')] == ['1', '2', '3']
+    assert [record['job_id'] for record in engine.jobs(location='madrid', easy_apply=True)] == ['1', '3']
+    assert [record['job_id'] for record in engine.jobs(company='ACME', posted_after='2026-03-01')] == ['1']
+    assert [record['job_id'] for record in engine.jobs(limit=1)] == ['1']
+
+
+def test_company_size_filters(engine, stores):
+    stores['companies'].save([
+        CompanyData(company_url='https://www.linkedin.com/company/small/', industry='Software',
+                    company_size='11-50 employees'),
+        CompanyData(company_url='https://www.linkedin.com/company/big/', industry='Software',
+                    company_size='1K-5K employees'),
+    ])
+
+    urls = [record['company_url'] for record in engine.companies(min_size=500, industry='software')]
+    assert urls == ['https://www.linkedin.com/company/big/']
+
+
+def test_refresh_picks_up_upserts_and_updates(engine, stores):
+    store = stores['jobs']
+    store.save([job(1, location='Madrid, Spain'), job(2, location='Madrid, Spain')])
+
+    assert engine.refresh('jobs') is True
+    assert engine.refresh('jobs') is False
+
+    store.upsert([job(2, location='Lisbon, Portugal')])
+    store.update('job_id', '1', {'easy_apply': True})
+
+    assert [record['job_id'] for record in engine.jobs(location='madrid')] == ['1']
+    assert [record['job_id'] for record in engine.jobs(location='lisbon')] == ['2']
+    assert [record['job_id'] for record in engine.jobs(easy_apply=True)] == ['1']
+
+
+def test_refresh_drops_removed_records(engine, stores, tmp_path):
+    stores['jobs'].save([job(1), job(2)])
+    assert len(engine.jobs()) == 2
+
+    stores['jobs'] = JsonlEntityStore(str(tmp_path / 'jobs_rewritten.json'))
+    stores['jobs'].save([job(2)])
+
+    assert [record['job_id'] for record in engine.jobs()] == ['2']
+
+
+def test_writer_updates_the_index_without_a_rescan(engine, stores, monkeypatch):
+    monkeypatch.setattr(query_engine, '_engine', engine)
+    filepath = EntityType.JOBS.data_file.full_path
+    stores['jobs'].save([job(1, location='Madrid, Spain')])
+    assert len(engine.jobs()) == 1
+
+    async def write():
+        writer = DataWriter(enabled=False)
+        await writer.save([job(2, location='Lisbon, Portugal')], filepath)
+        await writer.update(filepath, 'job_id', '1', {'easy_apply': True})
+
+    asyncio.run(write())
+
+    def rescan(*args, **kwargs):
+        raise AssertionError("the store was rescanned")
+
+    monkeypatch.setattr(stores['jobs'], 'iter_records', rescan)
+    assert [record['job_id'] for record in engine.jobs(location='lisbon')] == ['2']
+    assert [record['job_id'] for record in engine.jobs(easy_apply=True)] == ['1']
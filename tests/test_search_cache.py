@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from search_cache import SearchResultCache
+
+RECORDS = [{'profile_url': 'https://www.linkedin.com/in/user1/', 'name': 'User 1'}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SearchResultCache(str(tmp_path / 'search_cache.db'), ttl=60)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_with_normalized_query(cache):
+    cache.put('people', 'Data  Engineer', 'Madrid', 2, RECORDS, complete=True)
+
+    assert cache.get('people', 'data engineer', 'MADRID', 2) == RECORDS
+    assert cache.get('people', 'data engineer', 'madrid', 3) is None
+    assert cache.get('companies', 'data engineer', 'madrid', 2) is None
+
+
+def test_incomplete_pages_only_serve_partial_lookups(cache):
+    cache.put('jobs', 'python', None, 1, RECORDS, complete=False)
+
+    assert cache.get('jobs', 'python', None, 1) == RECORDS
+    assert cache.get('jobs', 'python', None, 1, complete=True) is None
+
+
+def test_expired_pages_are_misses(cache, monkeypatch):
+    cache.put('people', 'python', None, 1, RECORDS, complete=True)
+
+    later = time.time() + 120
+    monkeypatch.setattr(time, 'time', lambda: later)
+
+    assert cache.get('people', 'python', None, 1) is None
+
+
+def test_least_recently_used_pages_are_evicted(tmp_path):
+    cache = SearchResultCache(str(tmp_path / 'search_cache.db'), ttl=60, max_bytes=150)
+    for page in (1, 2):
+        cache.put('people', 'python', None, page, RECORDS, complete=True)
+    cache.get('people', 'python', None, 1)
+
+    cache.put('people', 'python', None, 3, RECORDS, complete=True)
+
+    assert cache.get('people', 'python', None, 1) == RECORDS
+    assert cache.get('people', 'python', None, 2) is None
+    assert cache.get('people', 'python', None, 3) == RECORDS
+    cache.close()
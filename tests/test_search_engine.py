@@ -0,0 +1,171 @@
+import asyncio
+import random
+import re
+
+import pytest
+
+import search_engine
+from base.base_search_engine import RESULTS_STATE_SCRIPT
+from benchmarks.bench_parser import FIXTURES_DIR, FixtureDriver, FixtureElement, RoundTripCounter
+from driver_facade import AsyncDriver
+from html_parser import LinkedInHTMLParser
+from models import SearchCursor
+from search_cache import SearchResultCache
+from search_cursors import SearchCursorStore
+from search_engine import EntityType, LinkedInSearchEngine
+
+PAGES = ('people_current.html', 'people_legacy.html')
+JOB_PAGES = ('jobs_current.html', 'jobs_legacy.html')
+
+
+class PagedDriver(FixtureDriver):
+    """Serves one recorded people results page per search page; pages past the fixtures are empty"""
+
+    def __init__(self, pages: tuple[str, ...] = PAGES):
+        super().__init__(RoundTripCounter())
+        self.pages = pages
+        self.urls: list[str] = []
+        self.page = 0
+
+    def get(self, url: str) -> None:
+        self.urls.append(url)
+        if match := re.search(r'[?&]page=(\d+)', url):
+            self.page = int(match.group(1))
+        elif match := re.search(r'[?&]start=(\d+)', url):
+            self.page = int(match.group(1)) // search_engine.JOBS_PAGE_SIZE + 1
+        else:
+            self.page = 1
+
+    def find_elements(self, by: str, selector: str) -> list[FixtureElement]:
+        if not 1 <= self.page <= len(self.pages):
+            return []
+        html = (FIXTURES_DIR / self.pages[self.page - 1]).read_text(encoding='utf-8')
+        return [FixtureElement(node, self.counter) for node in LinkedInHTMLParser.get_cards(html, selector)]
+
+    def execute_script(self, script: str, *args):
+        if script == RESULTS_STATE_SCRIPT:
+            return max((len(self.find_elements(None, selector)) for selector in args[0]), default=0)
+        if len(args) == 2 and isinstance(args[1], dict):
+            return super().execute_script(script, *args)
+        return None
+
+
+class FakeAutomation:
+    def __init__(self, driver: PagedDriver):
+        self.driver = driver
+        self.browser = AsyncDriver(driver)
+        self.logged_in = True
+        self.saved: list = []
+
+    async def save_entities(self, entities, filepath) -> bool:
+        self.saved.extend(entities)
+        return True
+
+
+def make_engine(tmp_path, cache: SearchResultCache | None = None, fail_on_next_page: bool = False,
+                pages: tuple[str, ...] = PAGES):
+    driver = PagedDriver(pages)
+    engine = LinkedInSearchEngine(FakeAutomation(driver), cache=cache,
+                                  cursors=SearchCursorStore(str(tmp_path / 'search_cursors.json')))
+
+    async def go_to_next_page() -> bool:
+        if fail_on_next_page:
+            raise RuntimeError("browser crashed")
+        if driver.page >= len(pages):
+            return False
+        driver.page += 1
+        return True
+
+    engine._go_to_next_page = go_to_next_page
+    return engine, driver
+
+
+@pytest.fixture(autouse=True)
+def no_delays(monkeypatch):
+    monkeypatch.setattr(random, 'uniform', lambda a, b: 0)
+
+
+async def collect(engine, keywords: str = 'python', **kwargs) -> list[str]:
+    return [item.get_key_value() async for item in engine.iter_entities(EntityType.PEOPLE, keywords, None, 50, **kwargs)]
+
+
+def test_interrupted_search_resumes_after_last_completed_page(tmp_path):
+    first, _ = make_engine(tmp_path, fail_on_next_page=True)
+    first_keys = asyncio.run(collect(first, resume=True))
+
+    cursor = first.cursors.get('people', 'python', None)
+    assert cursor.page == 1
+    assert cursor.found == len(first_keys) > 0
+
+    second, driver = make_engine(tmp_path)
+    second_keys = asyncio.run(collect(second, resume=True))
+
+    assert '&page=2' in driver.urls[0]
+    assert second_keys and not set(second_keys) & set(first_keys)
+    assert second.cursors.get('people', 'python', None) is None
+
+
+def test_consumer_stopping_early_clears_cursor(tmp_path):
+    engine, _ = make_engine(tmp_path)
+    engine.cursors.save(SearchCursor(entity_type='people', keywords='python', page=1, found=3))
+
+    async def take_one():
+        results = engine.iter_entities(EntityType.PEOPLE, 'python', None, 50, resume=True)
+        async for _ in results:
+            break
+        await results.aclose()
+
+    asyncio.run(take_one())
+
+    assert engine.cursors.get('people', 'python', None) is None
+
+
+def test_cached_pages_are_served_without_the_browser(tmp_path):
+    cache = SearchResultCache(str(tmp_path / 'search_cache.db'))
+    first, _ = make_engine(tmp_path, cache=cache)
+    first_keys = asyncio.run(collect(first))
+
+    second, driver = make_engine(tmp_path, cache=cache)
+    second_keys = asyncio.run(collect(second))
+
+    assert second_keys == first_keys
+    assert all(f'&page={len(PAGES) + 1}' in url for url in driver.urls)
+    cache.close()
+
+
+def test_cursor_store_normalizes_queries(tmp_path):
+    cursors = SearchCursorStore(str(tmp_path / 'search_cursors.json'))
+    cursors.save(SearchCursor(entity_type='jobs', keywords='Data  Engineer', location='Madrid', page=2,
+                              found=40, seen_ids=['1', '2']))
+
+    cursor = cursors.get('jobs', 'data engineer', 'MADRID')
+    assert (cursor.page, cursor.found, cursor.seen_ids) == (2, 40, ['1', '2'])
+
+    cursors.delete('jobs', 'data engineer', 'madrid')
+    assert cursors.get('jobs', 'Data Engineer', 'Madrid') is None
+
+
+def test_jobs_resume_url_points_at_results_offset():
+    url = search_engine.LinkedInSearchEngine._search_url(EntityType.JOBS, 'python', 'Madrid', page=3)
+
+    assert f'start={2 * search_engine.JOBS_PAGE_SIZE}' in url
+
+
+def test_resumed_jobs_page_is_cached_whole(tmp_path):
+    cache = SearchResultCache(str(tmp_path / 'search_cache.db'))
+    engine, _ = make_engine(tmp_path, cache=cache, pages=JOB_PAGES)
+
+    async def no_more_jobs(cards):
+        return None
+
+    engine._load_more_jobs = no_more_jobs
+    html = (FIXTURES_DIR / JOB_PAGES[0]).read_text(encoding='utf-8')
+    page_ids = [job.job_id for job in LinkedInHTMLParser().parse_jobs(html, 'python', None)]
+    engine.cursors.save(SearchCursor(entity_type='jobs', keywords='python', page=0, found=1, seen_ids=page_ids[:1]))
+
+    async def run() -> list[str]:
+        return [job.job_id async for job in engine.iter_jobs('python', max_results=50, resume=True)]
+
+    assert asyncio.run(run()) == page_ids[1:]
+    assert [record['job_id'] for record in cache.get('jobs', 'python', None, 1, complete=True)] == page_ids
+    cache.close()
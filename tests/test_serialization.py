@@ -0,0 +1,23 @@
+import json
+import logging
+
+import serialization
+from serialization import get_codec, get_line_codec
+
+
+def test_default_codec_writes_indented_json():
+    records = [{'name': 'José', 'connection_sent': True}]
+
+    assert get_codec().encode(records) == json.dumps(records, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def test_line_codec_works_without_optional_libraries(monkeypatch, caplog):
+    monkeypatch.setattr(serialization, 'orjson', None)
+    monkeypatch.setattr(serialization, '_codecs', {})
+
+    with caplog.at_level(logging.WARNING):
+        codec = get_line_codec()
+
+    assert codec.json_lines
+    assert b'\n' not in codec.encode({'a': [1, 2]})
+    assert not caplog.records
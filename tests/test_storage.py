@@ -0,0 +1,170 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from models import ProfileData
+from storage import JsonEntityStore, JsonlEntityStore, SqliteEntityStore, ShardedEntityStore
+
+BACKENDS = ('json', 'jsonl', 'sqlite', 'sharded')
+
+
+def make_store(backend: str, tmp_path):
+    filepath = str(tmp_path / 'profiles.json')
+    if backend == 'json':
+        return JsonEntityStore(filepath)
+    if backend == 'jsonl':
+        return JsonlEntityStore(filepath)
+    if backend == 'sqlite':
+        return SqliteEntityStore(filepath, db_path=str(tmp_path / 'linkedin.db'))
+    return ShardedEntityStore(filepath, max_records=2)
+
+
+def profile(n: int, **fields) -> ProfileData:
+    fields.setdefault('searched_at', '2026-01-01 10:00:00')
+    return ProfileData(profile_url=f'https://www.linkedin.com/in/user{n}/', name=f'User {n}', **fields)
+
+
+def by_key(records: list[dict]) -> dict[str, dict]:
+    return {record['profile_url']: record for record in records}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def store(backend, tmp_path):
+    return make_store(backend, tmp_path)
+
+
+def test_save_round_trip(store):
+    assert store.save([profile(1, headline='Engineer'), profile(2), profile(3)]) == 3
+
+    records = by_key(store.load())
+    assert len(records) == 3
+    assert records[profile(1).profile_url]['headline'] == 'Engineer'
+    assert store.keys('profile_url') == {profile(n).profile_url for n in (1, 2, 3)}
+
+
+def test_save_keeps_known_records(store):
+    store.save([profile(1, headline='Engineer')])
+
+    added = store.save_new([profile(1, headline='Changed'), profile(2)])
+
+    assert [entity.profile_url for entity in added] == [profile(2).profile_url]
+    assert by_key(store.load())[profile(1).profile_url]['headline'] == 'Engineer'
+
+
+def test_upsert_merges_into_existing(store):
+    store.save([profile(1, headline='Engineer', skills='Python')])
+
+    assert store.upsert([profile(1, headline='Manager'), profile(2)]) == 1
+
+    records = by_key(store.load())
+    assert len(records) == 2
+    assert records[profile(1).profile_url]['headline'] == 'Manager'
+    assert records[profile(1).profile_url]['skills'] == 'Python'
+
+
+def test_partial_upsert_keeps_unset_fields(store):
+    store.save([profile(1, headline='Engineer')])
+    store.update('profile_url', profile(1).profile_url, {'connection_sent': True})
+
+    store.upsert([ProfileData(profile_url=profile(1).profile_url, name='Renamed')], partial=True)
+
+    record = by_key(store.load())[profile(1).profile_url]
+    assert record['name'] == 'Renamed'
+    assert record['headline'] == 'Engineer'
+    assert record['connection_sent'] is True
+
+
+def test_update_patches_and_creates(store):
+    store.save([profile(1)])
+
+    store.update('profile_url', profile(1).profile_url, {'message_sent': True})
+    store.update('profile_url', profile(9).profile_url, {'connection_sent': True})
+
+    records = by_key(store.load())
+    assert records[profile(1).profile_url]['message_sent'] is True
+    assert records[profile(1).profile_url]['name'] == 'User 1'
+    assert records[profile(9).profile_url]['connection_sent'] is True
+
+
+def test_iter_records_matches_load(store):
+    store.save([profile(n) for n in range(5)])
+    store.upsert([profile(2, headline='Updated')])
+    store.update('profile_url', profile(3).profile_url, {'message_sent': True})
+
+    assert by_key(store.iter_records(batch_size=2)) == by_key(store.load())
+
+
+def test_reopened_store_reads_written_data(store, backend, tmp_path):
+    store.save([profile(1), profile(2)])
+    store.update('profile_url', profile(2).profile_url, {'message_sent': True})
+
+    reopened = make_store(backend, tmp_path)
+
+    records = by_key(reopened.load())
+    assert set(records) == {profile(1).profile_url, profile(2).profile_url}
+    assert records[profile(2).profile_url]['message_sent'] is True
+
+
+@pytest.mark.parametrize('backend', ('jsonl', 'sqlite', 'sharded'))
+def test_legacy_json_array_is_migrated(backend, tmp_path):
+    legacy = [profile(1, headline='Engineer').dict(), profile(2).dict()]
+    (tmp_path / 'profiles.json').write_text(json.dumps(legacy))
+
+    store = make_store(backend, tmp_path)
+
+    records = by_key(store.load())
+    assert set(records) == {profile(1).profile_url, profile(2).profile_url}
+    assert records[profile(1).profile_url]['headline'] == 'Engineer'
+    assert store.save([profile(1), profile(3)]) == 1
+
+
+def test_jsonl_compact_keeps_merged_records(tmp_path):
+    store = JsonlEntityStore(str(tmp_path / 'profiles.json'))
+    store.save([profile(1), profile(2)])
+    store.upsert([profile(1, headline='Manager')])
+    store.update('profile_url', profile(2).profile_url, {'message_sent': True})
+    before = by_key(store.load())
+
+    store.compact()
+
+    assert by_key(store.load()) == before
+    with open(store.filepath, 'rb') as f:
+        assert len(f.readlines()) == 2
+
+
+def test_json_patch_journal_is_folded(tmp_path):
+    store = JsonEntityStore(str(tmp_path / 'profiles.json'), max_patches=2)
+    store.save([profile(1)])
+    for n in range(3):
+        store.update('profile_url', profile(1).profile_url, {'about': f'v{n}'})
+
+    assert not os.path.exists(store.journal_path)
+    assert by_key(store.load())[profile(1).profile_url]['about'] == 'v2'
+
+
+def test_sharded_segments_are_bounded(tmp_path):
+    store = ShardedEntityStore(str(tmp_path / 'profiles.json'), max_records=2)
+    store.save([profile(n) for n in range(5)])
+
+    segments = store.segments()
+    assert sum(entry['count'] for entry in segments) == 5
+    assert max(entry['count'] for entry in segments) <= 2
+    assert store.drop_before('2027-01-01') == 5
+    assert store.load() == []
+
+
+def test_sqlite_batches_stay_within_the_parameter_limit(tmp_path):
+    store = make_store('sqlite', tmp_path)
+    store._connect().setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    store.save([profile(n) for n in range(1500)])
+
+    added = store.save_new([profile(n) for n in range(1501)])
+
+    assert [entity.profile_url for entity in added] == [profile(1500).profile_url]